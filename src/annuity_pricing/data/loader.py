@@ -327,6 +327,9 @@ def compute_sha256(file_path: Path) -> str:
     """
     Compute SHA-256 hash of a file.
 
+    The file is always read in full; integrity checks must not trust
+    file metadata to decide whether contents changed.
+
     Parameters
     ----------
     file_path : Path
@@ -347,12 +350,13 @@ def compute_sha256(file_path: Path) -> str:
             f"CRITICAL: File not found: {file_path}. Expected WINK data at this location."
         )
 
-    sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             sha256_hash.update(chunk)
-
-    return sha256_hash.hexdigest()
+        return sha256_hash.hexdigest()
 
 
 def verify_checksum(file_path: Path, expected_checksum: str) -> None:
@@ -388,6 +392,7 @@ def load_wink_data(
     columns: list[str] | None = None,
     use_synthetic: bool | None = None,
     n_synthetic: int = 1000,
+    checksum: str | None = None,
 ) -> pd.DataFrame:
     """
     Load WINK parquet data with optional checksum verification.
@@ -408,6 +413,8 @@ def load_wink_data(
         Library default is False (strict mode).
     n_synthetic : int, default 1000
         Number of synthetic products to generate if use_synthetic=True.
+    checksum : str, optional
+        Expected SHA-256 of the file. Defaults to SETTINGS.data.wink_checksum
 
     Returns
     -------
@@ -476,7 +483,7 @@ def load_wink_data(
 
     # Verify checksum if requested
     if verify:
-        verify_checksum(file_path, SETTINGS.data.wink_checksum)
+        verify_checksum(file_path, checksum or SETTINGS.data.wink_checksum)
 
     # Load data
     try:
@@ -503,6 +510,7 @@ def load_wink_by_product(
     status: str = "current",
     verify: bool = True,
     use_synthetic: bool | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Load WINK data filtered by product group and status.
@@ -517,6 +525,9 @@ def load_wink_by_product(
         Whether to verify checksum
     use_synthetic : bool, optional
         If True, return synthetic data. See load_wink_data for details.
+    columns : list[str], optional
+        Columns to read from the parquet file; productGroup and status are
+        always included for filtering. None loads all columns.
 
     Returns
     -------
@@ -544,7 +555,10 @@ def load_wink_by_product(
     if status not in valid_statuses:
         raise ValueError(f"CRITICAL: Invalid status '{status}'. Must be one of: {valid_statuses}")
 
-    df = load_wink_data(verify=verify, use_synthetic=use_synthetic)
+    if columns is not None:
+        columns = list(dict.fromkeys(["productGroup", "status", *columns]))
+
+    df = load_wink_data(verify=verify, use_synthetic=use_synthetic, columns=columns)
 
     # Filter
     mask = (df["productGroup"] == product_group) & (df["status"] == status)
@@ -19,6 +19,7 @@ from annuity_pricing.options.payoffs.base import (
     is_in_the_money,
 )
 from annuity_pricing.options.payoffs.fia import (
+    FIA_FLOOR,
     CappedCallPayoff,
     MonthlyAveragePayoff,
     ParticipationPayoff,
@@ -46,6 +47,7 @@ __all__ = [
     "calculate_moneyness",
     "is_in_the_money",
     # FIA payoffs
+    "FIA_FLOOR",
     "CappedCallPayoff",
     "MonthlyAveragePayoff",
     "ParticipationPayoff",
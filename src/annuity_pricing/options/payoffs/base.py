@@ -210,6 +210,49 @@ class BasePayoff(ABC):
             f"Use calculate() in a loop or check supports_vectorized() first."
         )
 
+    def supports_path_vectorized(self) -> bool:
+        """
+        Check if this payoff supports vectorized calculation over full paths.
+
+        Path-dependent payoffs (e.g., monthly averaging) that can be
+        evaluated on a whole path matrix at once override this to return
+        True, so Monte Carlo avoids building an IndexPath per path.
+
+        Returns
+        -------
+        bool
+            True if calculate_paths_vectorized() is available
+        """
+        return False
+
+    def calculate_paths_vectorized(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Calculate payoffs for a matrix of simulated index paths.
+
+        Must produce the same results as calling calculate_from_path()
+        on each row.
+
+        Parameters
+        ----------
+        paths : np.ndarray
+            Index levels, shape (n_paths, n_steps + 1); column 0 is the
+            initial level
+
+        Returns
+        -------
+        np.ndarray
+            Array of credited returns, shape (n_paths,)
+
+        Raises
+        ------
+        NotImplementedError
+            If path-vectorized calculation not implemented for this payoff
+        """
+        raise NotImplementedError(
+            f"calculate_paths_vectorized() not implemented for {type(self).__name__}. "
+            f"Use calculate_from_path() in a loop or check supports_path_vectorized() first."
+        )
+
 
 class VanillaOption:
     """
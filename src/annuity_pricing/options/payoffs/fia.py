@@ -21,6 +21,15 @@ from annuity_pricing.options.payoffs.base import (
     IndexPath,
     PayoffResult,
 )
+from annuity_pricing.options.payoffs.kernels import (
+    cap_payoff_vec,
+    participation_payoff_vec,
+    spread_payoff_vec,
+    trigger_payoff_vec,
+)
+
+# [T1] Contractual FIA floor: credited interest is never negative
+FIA_FLOOR: float = 0.0
 
 
 class CappedCallPayoff(BasePayoff):
@@ -44,7 +53,7 @@ class CappedCallPayoff(BasePayoff):
     0.10  # Capped at 10%
     """
 
-    def __init__(self, cap_rate: float, floor_rate: float = 0.0):
+    def __init__(self, cap_rate: float, floor_rate: float = FIA_FLOOR):
         if cap_rate <= 0:
             raise ValueError(f"CRITICAL: cap_rate must be > 0, got {cap_rate}")
         if floor_rate > cap_rate:
@@ -116,8 +125,7 @@ class CappedCallPayoff(BasePayoff):
         np.ndarray
             Array of credited returns
         """
-        # np.clip handles both floor and cap efficiently
-        return np.clip(index_returns, self.floor_rate, self.cap_rate)
+        return cap_payoff_vec(index_returns, self.cap_rate, self.floor_rate)
 
 
 class ParticipationPayoff(BasePayoff):
@@ -146,7 +154,7 @@ class ParticipationPayoff(BasePayoff):
     def __init__(
         self,
         participation_rate: float,
-        floor_rate: float = 0.0,
+        floor_rate: float = FIA_FLOOR,
         cap_rate: float | None = None,
     ):
         if participation_rate <= 0:
@@ -226,17 +234,10 @@ class ParticipationPayoff(BasePayoff):
         np.ndarray
             Array of credited returns
         """
-        # Apply participation to positive returns only
-        credited = np.where(index_returns > 0, self.participation_rate * index_returns, 0.0)
-
-        # Apply cap if specified
-        if self.cap_rate is not None:
-            credited = np.minimum(credited, self.cap_rate)
-
-        # Apply floor
-        credited = np.maximum(credited, self.floor_rate)
-
-        return credited
+        cap = np.inf if self.cap_rate is None else self.cap_rate
+        return participation_payoff_vec(
+            index_returns, self.participation_rate, cap, self.floor_rate
+        )
 
 
 class SpreadPayoff(BasePayoff):
@@ -265,7 +266,7 @@ class SpreadPayoff(BasePayoff):
     def __init__(
         self,
         spread_rate: float,
-        floor_rate: float = 0.0,
+        floor_rate: float = FIA_FLOOR,
         cap_rate: float | None = None,
     ):
         if spread_rate < 0:
@@ -342,17 +343,8 @@ class SpreadPayoff(BasePayoff):
         np.ndarray
             Array of credited returns
         """
-        # Spread only applies to positive returns
-        credited = np.where(index_returns > 0, index_returns - self.spread_rate, 0.0)
-
-        # Apply cap if specified
-        if self.cap_rate is not None:
-            credited = np.minimum(credited, self.cap_rate)
-
-        # Apply floor
-        credited = np.maximum(credited, self.floor_rate)
-
-        return credited
+        cap = np.inf if self.cap_rate is None else self.cap_rate
+        return spread_payoff_vec(index_returns, self.spread_rate, cap, self.floor_rate)
 
 
 class TriggerPayoff(BasePayoff):
@@ -382,7 +374,7 @@ class TriggerPayoff(BasePayoff):
         self,
         trigger_rate: float,
         trigger_threshold: float = 0.0,
-        floor_rate: float = 0.0,
+        floor_rate: float = FIA_FLOOR,
     ):
         if trigger_rate < 0:
             raise ValueError(f"CRITICAL: trigger_rate must be >= 0, got {trigger_rate}")
@@ -449,7 +441,9 @@ class TriggerPayoff(BasePayoff):
         np.ndarray
             Array of credited returns
         """
-        return np.where(index_returns >= self.trigger_threshold, self.trigger_rate, self.floor_rate)
+        return trigger_payoff_vec(
+            index_returns, self.trigger_rate, self.trigger_threshold, self.floor_rate
+        )
 
 
 class MonthlyAveragePayoff(BasePayoff):
@@ -470,9 +464,13 @@ class MonthlyAveragePayoff(BasePayoff):
         Minimum return floor
     """
 
-    def __init__(self, cap_rate: float, floor_rate: float = 0.0):
+    def __init__(self, cap_rate: float, floor_rate: float = FIA_FLOOR):
         if cap_rate <= 0:
             raise ValueError(f"CRITICAL: cap_rate must be > 0, got {cap_rate}")
+        if floor_rate > cap_rate:
+            raise ValueError(
+                f"CRITICAL: floor_rate ({floor_rate}) cannot exceed cap_rate ({cap_rate})"
+            )
 
         self.cap_rate = cap_rate
         self.floor_rate = floor_rate
@@ -481,6 +479,10 @@ class MonthlyAveragePayoff(BasePayoff):
         """Monthly averaging is path-dependent; vectorized not supported."""
         return False
 
+    def supports_path_vectorized(self) -> bool:
+        """Monthly averaging can be evaluated over a whole path matrix."""
+        return True
+
     def calculate(self, index_return: float) -> PayoffResult:
         """
         Calculate using simple return (for point-to-point fallback).
@@ -530,6 +532,27 @@ class MonthlyAveragePayoff(BasePayoff):
 
         return self.calculate(avg_return)
 
+    def calculate_paths_vectorized(self, paths: np.ndarray) -> np.ndarray:
+        """
+        Vectorized monthly averaging over a matrix of paths.
+
+        [T1] Payoff = max(floor, min(cap, mean(path) / path[0] - 1))
+
+        Parameters
+        ----------
+        paths : np.ndarray
+            Index levels, shape (n_paths, n_steps + 1)
+
+        Returns
+        -------
+        np.ndarray
+            Array of credited returns, shape (n_paths,)
+        """
+        paths = np.asarray(paths, dtype=np.float64)
+        initial = paths[:, 0]
+        avg_returns = (paths.mean(axis=1) - initial) / initial
+        return cap_payoff_vec(avg_returns, self.cap_rate, self.floor_rate)
+
 
 def create_fia_payoff(
     method: str,
@@ -537,7 +560,7 @@ def create_fia_payoff(
     participation_rate: float | None = None,
     spread_rate: float | None = None,
     trigger_rate: float | None = None,
-    floor_rate: float = 0.0,
+    floor_rate: float = FIA_FLOOR,
 ) -> BasePayoff:
     """
     Factory function to create FIA payoff from parameters.
@@ -0,0 +1,294 @@
+"""
+Compiled crediting payoff kernels.
+
+Scalar and array kernels for the RILA protection mechanisms and the FIA
+crediting methods, written branch-free (both sides computed, then
+selected) so they vectorize across Monte Carlo paths whose return signs
+are unpredictable.
+
+- buffer_payoff / buffer_payoff_vec: Buffer absorbs the FIRST X% of losses
+- floor_payoff / floor_payoff_vec: Floor limits the MAXIMUM loss to X%
+- cap_payoff / cap_payoff_vec: Point-to-point return clamped to [floor, cap]
+- participation_payoff / participation_payoff_vec: Participation x gain
+- spread_payoff / spread_payoff_vec: Gain minus spread
+- trigger_payoff / trigger_payoff_vec: Fixed rate once a threshold is met
+
+RILA protection levels are positive decimals (0.10 = 10% buffer / -10%
+floor), matching RILAProduct.buffer_rate. FIA kernels take the crediting
+floor explicitly (0.0 for principal protection) and np.inf for an
+uncapped method. With Numba installed the scalar kernels are
+JIT-compiled (cached on disk) and the array kernels are NumPy ufuncs.
+Without Numba the array kernels fall back to plain NumPy.
+
+See: docs/knowledge/domain/buffer_floor.md
+See: docs/knowledge/domain/crediting_methods.md
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
+    """
+    Credited return under a buffer with a cap.
+
+    [T1] r >= 0: min(r, cap); r < 0: min(r + buffer, 0)
+
+    Parameters
+    ----------
+    index_return : float
+        Raw index return (decimal)
+    buffer : float
+        Buffer level (decimal, e.g., 0.10 = 10% buffer)
+    cap : float
+        Cap rate (decimal); pass inf for uncapped
+
+    Returns
+    -------
+    float
+        Credited return
+    """
+    upside = min(index_return, cap)
+    downside = min(index_return + buffer, 0.0)
+    return upside if index_return >= 0.0 else downside
+
+
+def _floor_payoff(index_return: float, floor: float, cap: float) -> float:
+    """
+    Credited return under a floor with a cap.
+
+    [T1] r >= 0: min(r, cap); r < 0: max(r, -floor)
+
+    Parameters
+    ----------
+    index_return : float
+        Raw index return (decimal)
+    floor : float
+        Maximum loss (positive decimal, e.g., 0.10 = -10% floor)
+    cap : float
+        Cap rate (decimal); pass inf for uncapped
+
+    Returns
+    -------
+    float
+        Credited return
+    """
+    upside = min(index_return, cap)
+    downside = max(index_return, -floor)
+    return upside if index_return >= 0.0 else downside
+
+
+def _cap_payoff(index_return: float, cap: float, floor: float) -> float:
+    """
+    Credited return under a cap with a floor.
+
+    [T1] max(floor, min(r, cap)), floor <= cap
+
+    Parameters
+    ----------
+    index_return : float
+        Raw index return (decimal)
+    cap : float
+        Cap rate (decimal)
+    floor : float
+        Minimum credited return (0.0 for principal protection)
+
+    Returns
+    -------
+    float
+        Credited return
+    """
+    return min(max(index_return, floor), cap)
+
+
+def _participation_payoff(
+    index_return: float, participation: float, cap: float, floor: float
+) -> float:
+    """
+    Credited return under a participation rate.
+
+    [T1] r > 0: max(floor, min(participation * r, cap)); r <= 0: max(floor, 0)
+
+    Parameters
+    ----------
+    index_return : float
+        Raw index return (decimal)
+    participation : float
+        Participation rate (decimal, e.g., 0.80 = 80%)
+    cap : float
+        Cap rate (decimal); pass inf for uncapped
+    floor : float
+        Minimum credited return (0.0 for principal protection)
+
+    Returns
+    -------
+    float
+        Credited return
+    """
+    upside = participation * index_return
+    credited = upside if index_return > 0.0 else 0.0
+    return max(min(credited, cap), floor)
+
+
+def _spread_payoff(index_return: float, spread: float, cap: float, floor: float) -> float:
+    """
+    Credited return under a spread (margin).
+
+    [T1] r > 0: max(floor, min(r - spread, cap)); r <= 0: max(floor, 0)
+
+    Parameters
+    ----------
+    index_return : float
+        Raw index return (decimal)
+    spread : float
+        Spread deducted from positive returns (decimal)
+    cap : float
+        Cap rate (decimal); pass inf for uncapped
+    floor : float
+        Minimum credited return (0.0 for principal protection)
+
+    Returns
+    -------
+    float
+        Credited return
+    """
+    upside = index_return - spread
+    credited = upside if index_return > 0.0 else 0.0
+    return max(min(credited, cap), floor)
+
+
+def _trigger_payoff(
+    index_return: float, trigger_rate: float, threshold: float, floor: float
+) -> float:
+    """
+    Credited return under a performance trigger.
+
+    [T1] r >= threshold: trigger_rate; otherwise floor
+
+    Parameters
+    ----------
+    index_return : float
+        Raw index return (decimal)
+    trigger_rate : float
+        Fixed return credited when the trigger is met (decimal)
+    threshold : float
+        Minimum return needed to trigger
+    floor : float
+        Return credited when the trigger is not met
+
+    Returns
+    -------
+    float
+        Credited return
+    """
+    return trigger_rate if index_return >= threshold else floor
+
+
+if NUMBA_AVAILABLE:
+    buffer_payoff: Callable[[float, float, float], float] = njit(cache=True)(_buffer_payoff)
+    floor_payoff: Callable[[float, float, float], float] = njit(cache=True)(_floor_payoff)
+
+    @vectorize(["float64(float64, float64, float64)"], cache=True)
+    def buffer_payoff_vec(index_return: float, buffer: float, cap: float) -> float:
+        """Element-wise buffer payoff over arrays of returns (ufunc)."""
+        return buffer_payoff(index_return, buffer, cap)
+
+    @vectorize(["float64(float64, float64, float64)"], cache=True)
+    def floor_payoff_vec(index_return: float, floor: float, cap: float) -> float:
+        """Element-wise floor payoff over arrays of returns (ufunc)."""
+        return floor_payoff(index_return, floor, cap)
+
+    cap_payoff: Callable[[float, float, float], float] = njit(cache=True)(_cap_payoff)
+    participation_payoff: Callable[[float, float, float, float], float] = njit(cache=True)(
+        _participation_payoff
+    )
+    spread_payoff: Callable[[float, float, float, float], float] = njit(cache=True)(_spread_payoff)
+    trigger_payoff: Callable[[float, float, float, float], float] = njit(cache=True)(
+        _trigger_payoff
+    )
+
+    @vectorize(["float64(float64, float64, float64)"], cache=True)
+    def cap_payoff_vec(index_return: float, cap: float, floor: float) -> float:
+        """Element-wise cap payoff over arrays of returns (ufunc)."""
+        return cap_payoff(index_return, cap, floor)
+
+    @vectorize(["float64(float64, float64, float64, float64)"], cache=True)
+    def participation_payoff_vec(
+        index_return: float, participation: float, cap: float, floor: float
+    ) -> float:
+        """Element-wise participation payoff over arrays of returns (ufunc)."""
+        return participation_payoff(index_return, participation, cap, floor)
+
+    @vectorize(["float64(float64, float64, float64, float64)"], cache=True)
+    def spread_payoff_vec(index_return: float, spread: float, cap: float, floor: float) -> float:
+        """Element-wise spread payoff over arrays of returns (ufunc)."""
+        return spread_payoff(index_return, spread, cap, floor)
+
+    @vectorize(["float64(float64, float64, float64, float64)"], cache=True)
+    def trigger_payoff_vec(
+        index_return: float, trigger_rate: float, threshold: float, floor: float
+    ) -> float:
+        """Element-wise trigger payoff over arrays of returns (ufunc)."""
+        return trigger_payoff(index_return, trigger_rate, threshold, floor)
+
+else:
+    buffer_payoff = _buffer_payoff
+    floor_payoff = _floor_payoff
+    cap_payoff = _cap_payoff
+    participation_payoff = _participation_payoff
+    spread_payoff = _spread_payoff
+    trigger_payoff = _trigger_payoff
+
+    def buffer_payoff_vec(index_return: np.ndarray, buffer: float, cap: float) -> np.ndarray:
+        """Element-wise buffer payoff over arrays of returns."""
+        index_return = np.asarray(index_return, dtype=np.float64)
+        return np.where(
+            index_return >= 0.0,
+            np.minimum(index_return, cap),
+            np.minimum(index_return + buffer, 0.0),
+        )
+
+    def floor_payoff_vec(index_return: np.ndarray, floor: float, cap: float) -> np.ndarray:
+        """Element-wise floor payoff over arrays of returns."""
+        index_return = np.asarray(index_return, dtype=np.float64)
+        return np.where(
+            index_return >= 0.0,
+            np.minimum(index_return, cap),
+            np.maximum(index_return, -floor),
+        )
+
+    def cap_payoff_vec(index_return: np.ndarray, cap: float, floor: float) -> np.ndarray:
+        """Element-wise cap payoff over arrays of returns."""
+        index_return = np.asarray(index_return, dtype=np.float64)
+        return np.minimum(np.maximum(index_return, floor), cap)
+
+    def participation_payoff_vec(
+        index_return: np.ndarray, participation: float, cap: float, floor: float
+    ) -> np.ndarray:
+        """Element-wise participation payoff over arrays of returns."""
+        index_return = np.asarray(index_return, dtype=np.float64)
+        credited = np.where(index_return > 0.0, participation * index_return, 0.0)
+        return np.maximum(np.minimum(credited, cap), floor)
+
+    def spread_payoff_vec(
+        index_return: np.ndarray, spread: float, cap: float, floor: float
+    ) -> np.ndarray:
+        """Element-wise spread payoff over arrays of returns."""
+        index_return = np.asarray(index_return, dtype=np.float64)
+        credited = np.where(index_return > 0.0, index_return - spread, 0.0)
+        return np.maximum(np.minimum(credited, cap), floor)
+
+    def trigger_payoff_vec(
+        index_return: np.ndarray, trigger_rate: float, threshold: float, floor: float
+    ) -> np.ndarray:
+        """Element-wise trigger payoff over arrays of returns."""
+        index_return = np.asarray(index_return, dtype=np.float64)
+        return np.where(index_return >= threshold, trigger_rate, floor)
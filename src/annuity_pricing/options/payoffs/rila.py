@@ -21,6 +21,7 @@ from annuity_pricing.options.payoffs.base import (
     IndexPath,
     PayoffResult,
 )
+from annuity_pricing.options.payoffs.kernels import buffer_payoff_vec, floor_payoff_vec
 
 
 class BufferPayoff(BasePayoff):
@@ -157,17 +158,9 @@ class BufferPayoff(BasePayoff):
         np.ndarray
             Array of credited returns
         """
-        # Start with index returns
-        credited = index_returns.copy()
-
-        # For negative returns: add buffer, cap at 0
-        negative_mask = index_returns < 0
-        credited[negative_mask] = np.minimum(0.0, index_returns[negative_mask] + self.buffer_rate)
-
-        # Apply cap on positive returns
-        if self.cap_rate is not None:
-            positive_mask = index_returns >= 0
-            credited[positive_mask] = np.minimum(credited[positive_mask], self.cap_rate)
+        # Negative returns: add buffer, cap at 0; positive returns: apply cap
+        cap = np.inf if self.cap_rate is None else self.cap_rate
+        credited = buffer_payoff_vec(index_returns, self.buffer_rate, cap)
 
         # Apply absolute floor if specified
         if self.floor_rate is not None:
@@ -298,14 +291,9 @@ class FloorPayoff(BasePayoff):
         np.ndarray
             Array of credited returns
         """
-        # Apply floor protection
-        credited = np.maximum(index_returns, self.floor_rate)
-
-        # Apply cap if specified
-        if self.cap_rate is not None:
-            credited = np.minimum(credited, self.cap_rate)
-
-        return credited
+        # Floor protection on losses, cap (if specified) on gains
+        cap = np.inf if self.cap_rate is None else self.cap_rate
+        return floor_payoff_vec(index_returns, -self.floor_rate, cap)
 
 
 class BufferWithFloorPayoff(BasePayoff):
@@ -16,11 +16,20 @@ References
 from dataclasses import dataclass
 
 import numpy as np
-from scipy import stats
+from scipy.special import ndtr
 
 from annuity_pricing.config.tolerances import PUT_CALL_PARITY_TOLERANCE
 from annuity_pricing.options.payoffs.base import OptionType
 
+# Standard normal CDF is scipy.special.ndtr, the ufunc behind stats.norm.cdf;
+# calling it directly skips the distribution framework's per-call overhead.
+_SQRT_2PI = np.sqrt(2.0 * np.pi)
+
+
+def _norm_pdf(x: float) -> float:
+    """Standard normal density (same formula as stats.norm.pdf)."""
+    return np.exp(-(x**2) / 2.0) / _SQRT_2PI
+
 
 @dataclass(frozen=True)
 class BSResult:
@@ -168,9 +177,9 @@ def black_scholes_call(
 
     d1, d2 = _calculate_d1_d2(spot, strike, rate, dividend, volatility, time_to_expiry)
 
-    call_price = spot * np.exp(-dividend * time_to_expiry) * stats.norm.cdf(d1) - strike * np.exp(
+    call_price = spot * np.exp(-dividend * time_to_expiry) * ndtr(d1) - strike * np.exp(
         -rate * time_to_expiry
-    ) * stats.norm.cdf(d2)
+    ) * ndtr(d2)
 
     return float(call_price)
 
@@ -240,9 +249,9 @@ def black_scholes_put(
 
     d1, d2 = _calculate_d1_d2(spot, strike, rate, dividend, volatility, time_to_expiry)
 
-    put_price = strike * np.exp(-rate * time_to_expiry) * stats.norm.cdf(-d2) - spot * np.exp(
+    put_price = strike * np.exp(-rate * time_to_expiry) * ndtr(-d2) - spot * np.exp(
         -dividend * time_to_expiry
-    ) * stats.norm.cdf(-d1)
+    ) * ndtr(-d1)
 
     return float(put_price)
 
@@ -357,11 +366,11 @@ def black_scholes_greeks(
     exp_rate = np.exp(-rate * time_to_expiry)
 
     # Standard normal PDF and CDF values
-    n_d1 = stats.norm.pdf(d1)
-    N_d1 = stats.norm.cdf(d1)
-    N_d2 = stats.norm.cdf(d2)
-    N_neg_d1 = stats.norm.cdf(-d1)
-    N_neg_d2 = stats.norm.cdf(-d2)
+    n_d1 = _norm_pdf(d1)
+    N_d1 = ndtr(d1)
+    N_d2 = ndtr(d2)
+    N_neg_d1 = ndtr(-d1)
+    N_neg_d2 = ndtr(-d2)
 
     # Price
     if option_type == OptionType.CALL:
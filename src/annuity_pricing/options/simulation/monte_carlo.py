@@ -215,10 +215,14 @@ class MonteCarloEngine:
 
             return self._compute_result(params, payoffs)
 
-        # Fallback: full path simulation for path-dependent payoffs
+        # Full path simulation for path-dependent payoffs
         path_result = generate_gbm_paths(params, self.n_paths, n_steps, self.seed, self.antithetic)
 
-        # Calculate payoffs for each path
+        if payoff.supports_path_vectorized():
+            credited_returns = payoff.calculate_paths_vectorized(path_result.paths)
+            return self._compute_result(params, params.spot * credited_returns)
+
+        # Fallback: calculate payoffs for each path
         payoffs = np.zeros(self.n_paths)
         for i in range(self.n_paths):
             index_path = path_result.get_index_path(i)
@@ -324,7 +328,11 @@ class MonteCarloEngine:
             seed=self.seed,
         )
 
-        # Calculate payoffs for each path
+        if payoff.supports_path_vectorized():
+            credited_returns = payoff.calculate_paths_vectorized(path_result.spot_paths)
+            return self._compute_result(dummy_params, spot * credited_returns)
+
+        # Fallback: calculate payoffs for each path
         payoffs = np.zeros(self.n_paths)
         for i in range(self.n_paths):
             # Create IndexPath from Heston path
@@ -514,9 +522,11 @@ class MonteCarloEngine:
         # Discount factor
         df = np.exp(-params.rate * params.time_to_expiry)
 
-        # Discounted mean and standard error
+        # Discounted mean and standard error. Centered sum of squares via one
+        # dot product; payoffs.std() would recompute the mean.
         mean_payoff = payoffs.mean()
-        std_payoff = payoffs.std(ddof=1)
+        deviations = payoffs - mean_payoff
+        std_payoff = np.sqrt(deviations @ deviations / (len(payoffs) - 1))
         se = std_payoff / np.sqrt(len(payoffs))
 
         price = df * mean_payoff
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -170,31 +171,34 @@ class BasePricer(ABC):
                     f"Cannot price without this value."
                 )
 
-    def _calculate_percentile(
+    def _percentile_and_rank(
         self,
         value: float,
-        distribution: pd.Series,
-    ) -> float:
+        distribution: pd.Series | np.ndarray,
+    ) -> tuple[float, int]:
         """
-        Calculate percentile of value within distribution.
+        Calculate percentile and rank of value within distribution.
+
+        A single counting pass gives the number of values <= value, from
+        which both metrics follow; no sort is needed.
 
         Parameters
         ----------
         value : float
             Value to rank
-        distribution : pd.Series
-            Distribution to compare against
+        distribution : pd.Series or np.ndarray
+            Distribution to compare against (no nulls)
 
         Returns
         -------
-        float
-            Percentile (0-100)
+        tuple[float, int]
+            Percentile (0-100) and rank (1 = highest)
         """
-        if distribution.empty:
+        values = np.asarray(distribution, dtype=np.float64)
+        if values.size == 0:
             raise ValueError("CRITICAL: Cannot calculate percentile with empty distribution")
 
-        # Count values less than or equal to our value
-        count_le = (distribution <= value).sum()
-        percentile = (count_le / len(distribution)) * 100
+        count_le = int(np.count_nonzero(values <= value))
+        n = values.size
 
-        return float(percentile)
+        return count_le / n * 100, n - count_le + 1
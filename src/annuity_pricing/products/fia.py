@@ -34,7 +34,7 @@ from annuity_pricing.options.pricing.black_scholes import (
     _calculate_d1_d2,
     black_scholes_call,
 )
-from annuity_pricing.options.simulation.gbm import GBMParams
+from annuity_pricing.options.simulation.gbm import GBMParams, generate_terminal_values
 from annuity_pricing.options.simulation.monte_carlo import MonteCarloEngine
 from annuity_pricing.options.volatility_models import (
     HestonVolatility,
@@ -224,6 +224,24 @@ class FIAPricer(BasePricer):
         ValueError
             If term_years is not provided and product.term_years is None
         """
+        return self._price(product, as_of_date, term_years, premium, None)
+
+    def _price(
+        self,
+        product: FIAProduct,
+        as_of_date: date | None,
+        term_years: float | None,
+        premium: float,
+        returns_cache: dict[float, np.ndarray] | None,
+    ) -> FIAPricingResult:
+        """
+        Price FIA product, optionally sharing simulated index returns.
+
+        See price() for the pricing assumptions. returns_cache maps
+        term_years to terminal GBM index returns; price_multiple passes
+        one dict for the whole batch so point-to-point products with the
+        same term reuse a single simulation.
+        """
         if not isinstance(product, FIAProduct):
             raise ValueError(f"CRITICAL: Expected FIAProduct, got {type(product).__name__}")
 
@@ -262,7 +280,7 @@ class FIAPricer(BasePricer):
         embedded_option_value = self._price_embedded_option(method, params, term_years, premium)
 
         # Calculate expected credit via Monte Carlo
-        expected_credit = self._calculate_expected_credit(method, params, term_years)
+        expected_credit = self._calculate_expected_credit(method, params, term_years, returns_cache)
 
         # Calculate fair terms given option budget
         fair_cap = self._solve_fair_cap(term_years, option_budget, premium)
@@ -316,7 +334,7 @@ class FIAPricer(BasePricer):
             Percentile rank based on cap/participation
         """
         # Filter to FIA products
-        comparables = market_data[market_data["productGroup"] == "FIA"].copy()
+        comparables = market_data[market_data["productGroup"] == "FIA"]
 
         # Apply additional filters
         if kwargs.get("index_used"):
@@ -345,8 +363,7 @@ class FIAPricer(BasePricer):
         if distribution.empty:
             raise ValueError(f"CRITICAL: No comparable products with {rate_col} found")
 
-        percentile = self._calculate_percentile(rate, distribution)
-        rank = int((distribution > rate).sum() + 1)
+        percentile, rank = self._percentile_and_rank(rate, distribution)
 
         return CompetitivePosition(
             rate=rate,
@@ -604,6 +621,7 @@ class FIAPricer(BasePricer):
         method: str,
         params: dict,
         term_years: float,
+        returns_cache: dict[float, np.ndarray] | None = None,
     ) -> float:
         """
         Calculate expected credited return via Monte Carlo.
@@ -619,6 +637,9 @@ class FIAPricer(BasePricer):
             Method parameters
         term_years : float
             Investment term
+        returns_cache : dict[float, np.ndarray], optional
+            Terminal GBM index returns keyed by term, shared across calls.
+            Only used for point-to-point payoffs under GBM.
 
         Returns
         -------
@@ -666,6 +687,19 @@ class FIAPricer(BasePricer):
                 volatility=self.market_params.volatility,
                 time_to_expiry=term_years,
             )
+            if returns_cache is not None and payoff.supports_vectorized():
+                # Same draws as MonteCarloEngine.price_with_payoff, simulated once per term
+                index_returns = returns_cache.get(term_years)
+                if index_returns is None:
+                    engine = self.mc_engine
+                    terminal = generate_terminal_values(
+                        gbm_params, engine.n_paths, engine.seed, engine.antithetic
+                    )
+                    index_returns = (terminal - gbm_params.spot) / gbm_params.spot
+                    returns_cache[term_years] = index_returns
+                payoffs = gbm_params.spot * payoff.calculate_vectorized(index_returns)
+                return float(payoffs.mean() / gbm_params.spot)
+
             mc_result = self.mc_engine.price_with_payoff(gbm_params, payoff, n_steps=n_steps)
 
         # Convert back to return (MC gives dollar payoff)
@@ -784,6 +818,10 @@ class FIAPricer(BasePricer):
         """
         Price multiple FIA products.
 
+        Point-to-point products with the same term share one set of
+        simulated index returns (common random numbers); only the
+        crediting kernel is applied per product.
+
         Parameters
         ----------
         products : list[FIAProduct]
@@ -800,9 +838,10 @@ class FIAPricer(BasePricer):
             Pricing results for all products
         """
         results = []
+        returns_cache: dict[float, np.ndarray] = {}
         for product in products:
             try:
-                result = self.price(product, term_years=term_years, premium=premium)
+                result = self._price(product, None, term_years, premium, returns_cache)
                 results.append(
                     {
                         "company_name": product.company_name,
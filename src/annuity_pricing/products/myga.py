@@ -183,7 +183,7 @@ class MYGAPricer(BasePricer):
         self.validate_product(product, ["fixed_rate", "guarantee_duration"])
 
         # Filter to current MYGA products
-        df = market_data.copy()
+        df = market_data
 
         if "status" in df.columns:
             df = df[df["status"] == "current"]
@@ -211,11 +211,8 @@ class MYGAPricer(BasePricer):
         if rates.empty:
             raise ValueError("CRITICAL: All fixedRate values are null in comparable products.")
 
-        # Calculate percentile (higher rate = higher percentile)
-        percentile = self._calculate_percentile(product.fixed_rate, rates)
-
-        # Calculate rank (1 = highest rate)
-        rank = int((rates > product.fixed_rate).sum() + 1)
+        # Percentile (higher rate = higher percentile) and rank (1 = highest rate)
+        percentile, rank = self._percentile_and_rank(product.fixed_rate, rates)
 
         return CompetitivePosition(
             rate=product.fixed_rate,
@@ -312,7 +309,7 @@ class MYGAPricer(BasePricer):
             raise ValueError(f"CRITICAL: target_percentile must be 0-100, got {target_percentile}")
 
         # Filter to comparable products
-        df = market_data.copy()
+        df = market_data
 
         if "status" in df.columns:
             df = df[df["status"] == "current"]
@@ -13,7 +13,11 @@ See: METHODOLOGY.md Section 3.2
 See: docs/knowledge/domain/buffer_floor.md
 """
 
+import contextlib
+import functools
 import logging
+import math
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date
 from typing import Any
@@ -35,7 +39,6 @@ from annuity_pricing.options.pricing.black_scholes import (
     black_scholes_greeks,
     black_scholes_put,
 )
-from annuity_pricing.options.simulation.gbm import GBMParams
 from annuity_pricing.options.simulation.monte_carlo import MonteCarloEngine
 from annuity_pricing.options.volatility_models import (
     HestonVolatility,
@@ -75,6 +78,18 @@ class RILAPricingResult(PricingResult):
     breakeven_return: float | None = None
 
 
+@dataclass(frozen=True)
+class _RILAComponents:
+    """Valued legs of a RILA product (hashable, safe to memoize)."""
+
+    protection_value: float
+    upside_value: float
+    expected_return: float
+    max_loss: float
+    discount_factor: float
+    present_value: float
+
+
 @dataclass(frozen=True)
 class MarketParams:
     """
@@ -191,9 +206,17 @@ class RILAPricer(BasePricer):
     market_params : MarketParams
         Market parameters for option pricing
     n_mc_paths : int, default 100000
-        Number of Monte Carlo paths for simulation
+        Number of Monte Carlo paths (Heston expected return only; GBM is
+        closed form)
     seed : int, optional
-        Random seed for reproducibility
+        Random seed for reproducibility. Deterministic valuations (GBM, or
+        seeded Heston) are memoized per pricer on (protection, rates, term,
+        premium), so repeated pricing of identical terms is free.
+
+    Notes
+    -----
+    ``market_params`` is treated as immutable for the pricer's lifetime;
+    build a new pricer to price under different market conditions.
 
     Examples
     --------
@@ -216,6 +239,20 @@ class RILAPricer(BasePricer):
         # Initialize MC engine
         self.mc_engine = MonteCarloEngine(n_paths=n_mc_paths, antithetic=True, seed=seed)
 
+        # GBM valuations are closed form and seeded MC is reproducible, so
+        # identical inputs can share one valuation. Unseeded Heston pricers
+        # must redraw paths on every call.
+        self._components = (
+            functools.lru_cache(maxsize=4096)(self._value_components)
+            if self._is_deterministic()
+            else self._value_components
+        )
+
+    def _is_deterministic(self) -> bool:
+        """True if valuations do not depend on unseeded random draws."""
+        model_type = self.market_params.get_vol_model_type()
+        return self.seed is not None or model_type != VolatilityModelType.HESTON
+
     def price(  # type: ignore[override]  # Subclass has specific params
         self,
         product: RILAProduct,
@@ -290,6 +327,63 @@ class RILAPricer(BasePricer):
             buffer_rate = product.buffer_rate
         cap_rate = product.cap_rate
 
+        components = self._components(is_buffer, buffer_rate, cap_rate, term_years, premium)
+
+        # Calculate breakeven return
+        breakeven_return = self._calculate_breakeven(is_buffer, buffer_rate, cap_rate)
+
+        return RILAPricingResult(
+            present_value=components.present_value,
+            duration=term_years,
+            as_of_date=as_of_date or date.today(),
+            protection_value=components.protection_value,
+            protection_type=protection_type,
+            upside_value=components.upside_value,
+            expected_return=components.expected_return,
+            max_loss=components.max_loss,
+            breakeven_return=breakeven_return,
+            details={
+                "buffer_rate": buffer_rate,
+                "cap_rate": cap_rate,
+                "is_buffer": is_buffer,
+                "term_years": term_years,
+                "premium": premium,
+                "discount_factor": components.discount_factor,
+            },
+        )
+
+    def _value_components(
+        self,
+        is_buffer: bool,
+        buffer_rate: float,
+        cap_rate: float | None,
+        term_years: float,
+        premium: float,
+    ) -> _RILAComponents:
+        """
+        Value the protection, upside, and expected-return legs.
+
+        Shared by ``price`` and ``compare_buffer_vs_floor`` so comparisons
+        skip product construction and re-validation.
+
+        Parameters
+        ----------
+        is_buffer : bool
+            True if buffer, False if floor
+        buffer_rate : float
+            Protection level
+        cap_rate : float, optional
+            Cap rate (None = uncapped)
+        term_years : float
+            Investment term (already validated > 0)
+        premium : float
+            Notional amount
+
+        Returns
+        -------
+        _RILAComponents
+            Valued legs and present value
+        """
         # Calculate max loss
         if is_buffer:
             max_loss = 1.0 - buffer_rate  # Dollar-for-dollar after buffer exhausted
@@ -307,34 +401,20 @@ class RILAPricer(BasePricer):
             is_buffer, buffer_rate, cap_rate, term_years
         )
 
-        # Calculate breakeven return
-        breakeven_return = self._calculate_breakeven(is_buffer, buffer_rate, cap_rate)
-
         # [T1] Risk-neutral PV: discount the full maturity payoff (principal + return)
         # At maturity, policyholder receives: premium * (1 + expected_return)
         # PV = e^(-rT) * premium * (1 + expected_return)
-        discount_factor = np.exp(-self.market_params.risk_free_rate * term_years)
+        discount_factor = math.exp(-self.market_params.risk_free_rate * term_years)
         present_value = discount_factor * premium * (1 + expected_return)
         # Note: PV clipping removed - negative PV now surfaced to validation gates
 
-        return RILAPricingResult(
-            present_value=present_value,
-            duration=term_years,
-            as_of_date=as_of_date or date.today(),
+        return _RILAComponents(
             protection_value=protection_value,
-            protection_type=protection_type,
             upside_value=upside_value,
             expected_return=expected_return,
             max_loss=max_loss,
-            breakeven_return=breakeven_return,
-            details={
-                "buffer_rate": buffer_rate,
-                "cap_rate": cap_rate,
-                "is_buffer": is_buffer,
-                "term_years": term_years,
-                "premium": premium,
-                "discount_factor": discount_factor,
-            },
+            discount_factor=discount_factor,
+            present_value=present_value,
         )
 
     def competitive_position(
@@ -360,30 +440,37 @@ class RILAPricer(BasePricer):
         CompetitivePosition
             Percentile rank based on cap rate
         """
-        # Filter to RILA products
-        comparables = market_data[market_data["productGroup"] == "RILA"].copy()
+        # Filter to RILA products (filters combine into one mask, indexed once;
+        # missing values, including pd.NA in nullable columns, never match)
+        mask = (
+            market_data["productGroup"].eq("RILA").to_numpy(dtype=bool, na_value=False, copy=True)
+        )
 
         # Filter by protection type if specified
-        if product.is_buffer():
-            comparables = comparables[
-                comparables["bufferModifier"].str.lower().str.contains("up to", na=False)
-            ]
-        else:
-            comparables = comparables[
-                comparables["bufferModifier"].str.lower().str.contains("after", na=False)
-            ]
+        modifier = "up to" if product.is_buffer() else "after"
+        mask &= (
+            market_data["bufferModifier"]
+            .str.contains(modifier, case=False, regex=False, na=False)
+            .to_numpy(dtype=bool)
+        )
 
         # Filter by buffer rate (similar protection level)
         if product.buffer_rate is not None:
             tolerance = 0.02  # 2% tolerance
-            comparables = comparables[
-                (comparables["bufferRate"] >= product.buffer_rate - tolerance)
-                & (comparables["bufferRate"] <= product.buffer_rate + tolerance)
-            ]
+            buffer_rates = market_data["bufferRate"].to_numpy(dtype=np.float64, na_value=np.nan)
+            mask &= (buffer_rates >= product.buffer_rate - tolerance) & (
+                buffer_rates <= product.buffer_rate + tolerance
+            )
 
         # Apply additional filters
         if kwargs.get("index_used"):
-            comparables = comparables[comparables["indexUsed"] == kwargs["index_used"]]
+            mask &= (
+                market_data["indexUsed"]
+                .eq(kwargs["index_used"])
+                .to_numpy(dtype=bool, na_value=False)
+            )
+
+        comparables = market_data[mask]
 
         if comparables.empty:
             raise ValueError(
@@ -400,8 +487,7 @@ class RILAPricer(BasePricer):
         if distribution.empty:
             raise ValueError("CRITICAL: No comparable products with capRate found")
 
-        percentile = self._calculate_percentile(rate, distribution)
-        rank = int((distribution > rate).sum() + 1)
+        percentile, rank = self._percentile_and_rank(rate, distribution)
 
         return CompetitivePosition(
             rate=rate,
@@ -660,10 +746,11 @@ class RILAPricer(BasePricer):
         term_years: float,
     ) -> float:
         """
-        Calculate expected return via Monte Carlo.
+        Calculate expected credited return.
 
-        [T1] Uses GBM or Heston paths based on vol_model configuration.
-        Dispatches to appropriate MC method for path generation.
+        [T1] Under GBM (BS, or SABR falling back to its scalar volatility) the
+        credited return is a static portfolio of options on the index, so its
+        expectation is closed form. Heston has no closed form and uses MC.
 
         Parameters
         ----------
@@ -681,6 +768,11 @@ class RILAPricer(BasePricer):
         float
             Expected return (decimal)
         """
+        model_type = self.market_params.get_vol_model_type()
+
+        if model_type != VolatilityModelType.HESTON:
+            return self._closed_form_expected_return(is_buffer, buffer_rate, cap_rate, term_years)
+
         # Create payoff object (BufferPayoff or FloorPayoff based on protection type)
         payoff: BufferPayoff | FloorPayoff
         if is_buffer:
@@ -689,38 +781,109 @@ class RILAPricer(BasePricer):
             # Floor rate is negative for FloorPayoff
             payoff = FloorPayoff(floor_rate=-buffer_rate, cap_rate=cap_rate)
 
-        # Dispatch to appropriate MC method based on vol_model
-        model_type = self.market_params.get_vol_model_type()
+        # Use Heston paths for MC simulation
+        heston_vol = self.market_params.vol_model
+        assert isinstance(heston_vol, HestonVolatility), "Expected HestonVolatility"
+
+        mc_result = self.mc_engine.price_with_payoff_heston(
+            spot=self.market_params.spot,
+            rate=self.market_params.risk_free_rate,
+            dividend=self.market_params.dividend_yield,
+            time_to_expiry=term_years,
+            heston_params=heston_vol.params,
+            payoff=payoff,
+            n_steps=252,  # Daily steps for RILA
+        )
+        # Convert back to return
+        return float(mc_result.payoffs.mean() / self.market_params.spot)
 
-        if model_type == VolatilityModelType.HESTON:
-            # Use Heston paths for MC simulation
-            heston_vol = self.market_params.vol_model
-            assert isinstance(heston_vol, HestonVolatility), "Expected HestonVolatility"
+    def _closed_form_expected_return(
+        self,
+        is_buffer: bool,
+        buffer_rate: float,
+        cap_rate: float | None,
+        term_years: float,
+    ) -> float:
+        """
+        Exact GBM expectation of the credited return.
 
-            mc_result = self.mc_engine.price_with_payoff_heston(
-                spot=self.market_params.spot,
-                rate=self.market_params.risk_free_rate,
-                dividend=self.market_params.dividend_yield,
-                time_to_expiry=term_years,
-                heston_params=heston_vol.params,
-                payoff=payoff,
-                n_steps=252,  # Daily steps for RILA
+        [T1] E[max(S_T - K, 0)] = e^(rT) * C(K), E[max(K - S_T, 0)] = e^(rT) * P(K)
+
+        Per unit of spot, with R = S_T/S_0 - 1:
+        - Upside: call spread on R struck at 0 and cap (call if uncapped)
+        - Buffer: minus a put on R struck at -buffer (losses beyond the buffer)
+        - Floor: minus a put spread on R struck at 0 and -floor (losses the
+          floor does not absorb)
+
+        Parameters
+        ----------
+        is_buffer : bool
+            True if buffer protection
+        buffer_rate : float
+            Protection level
+        cap_rate : float, optional
+            Cap rate (None = uncapped)
+        term_years : float
+            Investment term
+
+        Returns
+        -------
+        float
+            Expected return (decimal)
+        """
+        m = self.market_params
+        growth = math.exp(m.risk_free_rate * term_years) / m.spot
+
+        def call(moneyness: float) -> float:
+            return growth * black_scholes_call(
+                m.spot,
+                m.spot * moneyness,
+                m.risk_free_rate,
+                m.dividend_yield,
+                m.volatility,
+                term_years,
             )
-        else:
-            # Use GBM paths (default: BS or SABR falls back to GBM paths)
-            gbm_params = GBMParams(
-                spot=self.market_params.spot,
-                rate=self.market_params.risk_free_rate,
-                dividend=self.market_params.dividend_yield,
-                volatility=self.market_params.volatility,
-                time_to_expiry=term_years,
+
+        def put(moneyness: float) -> float:
+            return growth * black_scholes_put(
+                m.spot,
+                m.spot * moneyness,
+                m.risk_free_rate,
+                m.dividend_yield,
+                m.volatility,
+                term_years,
             )
-            mc_result = self.mc_engine.price_with_payoff(gbm_params, payoff)
 
-        # Convert back to return
-        expected_return = mc_result.payoffs.mean() / self.market_params.spot
+        upside = call(1.0) if cap_rate is None else call(1.0) - call(1.0 + cap_rate)
 
-        return expected_return
+        # Losses beyond 100% cannot occur; a put struck at zero is worthless
+        deep_loss = put(1.0 - buffer_rate) if buffer_rate < 1.0 else 0.0
+        if is_buffer:
+            downside = deep_loss
+        else:
+            downside = put(1.0) - deep_loss
+
+        return upside - downside
+
+    @contextlib.contextmanager
+    def _shared_valuations(self) -> Iterator[None]:
+        """
+        Value identical terms once for the duration of a batch.
+
+        Deterministic pricers already memoize valuations. Unseeded Heston
+        pricers normally redraw on every call; inside this block identical
+        terms in the batch share one valuation.
+        """
+        if self._is_deterministic():
+            yield
+            return
+
+        previous = self._components
+        self._components = functools.lru_cache(maxsize=4096)(self._value_components)
+        try:
+            yield
+        finally:
+            self._components = previous
 
     def _calculate_breakeven(
         self,
@@ -824,59 +987,23 @@ class RILAPricer(BasePricer):
         if term_years is None or term_years <= 0:
             raise ValueError(f"CRITICAL: term_years required and must be > 0, got {term_years}")
 
-        # Create dummy products with explicit term_years
-        buffer_product = RILAProduct(
-            company_name="Compare",
-            product_name="Buffer",
-            product_group="RILA",
-            status="current",
-            buffer_rate=buffer_rate,
-            buffer_modifier="Losses Covered Up To",
-            cap_rate=cap_rate,
-            term_years=int(term_years),
-        )
-
-        floor_product = RILAProduct(
-            company_name="Compare",
-            product_name="Floor",
-            product_group="RILA",
-            status="current",
-            buffer_rate=floor_rate,
-            buffer_modifier="Losses Covered After",
-            cap_rate=cap_rate,
-            term_years=int(term_years),
-        )
-
-        # Price both
-        buffer_result = self.price(buffer_product, term_years=term_years)
-        floor_result = self.price(floor_product, term_years=term_years)
-
+        # Value both legs directly - no dummy products or re-validation needed
+        with self._shared_valuations():
+            buffer_result = self._components(True, buffer_rate, cap_rate, term_years, 100.0)
+            floor_result = self._components(False, floor_rate, cap_rate, term_years, 100.0)
+
+        metrics = [
+            "protection_value",
+            "upside_value",
+            "expected_return",
+            "max_loss",
+            "present_value",
+        ]
         return pd.DataFrame(
             {
-                "metric": [
-                    "protection_type",
-                    "protection_value",
-                    "upside_value",
-                    "expected_return",
-                    "max_loss",
-                    "present_value",
-                ],
-                "buffer": [
-                    "buffer",
-                    buffer_result.protection_value,
-                    buffer_result.upside_value,
-                    buffer_result.expected_return,
-                    buffer_result.max_loss,
-                    buffer_result.present_value,
-                ],
-                "floor": [
-                    "floor",
-                    floor_result.protection_value,
-                    floor_result.upside_value,
-                    floor_result.expected_return,
-                    floor_result.max_loss,
-                    floor_result.present_value,
-                ],
+                "metric": ["protection_type", *metrics],
+                "buffer": ["buffer", *(getattr(buffer_result, m) for m in metrics)],
+                "floor": ["floor", *(getattr(floor_result, m) for m in metrics)],
             }
         )
 
@@ -905,31 +1032,33 @@ class RILAPricer(BasePricer):
             Pricing results for all products
         """
         results = []
-        for product in products:
-            try:
-                result = self.price(product, term_years=term_years, premium=premium)
-                results.append(
-                    {
-                        "company_name": product.company_name,
-                        "product_name": product.product_name,
-                        "protection_type": result.protection_type,
-                        "buffer_rate": product.buffer_rate,
-                        "cap_rate": product.cap_rate,
-                        "present_value": result.present_value,
-                        "protection_value": result.protection_value,
-                        "upside_value": result.upside_value,
-                        "expected_return": result.expected_return,
-                        "max_loss": result.max_loss,
-                    }
-                )
-            except ValueError as e:
-                results.append(
-                    {
-                        "company_name": product.company_name,
-                        "product_name": product.product_name,
-                        "error": str(e),
-                    }
-                )
+        # Products with identical terms reuse one valuation
+        with self._shared_valuations():
+            for product in products:
+                try:
+                    result = self.price(product, term_years=term_years, premium=premium)
+                    results.append(
+                        {
+                            "company_name": product.company_name,
+                            "product_name": product.product_name,
+                            "protection_type": result.protection_type,
+                            "buffer_rate": product.buffer_rate,
+                            "cap_rate": product.cap_rate,
+                            "present_value": result.present_value,
+                            "protection_value": result.protection_value,
+                            "upside_value": result.upside_value,
+                            "expected_return": result.expected_return,
+                            "max_loss": result.max_loss,
+                        }
+                    )
+                except ValueError as e:
+                    results.append(
+                        {
+                            "company_name": product.company_name,
+                            "product_name": product.product_name,
+                            "error": str(e),
+                        }
+                    )
 
         return pd.DataFrame(results)
 
@@ -159,29 +159,13 @@ class RateRecommender:
         ValueError
             If no comparable products found or invalid inputs
         """
-        # Validate inputs
-        if not 0 <= target_percentile <= 100:
-            raise ValueError(f"CRITICAL: target_percentile must be 0-100, got {target_percentile}")
-        if guarantee_duration <= 0:
-            raise ValueError(f"CRITICAL: guarantee_duration must be > 0, got {guarantee_duration}")
-
-        # Filter to comparable products
-        comparables = self._get_comparables(market_data, guarantee_duration)
-
-        if comparables.empty:
-            raise ValueError(
-                f"CRITICAL: No comparable MYGA products found for "
-                f"duration {guarantee_duration} ± {self.duration_tolerance} years. "
-                f"Check market_data filters."
-            )
-
-        rates = comparables["fixedRate"].dropna()
-
-        if rates.empty:
-            raise ValueError("CRITICAL: All fixedRate values are null in comparable products.")
-
         # Calculate rate at target percentile
-        recommended_rate = float(np.percentile(rates, target_percentile))
+        target_rates, errors, comparable_count = self._rates_at_percentiles(
+            market_data, guarantee_duration, [target_percentile]
+        )
+        if errors[0] is not None:
+            raise ValueError(errors[0])
+        recommended_rate = float(target_rates[0])
 
         # Calculate spread over Treasury
         spread_bps = None
@@ -195,7 +179,7 @@ class RateRecommender:
             margin_bps = spread_bps - expense_bps
 
         # Determine confidence
-        confidence = self._assess_confidence(len(rates), target_percentile, margin_bps)
+        confidence = self._assess_confidence(comparable_count, target_percentile, margin_bps)
 
         # Build rationale
         rationale = self._build_rationale(
@@ -204,7 +188,7 @@ class RateRecommender:
             spread_bps=spread_bps,
             margin_bps=margin_bps,
             min_margin_bps=min_margin_bps,
-            comparable_count=len(rates),
+            comparable_count=comparable_count,
         )
 
         return RateRecommendation(
@@ -214,7 +198,7 @@ class RateRecommender:
             margin_estimate=margin_bps,
             confidence=confidence,
             rationale=rationale,
-            comparable_count=len(rates),
+            comparable_count=comparable_count,
         )
 
     def recommend_for_spread(
@@ -250,12 +234,13 @@ class RateRecommender:
         recommended_rate = treasury_rate + (target_spread_bps / 10000)
 
         # Get comparables to determine percentile
-        comparables = self._get_comparables(market_data, guarantee_duration)
+        comparable = self._comparable_mask(market_data, guarantee_duration)
 
-        if comparables.empty:
+        if not comparable.any():
             raise ValueError(f"CRITICAL: No comparable products for duration {guarantee_duration}")
 
-        rates = comparables["fixedRate"].dropna()
+        rates = self._fixed_rates(market_data)[comparable]
+        rates = rates[~np.isnan(rates)]
 
         # Calculate percentile for this rate
         percentile = self._calculate_percentile(recommended_rate, rates)
@@ -349,27 +334,27 @@ class RateRecommender:
         if percentile_range is None:
             percentile_range = [25.0, 50.0, 75.0, 90.0]
 
-        results = []
+        quantiles, errors, comparable_count = self._rates_at_percentiles(
+            market_data, guarantee_duration, percentile_range
+        )
+        spread_bps = (quantiles - treasury_rate) * 10000
+        margin_bps = spread_bps - self.default_expense_load * 10000
 
-        for pct in percentile_range:
-            try:
-                rec = self.recommend_rate(
-                    guarantee_duration=guarantee_duration,
-                    target_percentile=pct,
-                    market_data=market_data,
-                    treasury_rate=treasury_rate,
-                )
+        results: list[dict[str, Any]] = []
+
+        for i, pct in enumerate(percentile_range):
+            if errors[i] is None:
                 results.append(
                     {
                         "percentile": pct,
-                        "rate": rec.recommended_rate,
-                        "spread_bps": rec.spread_over_treasury,
-                        "margin_bps": rec.margin_estimate,
-                        "comparable_count": rec.comparable_count,
+                        "rate": float(quantiles[i]),
+                        "spread_bps": float(spread_bps[i]),
+                        "margin_bps": float(margin_bps[i]),
+                        "comparable_count": comparable_count,
                     }
                 )
-            except ValueError as e:
-                # Log but continue with other percentiles
+            else:
+                # Record the failure but continue with other percentiles
                 results.append(
                     {
                         "percentile": pct,
@@ -377,19 +362,120 @@ class RateRecommender:
                         "spread_bps": None,
                         "margin_bps": None,
                         "comparable_count": 0,
-                        "error": str(e),  # type: ignore[dict-item]
+                        "error": errors[i],
                     }
                 )
 
         return pd.DataFrame(results)
 
-    def _get_comparables(
+    def _rates_at_percentiles(
         self,
         market_data: pd.DataFrame,
         guarantee_duration: int,
-    ) -> pd.DataFrame:
+        target_percentiles: list[float],
+    ) -> tuple[np.ndarray, list[str | None], int]:
         """
-        Filter market data to comparable products.
+        Comparable fixed rates at each target percentile.
+
+        Comparables are filtered once and every valid target is taken from a
+        single np.percentile call. A target that fails (percentile outside
+        0-100, no comparables, negative rate) gets its CRITICAL message
+        instead of a rate, so a sweep can continue past it.
+
+        Parameters
+        ----------
+        market_data : pd.DataFrame
+            Comparable MYGA products (must have 'fixedRate', 'guaranteeDuration')
+        guarantee_duration : int
+            Product duration in years
+        target_percentiles : list[float]
+            Target percentiles (0-100)
+
+        Returns
+        -------
+        tuple[np.ndarray, list[str | None], int]
+            Rate per target (NaN on failure), error message per target (None
+            on success), and the number of comparable rates
+        """
+        percentiles = np.asarray(target_percentiles, dtype=np.float64)
+        in_range = (percentiles >= 0) & (percentiles <= 100)
+
+        target_rates = np.full(len(percentiles), np.nan)
+        comparable_count = 0
+        comparables_error = None
+        try:
+            rates = self._comparable_rates(market_data, guarantee_duration)
+            comparable_count = len(rates)
+            target_rates[in_range] = np.percentile(rates, percentiles[in_range])
+        except ValueError as e:
+            comparables_error = str(e)
+
+        errors: list[str | None] = []
+        for i, pct in enumerate(target_percentiles):
+            if not in_range[i]:
+                errors.append(f"CRITICAL: target_percentile must be 0-100, got {pct}")
+            elif comparables_error is not None:
+                errors.append(comparables_error)
+            elif target_rates[i] < 0:
+                errors.append(f"CRITICAL: recommended_rate must be >= 0, got {target_rates[i]}")
+            else:
+                errors.append(None)
+
+        return target_rates, errors, comparable_count
+
+    def _comparable_rates(
+        self,
+        market_data: pd.DataFrame,
+        guarantee_duration: int,
+    ) -> np.ndarray:
+        """
+        Non-null fixed rates of duration-matched comparables.
+
+        Parameters
+        ----------
+        market_data : pd.DataFrame
+            Comparable MYGA products (must have 'fixedRate', 'guaranteeDuration')
+        guarantee_duration : int
+            Product duration in years
+
+        Returns
+        -------
+        np.ndarray
+            Comparable fixedRate values (non-empty)
+
+        Raises
+        ------
+        ValueError
+            If the duration is invalid or no comparable rates are found
+        """
+        if guarantee_duration <= 0:
+            raise ValueError(f"CRITICAL: guarantee_duration must be > 0, got {guarantee_duration}")
+
+        # Filter to comparable products
+        comparable = self._comparable_mask(market_data, guarantee_duration)
+
+        if not comparable.any():
+            raise ValueError(
+                f"CRITICAL: No comparable MYGA products found for "
+                f"duration {guarantee_duration} ± {self.duration_tolerance} years. "
+                f"Check market_data filters."
+            )
+
+        rates = self._fixed_rates(market_data)[comparable]
+        rates = rates[~np.isnan(rates)]
+
+        if rates.size == 0:
+            raise ValueError("CRITICAL: All fixedRate values are null in comparable products.")
+
+        return rates
+
+    def _comparable_mask(
+        self,
+        market_data: pd.DataFrame,
+        guarantee_duration: int,
+    ) -> np.ndarray:
+        """
+        Mark the rows of market data that are comparable products.
 
         Parameters
         ----------
@@ -400,33 +486,38 @@ class RateRecommender:
 
         Returns
         -------
-        pd.DataFrame
-            Filtered to comparable products
+        np.ndarray
+            Boolean mask, True for comparable products
         """
-        df = market_data.copy()
+        # Combine every filter on raw column arrays; no frame is sliced or copied.
+        # Missing values (including pd.NA in nullable columns) never match.
+        mask = np.ones(len(market_data), dtype=bool)
 
         # Filter to current MYGA products
-        if "status" in df.columns:
-            df = df[df["status"] == "current"]
+        if "status" in market_data.columns:
+            mask &= market_data["status"].eq("current").to_numpy(dtype=bool, na_value=False)
 
-        if "productGroup" in df.columns:
-            df = df[df["productGroup"] == "MYGA"]
+        if "productGroup" in market_data.columns:
+            mask &= market_data["productGroup"].eq("MYGA").to_numpy(dtype=bool, na_value=False)
 
         # Duration matching
-        if "guaranteeDuration" in df.columns:
-            df = df[
-                (df["guaranteeDuration"] >= guarantee_duration - self.duration_tolerance)
-                & (df["guaranteeDuration"] <= guarantee_duration + self.duration_tolerance)
-            ]
+        if "guaranteeDuration" in market_data.columns:
+            durations = market_data["guaranteeDuration"].to_numpy(dtype=np.float64, na_value=np.nan)
+            mask &= np.abs(durations - guarantee_duration) <= self.duration_tolerance
+
+        return mask
 
-        return df
+    @staticmethod
+    def _fixed_rates(market_data: pd.DataFrame) -> np.ndarray:
+        """fixedRate column as float64, nulls as NaN."""
+        return market_data["fixedRate"].to_numpy(dtype=np.float64, na_value=np.nan)
 
-    def _calculate_percentile(self, value: float, distribution: pd.Series) -> float:
-        """Calculate percentile of value within distribution."""
-        if distribution.empty:
+    def _calculate_percentile(self, value: float, distribution: np.ndarray) -> float:
+        """Calculate percentile of value within distribution (one counting pass)."""
+        if distribution.size == 0:
             raise ValueError("CRITICAL: Cannot calculate percentile with empty distribution")
-        count_le = (distribution <= value).sum()
-        return float((count_le / len(distribution)) * 100)
+        count_le = np.count_nonzero(distribution <= value)
+        return float(count_le / distribution.size * 100)
 
     def _assess_confidence(
         self,
@@ -32,6 +32,7 @@ from .scenarios import (
     EconomicScenario,
     EquityParams,
     ScenarioGenerator,
+    ScenarioStatistics,
     VasicekParams,
     calculate_scenario_statistics,
     generate_deterministic_scenarios,
@@ -62,6 +63,7 @@ __all__ = [
     "EquityParams",
     "generate_deterministic_scenarios",
     "calculate_scenario_statistics",
+    "ScenarioStatistics",
     # VM-21
     "VM21Calculator",
     "VM21Result",
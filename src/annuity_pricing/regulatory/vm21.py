@@ -455,7 +455,7 @@ class VM21Calculator:
             PV of liability for each scenario
         """
         pvs = []
-        for scenario in scenarios.scenarios:
+        for scenario in scenarios:
             pv = self._run_single_scenario(policy, scenario, mortality_table, r)
             pvs.append(pv)
         return np.array(pvs)
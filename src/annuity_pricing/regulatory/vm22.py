@@ -384,8 +384,8 @@ class VM22Calculator:
 
         # Run each scenario
         pvs = []
-        for scenario in scenarios:
-            pv = self._run_fixed_scenario(policy, scenario.rates, lapse_rate)
+        for rates in scenarios.get_rate_matrix():
+            pv = self._run_fixed_scenario(policy, rates, lapse_rate)
             pvs.append(pv)
 
         # DR = max of deterministic scenarios
@@ -429,8 +429,8 @@ class VM22Calculator:
 
         # Run each scenario
         pvs = []
-        for scenario in ag43.scenarios:
-            pv = self._run_fixed_scenario(policy, scenario.rates, lapse_rate)
+        for rates in ag43.get_rate_matrix():
+            pv = self._run_fixed_scenario(policy, rates, lapse_rate)
             pvs.append(pv)
 
         # CTE70 = average of worst 30%
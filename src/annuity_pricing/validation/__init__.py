@@ -15,6 +15,8 @@ See: METHODOLOGY.md Section 5
 
 from annuity_pricing.validation.gates import (
     ArbitrageBoundsGate,
+    BatchFields,
+    BatchValidationReport,
     DurationBoundsGate,
     FIAExpectedCreditGate,
     FIAOptionBudgetGate,
@@ -27,6 +29,7 @@ from annuity_pricing.validation.gates import (
     RILAProtectionValueGate,
     # Engine
     ValidationEngine,
+    ValidationError,
     # Base Gate
     ValidationGate,
     ValidationReport,
@@ -40,6 +43,8 @@ __all__ = [
     "GateStatus",
     "GateResult",
     "ValidationReport",
+    "BatchValidationReport",
+    "BatchFields",
     # Base Gate
     "ValidationGate",
     # Specific Gates
@@ -52,6 +57,7 @@ __all__ = [
     "ArbitrageBoundsGate",
     # Engine
     "ValidationEngine",
+    "ValidationError",
     # Convenience Functions
     "validate_pricing_result",
     "ensure_valid",
@@ -10,9 +10,14 @@ See: docs/knowledge/domain/mgsv_mva.md for regulatory bounds
 """
 
 import logging
-from dataclasses import dataclass
-from enum import Enum
-from typing import Any
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, ClassVar, NamedTuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -21,15 +26,33 @@ from annuity_pricing.products.fia import FIAPricingResult
 from annuity_pricing.products.rila import RILAPricingResult
 
 
-class GateStatus(Enum):
-    """Status of a validation gate."""
+class GateStatus(IntEnum):
+    """
+    Status of a validation gate, ordered by severity.
+
+    Integer values make status checks plain int comparisons and let the
+    worst status be taken with max(). Use ``label`` for the lowercase name
+    reported in logs; ``GateStatus("halt")`` still looks up by that name.
+    """
 
-    PASS = "pass"
-    HALT = "halt"
-    WARN = "warn"
+    PASS = 0
+    WARN = 1
+    HALT = 2
 
+    @property
+    def label(self) -> str:
+        """Lowercase status name ("pass", "warn", "halt")."""
+        return self.name.lower()
 
-@dataclass(frozen=True)
+    @classmethod
+    def _missing_(cls, value: object) -> "GateStatus | None":
+        """Accept the string values used before statuses became ints."""
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
+@dataclass(frozen=True, slots=True)
 class GateResult:
     """
     Result of a validation gate check.
@@ -57,7 +80,7 @@ class GateResult:
     @property
     def passed(self) -> bool:
         """Check if gate passed (PASS or WARN)."""
-        return self.status != GateStatus.HALT
+        return self.status < GateStatus.HALT
 
 
 @dataclass(frozen=True)
@@ -68,48 +91,70 @@ class ValidationReport:
     Attributes
     ----------
     results : tuple[GateResult, ...]
-        Results from all gates
+        Results from all gates (other sequences are converted to a tuple)
     overall_status : GateStatus
         Worst status across all gates
+
+    Notes
+    -----
+    The halted/warned partition is computed in one pass on first access
+    and cached; overall status and passed are derived from it without
+    re-walking the results. The report is frozen so they never go stale.
     """
 
     results: tuple[GateResult, ...]
 
-    @property
+    def __post_init__(self) -> None:
+        # Accept any sequence, but store a tuple so the cached views stay valid
+        if type(self.results) is not tuple:
+            object.__setattr__(self, "results", tuple(self.results))
+
+    @cached_property
+    def _flagged(self) -> tuple[tuple[GateResult, ...], tuple[GateResult, ...]]:
+        """Halted and warned results, partitioned in a single pass."""
+        halted = []
+        warned = []
+        for r in self.results:
+            if r.status == GateStatus.HALT:
+                halted.append(r)
+            elif r.status == GateStatus.WARN:
+                warned.append(r)
+        return tuple(halted), tuple(warned)
+
+    @cached_property
     def overall_status(self) -> GateStatus:
         """Get worst status across all gates."""
-        if any(r.status == GateStatus.HALT for r in self.results):
+        halted, warned = self._flagged
+        if halted:
             return GateStatus.HALT
-        elif any(r.status == GateStatus.WARN for r in self.results):
-            return GateStatus.WARN
-        return GateStatus.PASS
+        return GateStatus.WARN if warned else GateStatus.PASS
 
     @property
     def passed(self) -> bool:
         """Check if all gates passed (no HALTs)."""
-        return self.overall_status != GateStatus.HALT
+        return not self._flagged[0]
 
     @property
-    def halted_gates(self) -> list[GateResult]:
+    def halted_gates(self) -> tuple[GateResult, ...]:
         """Get all gates that halted."""
-        return [r for r in self.results if r.status == GateStatus.HALT]
+        return self._flagged[0]
 
     @property
-    def warned_gates(self) -> list[GateResult]:
+    def warned_gates(self) -> tuple[GateResult, ...]:
         """Get all gates that warned."""
-        return [r for r in self.results if r.status == GateStatus.WARN]
+        return self._flagged[1]
 
     def to_dict(self) -> dict:
         """Convert to dictionary for logging."""
         return {
-            "overall_status": self.overall_status.value,
+            "overall_status": self.overall_status.label,
             "passed": self.passed,
             "n_halted": len(self.halted_gates),
             "n_warned": len(self.warned_gates),
             "results": [
                 {
                     "gate": r.gate_name,
-                    "status": r.status.value,
+                    "status": r.status.label,
                     "message": r.message,
                     "value": r.value,
                     "threshold": r.threshold,
@@ -119,6 +164,181 @@ class ValidationReport:
         }
 
 
+class ValidationError(ValueError):
+    """
+    Raised by ValidationEngine.validate_and_raise when a gate HALTs.
+
+    The message is rendered from the report's halted gates when the error
+    is printed, so callers that catch and discard it skip the formatting.
+
+    Attributes
+    ----------
+    report : ValidationReport
+        Report of the failed validation
+    """
+
+    def __init__(self, report: ValidationReport):
+        super().__init__(report)
+        self.report = report
+
+    def __str__(self) -> str:
+        return "CRITICAL: Validation failed. HALTs:\n" + "\n".join(
+            f"  - {g.message}" for g in self.report.halted_gates
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class BatchFields:
+    """
+    Numeric fields of a batch of pricing results, one array per field.
+
+    Fields a result does not carry (duration=None, FIA fields on a RILA
+    result, ...) are NaN, so every comparison against them is False.
+
+    Attributes
+    ----------
+    present_value, duration : ndarray
+        Common PricingResult fields
+    is_fia, is_rila : ndarray
+        Boolean masks of FIA and RILA results
+    embedded_option_value, option_budget, expected_credit : ndarray
+        FIA fields
+    protection_value, max_loss : ndarray
+        RILA fields
+    is_buffer, is_floor : ndarray
+        Boolean masks of RILA protection type
+    """
+
+    present_value: np.ndarray
+    duration: np.ndarray
+    is_fia: np.ndarray
+    is_rila: np.ndarray
+    embedded_option_value: np.ndarray
+    option_budget: np.ndarray
+    expected_credit: np.ndarray
+    protection_value: np.ndarray
+    max_loss: np.ndarray
+    is_buffer: np.ndarray
+    is_floor: np.ndarray
+
+    @classmethod
+    def from_results(cls, results: Sequence[PricingResult]) -> "BatchFields":
+        """Extract every field in one pass per field."""
+        n = len(results)
+
+        def column(name: str) -> np.ndarray:
+            values = (getattr(r, name, None) for r in results)
+            return np.fromiter(
+                (np.nan if v is None else v for v in values), dtype=np.float64, count=n
+            )
+
+        def mask(predicate: Any) -> np.ndarray:
+            return np.fromiter((predicate(r) for r in results), dtype=bool, count=n)
+
+        return cls(
+            present_value=column("present_value"),
+            duration=column("duration"),
+            is_fia=mask(lambda r: isinstance(r, FIAPricingResult)),
+            is_rila=mask(lambda r: isinstance(r, RILAPricingResult)),
+            embedded_option_value=column("embedded_option_value"),
+            option_budget=column("option_budget"),
+            expected_credit=column("expected_credit"),
+            protection_value=column("protection_value"),
+            max_loss=column("max_loss"),
+            is_buffer=mask(lambda r: getattr(r, "protection_type", None) == "buffer"),
+            is_floor=mask(lambda r: getattr(r, "protection_type", None) == "floor"),
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class BatchValidationReport:
+    """
+    Validation report for a batch of pricing results.
+
+    Attributes
+    ----------
+    gate_names : tuple[str, ...]
+        Gate names, in column order of ``status``
+    status : ndarray
+        GateStatus codes (int8, shape: [n_results, n_gates])
+    flagged : dict[int, tuple[GateResult, ...]]
+        Full HALT/WARN gate results (with messages) keyed by result index.
+        Messages are only formatted for these entries.
+    """
+
+    gate_names: tuple[str, ...]
+    status: np.ndarray
+    flagged: dict[int, tuple[GateResult, ...]]
+
+    @property
+    def overall_status(self) -> np.ndarray:
+        """Worst GateStatus code per result."""
+        if self.status.shape[1] == 0:
+            return np.full(self.status.shape[0], GateStatus.PASS, dtype=np.int8)
+        return self.status.max(axis=1)
+
+    @property
+    def passed(self) -> np.ndarray:
+        """Boolean mask of results with no HALTs."""
+        return self.overall_status < GateStatus.HALT
+
+    @property
+    def all_passed(self) -> bool:
+        """True if no result in the batch halted."""
+        return not self._halted.any()
+
+    @property
+    def halted_indices(self) -> np.ndarray:
+        """Indices of results with at least one HALT."""
+        return np.flatnonzero(self._halted.any(axis=1))
+
+    @property
+    def _halted(self) -> np.ndarray:
+        """Boolean HALT mask (shape: [n_results, n_gates])."""
+        return self.status == GateStatus.HALT
+
+    def halted_gates(self, index: int) -> tuple[GateResult, ...]:
+        """Get the gates that halted for one result."""
+        return tuple(r for r in self.flagged.get(index, ()) if r.status == GateStatus.HALT)
+
+
+def _status_codes(halt: np.ndarray, warn: np.ndarray | None = None) -> np.ndarray:
+    """Combine HALT/WARN masks into int8 GateStatus codes (HALT wins)."""
+    codes = np.where(halt, GateStatus.HALT, GateStatus.PASS).astype(np.int8)
+    if warn is not None:
+        codes[warn & ~halt] = GateStatus.WARN
+    return codes
+
+
+class _ValidationContext(NamedTuple):
+    """
+    Validation context, parsed once per validate call.
+
+    Gates read the known keys as attributes instead of probing the context
+    dict per gate per result. ``raw`` keeps the original keywords for custom
+    gates that only implement check(result, **context).
+    """
+
+    premium: float = 100.0
+    cap_rate: float | None = None
+    participation_rate: float | None = None
+    buffer_rate: float | None = None
+    spread_rate: float | None = None
+    raw: Mapping[str, Any] = MappingProxyType({})
+
+    @classmethod
+    def from_kwargs(cls, context: Mapping[str, Any]) -> "_ValidationContext":
+        """Parse keyword context, defaulting premium to 100.0."""
+        return cls(
+            premium=context.get("premium", 100.0),
+            cap_rate=context.get("cap_rate"),
+            participation_rate=context.get("participation_rate"),
+            buffer_rate=context.get("buffer_rate"),
+            spread_rate=context.get("spread_rate"),
+            raw=context,
+        )
+
+
 # =============================================================================
 # Gate Implementations
 # =============================================================================
@@ -128,10 +348,23 @@ class ValidationGate:
     """
     Base class for validation gates.
 
-    Subclasses implement check() to validate pricing results.
+    Subclasses implement _check(result, ctx, /) against the parsed context
+    (called positionally by ValidationEngine, with no per-call kwargs dict),
+    or check() against keyword context.
+
+    Attributes
+    ----------
+    name : str
+        Gate name reported in results
+    applies_to : tuple[type, ...]
+        Result types the gate can flag. ValidationEngine.validate skips the
+        gate for other types (for which check() would only return PASS).
     """
 
+    __slots__ = ()
+
     name: str = "base_gate"
+    applies_to: tuple[type[PricingResult], ...] = (PricingResult,)
 
     def check(self, result: PricingResult, **context: Any) -> GateResult:
         """
@@ -149,9 +382,49 @@ class ValidationGate:
         GateResult
             Validation result
         """
-        raise NotImplementedError
+        if type(self)._check is ValidationGate._check:
+            raise NotImplementedError
+        return self._check(result, _ValidationContext.from_kwargs(context))
+
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
+        """Check against a parsed context; defaults to check(**ctx.raw)."""
+        return self.check(result, **ctx.raw)
 
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        """
+        Check a batch of pricing results, returning status codes only.
 
+        The default loops over _check(); numeric gates override this with
+        array comparisons on ``fields``. Overrides must agree with check().
+
+        Parameters
+        ----------
+        results : Sequence[PricingResult]
+            Pricing results to validate
+        fields : BatchFields
+            Numeric fields of ``results``, extracted once per batch
+        ctx : _ValidationContext
+            Parsed context shared by the whole batch
+
+        Returns
+        -------
+        ndarray
+            GateStatus codes (int8, shape: [n_results])
+        """
+        return np.fromiter(
+            (self._check(r, ctx).status for r in results),
+            dtype=np.int8,
+            count=len(results),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class PresentValueBoundsGate(ValidationGate):
     """
     Check that present value is within reasonable bounds.
@@ -167,29 +440,23 @@ class PresentValueBoundsGate(ValidationGate):
 
     Previously: RILA pricer silently clipped PV to max(0.0, PV)
     Now: Negative PV surfaced here for explicit handling
+
+    Attributes
+    ----------
+    min_pv : float
+        Minimum allowed PV
+    max_pv_multiple : float
+        Maximum PV as multiple of premium (default 3x)
+        [F.4] Reduced from 10x to catch unreasonable valuations earlier
     """
 
     name = "present_value_bounds"
 
-    def __init__(
-        self,
-        min_pv: float = 0.0,
-        max_pv_multiple: float = 3.0,
-    ):
-        """
-        Parameters
-        ----------
-        min_pv : float
-            Minimum allowed PV
-        max_pv_multiple : float
-            Maximum PV as multiple of premium (default 3x)
-            [F.4] Reduced from 10x to catch unreasonable valuations earlier
-        """
-        self.min_pv = min_pv
-        self.max_pv_multiple = max_pv_multiple
+    min_pv: float = 0.0
+    max_pv_multiple: float = 3.0
 
-    def check(self, result: PricingResult, **context: Any) -> GateResult:
-        premium = context.get("premium", 100.0)
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
+        premium = ctx.premium
         max_pv = premium * self.max_pv_multiple
 
         if result.present_value < self.min_pv:
@@ -205,7 +472,7 @@ class PresentValueBoundsGate(ValidationGate):
             return GateResult(
                 status=GateStatus.HALT,
                 gate_name=self.name,
-                message=f"PV {result.present_value:.4f} exceeds {self.max_pv_multiple}x premium",
+                message=(f"PV {result.present_value:.4f} exceeds {self.max_pv_multiple}x premium"),
                 value=result.present_value,
                 threshold=max_pv,
             )
@@ -217,29 +484,36 @@ class PresentValueBoundsGate(ValidationGate):
             value=result.present_value,
         )
 
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        max_pv = ctx.premium * self.max_pv_multiple
+        pv = fields.present_value
+        return _status_codes((pv < self.min_pv) | (pv > max_pv))
 
+
+@dataclass(frozen=True, slots=True)
 class DurationBoundsGate(ValidationGate):
     """
     Check that duration is within reasonable bounds.
 
     [T1] Duration should be positive and not exceed term.
+
+    Attributes
+    ----------
+    max_duration : float
+        Maximum allowed duration in years
     """
 
     name = "duration_bounds"
 
-    def __init__(
-        self,
-        max_duration: float = 30.0,
-    ):
-        """
-        Parameters
-        ----------
-        max_duration : float
-            Maximum allowed duration in years
-        """
-        self.max_duration = max_duration
+    max_duration: float = 30.0
 
-    def check(self, result: PricingResult, **context: Any) -> GateResult:
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
         if result.duration is None:
             return GateResult(
                 status=GateStatus.PASS,
@@ -260,7 +534,7 @@ class DurationBoundsGate(ValidationGate):
             return GateResult(
                 status=GateStatus.HALT,
                 gate_name=self.name,
-                message=f"Duration {result.duration:.4f} exceeds maximum {self.max_duration}",
+                message=(f"Duration {result.duration:.4f} exceeds maximum {self.max_duration}"),
                 value=result.duration,
                 threshold=self.max_duration,
             )
@@ -272,31 +546,43 @@ class DurationBoundsGate(ValidationGate):
             value=result.duration,
         )
 
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        # Missing durations are NaN and compare False: PASS, as in check()
+        duration = fields.duration
+        return _status_codes((duration < 0) | (duration > self.max_duration))
+
 
+@dataclass(frozen=True, slots=True)
 class FIAOptionBudgetGate(ValidationGate):
     """
     Check FIA embedded option value against option budget.
 
     [T1] Option value should not exceed budget significantly.
     [F.4] Changed from WARN to HALT when budget exceeded by > tolerance.
+
+    Attributes
+    ----------
+    tolerance : float
+        Allowed excess over budget (0.10 = 10%)
+        [F.4] Reduced from 50% to fail fast on budget violations
     """
 
     name = "fia_option_budget"
+    applies_to = (FIAPricingResult,)
 
-    def __init__(
-        self,
-        tolerance: float = 0.10,  # 10% tolerance [F.4: tightened from 50%]
-    ):
-        """
-        Parameters
-        ----------
-        tolerance : float
-            Allowed excess over budget (0.10 = 10%)
-            [F.4] Reduced from 50% to fail fast on budget violations
-        """
-        self.tolerance = tolerance
+    tolerance: float = 0.10  # 10% tolerance [F.4: tightened from 50%]
+    _budget_multiplier: float = field(init=False, repr=False, compare=False)
 
-    def check(self, result: PricingResult, **context: Any) -> GateResult:
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_budget_multiplier", 1.0 + self.tolerance)
+
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
         if not isinstance(result, FIAPricingResult):
             return GateResult(
                 status=GateStatus.PASS,
@@ -312,16 +598,20 @@ class FIAOptionBudgetGate(ValidationGate):
                 value=result.option_budget,
             )
 
+        # Compare against the scaled budget; the ratio is only reported
+        over_budget = result.embedded_option_value > result.option_budget * self._budget_multiplier
         ratio = result.embedded_option_value / result.option_budget
 
-        if ratio > 1 + self.tolerance:
+        if over_budget:
             return GateResult(
                 status=GateStatus.HALT,  # [F.4] Changed from WARN
                 gate_name=self.name,
-                message=f"Embedded option value {result.embedded_option_value:.4f} "
-                f"exceeds budget {result.option_budget:.4f} by {(ratio - 1) * 100:.1f}%",
+                message=(
+                    f"Embedded option value {result.embedded_option_value:.4f} "
+                    f"exceeds budget {result.option_budget:.4f} by {(ratio - 1) * 100:.1f}%"
+                ),
                 value=ratio,
-                threshold=1 + self.tolerance,
+                threshold=self._budget_multiplier,
             )
 
         return GateResult(
@@ -331,7 +621,19 @@ class FIAOptionBudgetGate(ValidationGate):
             value=ratio,
         )
 
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        budget = fields.option_budget
+        over_budget = fields.embedded_option_value > budget * self._budget_multiplier
+        return _status_codes(fields.is_fia & ((budget <= 0) | over_budget))
+
 
+@dataclass(frozen=True, slots=True)
 class FIAExpectedCreditGate(ValidationGate):
     """
     Check FIA expected credit is non-negative and bounded.
@@ -341,8 +643,9 @@ class FIAExpectedCreditGate(ValidationGate):
     """
 
     name = "fia_expected_credit"
+    applies_to = (FIAPricingResult,)
 
-    def check(self, result: PricingResult, **context: Any) -> GateResult:
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
         if not isinstance(result, FIAPricingResult):
             return GateResult(
                 status=GateStatus.PASS,
@@ -354,20 +657,22 @@ class FIAExpectedCreditGate(ValidationGate):
             return GateResult(
                 status=GateStatus.HALT,
                 gate_name=self.name,
-                message=f"Expected credit {result.expected_credit:.4f} is negative "
-                "(violates 0% floor)",
+                message=(
+                    f"Expected credit {result.expected_credit:.4f} is negative (violates 0% floor)"
+                ),
                 value=result.expected_credit,
                 threshold=0.0,
             )
 
         # Get cap from context if available
-        cap_rate = context.get("cap_rate")
+        cap_rate = ctx.cap_rate
         if cap_rate is not None and result.expected_credit > cap_rate + 0.02:
             return GateResult(
                 status=GateStatus.HALT,
                 gate_name=self.name,
-                message=f"Expected credit {result.expected_credit:.4f} exceeds "
-                f"cap rate {cap_rate:.4f}",
+                message=(
+                    f"Expected credit {result.expected_credit:.4f} exceeds cap rate {cap_rate:.4f}"
+                ),
                 value=result.expected_credit,
                 threshold=cap_rate,
             )
@@ -379,7 +684,22 @@ class FIAExpectedCreditGate(ValidationGate):
             value=result.expected_credit,
         )
 
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        credit = fields.expected_credit
+        halt = credit < -0.001
+        cap_rate = ctx.cap_rate
+        if cap_rate is not None:
+            halt |= credit > cap_rate + 0.02
+        return _status_codes(fields.is_fia & halt)
+
 
+@dataclass(frozen=True, slots=True)
 class RILAMaxLossGate(ValidationGate):
     """
     Check RILA max loss is consistent with protection type.
@@ -389,8 +709,9 @@ class RILAMaxLossGate(ValidationGate):
     """
 
     name = "rila_max_loss"
+    applies_to = (RILAPricingResult,)
 
-    def check(self, result: PricingResult, **context: Any) -> GateResult:
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
         if not isinstance(result, RILAPricingResult):
             return GateResult(
                 status=GateStatus.PASS,
@@ -417,7 +738,7 @@ class RILAMaxLossGate(ValidationGate):
             )
 
         # Verify consistency with protection type
-        buffer_rate = context.get("buffer_rate")
+        buffer_rate = ctx.buffer_rate
         if buffer_rate is not None:
             if result.protection_type == "buffer":
                 expected_max_loss = 1.0 - buffer_rate
@@ -425,8 +746,10 @@ class RILAMaxLossGate(ValidationGate):
                     return GateResult(
                         status=GateStatus.WARN,
                         gate_name=self.name,
-                        message=f"Buffer max loss {result.max_loss:.4f} doesn't match "
-                        f"expected {expected_max_loss:.4f}",
+                        message=(
+                            f"Buffer max loss {result.max_loss:.4f} doesn't match "
+                            f"expected {expected_max_loss:.4f}"
+                        ),
                         value=result.max_loss,
                         threshold=expected_max_loss,
                     )
@@ -435,8 +758,10 @@ class RILAMaxLossGate(ValidationGate):
                     return GateResult(
                         status=GateStatus.WARN,
                         gate_name=self.name,
-                        message=f"Floor max loss {result.max_loss:.4f} doesn't match "
-                        f"floor rate {buffer_rate:.4f}",
+                        message=(
+                            f"Floor max loss {result.max_loss:.4f} doesn't match "
+                            f"floor rate {buffer_rate:.4f}"
+                        ),
                         value=result.max_loss,
                         threshold=buffer_rate,
                     )
@@ -448,30 +773,46 @@ class RILAMaxLossGate(ValidationGate):
             value=result.max_loss,
         )
 
-
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        max_loss = fields.max_loss
+        halt = fields.is_rila & ((max_loss < 0) | (max_loss > 1.0))
+        buffer_rate = ctx.buffer_rate
+        if buffer_rate is None:
+            return _status_codes(halt)
+
+        # Select the expected max loss per protection type, then compare once
+        expected = np.where(fields.is_buffer, 1.0 - buffer_rate, buffer_rate)
+        checked = fields.is_rila & (fields.is_buffer | fields.is_floor)
+        warn = checked & (np.abs(max_loss - expected) > 0.01)
+        return _status_codes(halt, warn)
+
+
+@dataclass(frozen=True, slots=True)
 class RILAProtectionValueGate(ValidationGate):
     """
     Check RILA protection value is positive and bounded.
 
     [T1] Protection should have positive value.
     [T1] Protection value shouldn't exceed premium significantly.
+
+    Attributes
+    ----------
+    max_protection_pct : float
+        Maximum protection value as percentage of premium
     """
 
     name = "rila_protection_value"
+    applies_to = (RILAPricingResult,)
 
-    def __init__(
-        self,
-        max_protection_pct: float = 0.50,  # 50% of premium
-    ):
-        """
-        Parameters
-        ----------
-        max_protection_pct : float
-            Maximum protection value as percentage of premium
-        """
-        self.max_protection_pct = max_protection_pct
+    max_protection_pct: float = 0.50  # 50% of premium
 
-    def check(self, result: PricingResult, **context: Any) -> GateResult:
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
         if not isinstance(result, RILAPricingResult):
             return GateResult(
                 status=GateStatus.PASS,
@@ -488,15 +829,17 @@ class RILAProtectionValueGate(ValidationGate):
                 threshold=0.0,
             )
 
-        premium = context.get("premium", 100.0)
+        premium = ctx.premium
         max_protection = premium * self.max_protection_pct
 
         if result.protection_value > max_protection:
             return GateResult(
                 status=GateStatus.WARN,
                 gate_name=self.name,
-                message=f"Protection value {result.protection_value:.4f} exceeds "
-                f"{self.max_protection_pct * 100:.0f}% of premium",
+                message=(
+                    f"Protection value {result.protection_value:.4f} exceeds "
+                    f"{self.max_protection_pct * 100:.0f}% of premium"
+                ),
                 value=result.protection_value,
                 threshold=max_protection,
             )
@@ -508,7 +851,21 @@ class RILAProtectionValueGate(ValidationGate):
             value=result.protection_value,
         )
 
-
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        max_protection = ctx.premium * self.max_protection_pct
+        protection = fields.protection_value
+        halt = fields.is_rila & (protection < 0)
+        warn = fields.is_rila & (protection > max_protection)
+        return _status_codes(halt, warn)
+
+
+@dataclass(frozen=True, slots=True)
 class ArbitrageBoundsGate(ValidationGate):
     """
     Check for no-arbitrage violations.
@@ -518,42 +875,86 @@ class ArbitrageBoundsGate(ValidationGate):
     """
 
     name = "arbitrage_bounds"
+    applies_to = (FIAPricingResult, RILAPricingResult)
+
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
+        premium = ctx.premium
+
+        # Exact-type dispatch to the per-product check; subclasses fall back
+        # to isinstance, other results have nothing to check
+        product_check = self._product_checks.get(type(result))
+        if product_check is None:
+            product_check = next(
+                (c for t, c in self._product_checks.items() if isinstance(result, t)),
+                None,
+            )
+        halt = product_check(self, result, premium) if product_check else None
+        return halt or self._pass_result
 
-    def check(self, result: PricingResult, **context: Any) -> GateResult:
-        premium = context.get("premium", 100.0)
-
-        if isinstance(result, FIAPricingResult):
-            # Check option value doesn't exceed premium
-            if result.embedded_option_value > premium:
-                return GateResult(
-                    status=GateStatus.HALT,
-                    gate_name=self.name,
-                    message=f"Option value {result.embedded_option_value:.4f} exceeds "
-                    f"premium {premium:.4f} (arbitrage violation)",
-                    value=result.embedded_option_value,
-                    threshold=premium,
-                )
+    def _check_fia(self, result: FIAPricingResult, premium: float) -> GateResult | None:
+        """Option value must not exceed the premium."""
+        if result.embedded_option_value > premium:
+            return GateResult(
+                status=GateStatus.HALT,
+                gate_name=self.name,
+                message=(
+                    f"Option value {result.embedded_option_value:.4f} exceeds "
+                    f"premium {premium:.4f} (arbitrage violation)"
+                ),
+                value=result.embedded_option_value,
+                threshold=premium,
+            )
+        return None
 
-        elif isinstance(result, RILAPricingResult):
-            # Check protection value doesn't exceed max potential loss
-            max_loss_value = premium * result.max_loss if result.max_loss else premium
-            if result.protection_value > max_loss_value:
-                return GateResult(
-                    status=GateStatus.HALT,
-                    gate_name=self.name,
-                    message=f"Protection value {result.protection_value:.4f} exceeds "
-                    f"max loss value {max_loss_value:.4f}",
-                    value=result.protection_value,
-                    threshold=max_loss_value,
-                )
+    def _check_rila(self, result: RILAPricingResult, premium: float) -> GateResult | None:
+        """Protection value must not exceed the maximum potential loss."""
+        max_loss_value = premium * result.max_loss if result.max_loss else premium
+        if result.protection_value > max_loss_value:
+            return GateResult(
+                status=GateStatus.HALT,
+                gate_name=self.name,
+                message=(
+                    f"Protection value {result.protection_value:.4f} exceeds "
+                    f"max loss value {max_loss_value:.4f}"
+                ),
+                value=result.protection_value,
+                threshold=max_loss_value,
+            )
+        return None
 
-        return GateResult(
+    _product_checks: ClassVar[dict[type, Callable[..., GateResult | None]]] = {
+        FIAPricingResult: _check_fia,
+        RILAPricingResult: _check_rila,
+    }
+
+    # Shared PASS result (immutable, carries no per-result value)
+    _pass_result: GateResult = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        pass_result = GateResult(
             status=GateStatus.PASS,
             gate_name=self.name,
             message="No arbitrage violations detected",
         )
+        object.__setattr__(self, "_pass_result", pass_result)
+
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        premium = ctx.premium
+        # A zero max loss falls back to the full premium, as in check()
+        max_loss_value = np.where(fields.max_loss != 0, premium * fields.max_loss, premium)
+        halt = (fields.is_fia & (fields.embedded_option_value > premium)) | (
+            fields.is_rila & (fields.protection_value > max_loss_value)
+        )
+        return _status_codes(halt)
 
 
+@dataclass(frozen=True, slots=True)
 class ProductParameterSanityGate(ValidationGate):
     """
     Check product parameters are within reasonable bounds.
@@ -574,7 +975,7 @@ class ProductParameterSanityGate(ValidationGate):
     MAX_BUFFER_RATE = 0.30  # 30%
     MAX_SPREAD_RATE = 0.10  # 10%
 
-    def check(self, result: PricingResult, **context: Any) -> GateResult:
+    def _check(self, result: PricingResult, ctx: _ValidationContext, /) -> GateResult:
         """
         Check product parameters from context.
 
@@ -584,7 +985,7 @@ class ProductParameterSanityGate(ValidationGate):
         issues = []
 
         # Check cap rate
-        cap_rate = context.get("cap_rate")
+        cap_rate = ctx.cap_rate
         if cap_rate is not None:
             if cap_rate < 0:
                 issues.append(f"cap_rate {cap_rate:.4f} is negative")
@@ -592,7 +993,7 @@ class ProductParameterSanityGate(ValidationGate):
                 issues.append(f"cap_rate {cap_rate:.4f} exceeds maximum {self.MAX_CAP_RATE:.0%}")
 
         # Check participation rate
-        participation_rate = context.get("participation_rate")
+        participation_rate = ctx.participation_rate
         if participation_rate is not None:
             if participation_rate <= 0:
                 issues.append(f"participation_rate {participation_rate:.4f} must be > 0")
@@ -603,7 +1004,7 @@ class ProductParameterSanityGate(ValidationGate):
                 )
 
         # Check buffer rate (used for both buffer and floor protection levels)
-        buffer_rate = context.get("buffer_rate")
+        buffer_rate = ctx.buffer_rate
         if buffer_rate is not None:
             if buffer_rate < 0:
                 issues.append(f"buffer_rate {buffer_rate:.4f} is negative")
@@ -613,7 +1014,7 @@ class ProductParameterSanityGate(ValidationGate):
                 )
 
         # Check spread rate
-        spread_rate = context.get("spread_rate")
+        spread_rate = ctx.spread_rate
         if spread_rate is not None:
             if spread_rate < 0:
                 issues.append(f"spread_rate {spread_rate:.4f} is negative")
@@ -636,6 +1037,18 @@ class ProductParameterSanityGate(ValidationGate):
             message="Product parameters within sanity bounds",
         )
 
+    def check_batch(
+        self,
+        results: Sequence[PricingResult],
+        fields: BatchFields,
+        ctx: _ValidationContext,
+        /,
+    ) -> np.ndarray:
+        # Depends only on the shared context: check once, broadcast to the batch
+        if not results:
+            return np.empty(0, dtype=np.int8)
+        return np.full(len(results), self._check(results[0], ctx).status, dtype=np.int8)
+
 
 # =============================================================================
 # Validation Engine
@@ -672,6 +1085,35 @@ class ValidationEngine:
             gates = self._default_gates()
         self.gates = gates
 
+    @property
+    def gates(self) -> list[ValidationGate]:
+        """Configured gates, in evaluation order."""
+        return self._gates
+
+    @gates.setter
+    def gates(self, gates: list[ValidationGate]) -> None:
+        self._gates = gates
+        # Type dispatch table: applicable gates per result type. The product
+        # result types are built up front; other subclasses on first use.
+        self._gates_by_type: dict[type, tuple[ValidationGate, ...]] = {}
+        self._gates_snapshot: tuple[ValidationGate, ...] = tuple(gates)
+        for result_type in (PricingResult, FIAPricingResult, RILAPricingResult):
+            self._gates_for(result_type)
+
+    def _gates_for(self, result_type: type) -> tuple[ValidationGate, ...]:
+        """Gates that apply to a result type, cached per type."""
+        # The gate list can be mutated in place; rebuild the table if it was
+        current = tuple(self._gates)
+        if current != self._gates_snapshot:
+            self._gates_snapshot = current
+            self._gates_by_type = {}
+
+        gates = self._gates_by_type.get(result_type)
+        if gates is None:
+            gates = tuple(g for g in self._gates if issubclass(result_type, g.applies_to))
+            self._gates_by_type[result_type] = gates
+        return gates
+
     def _default_gates(self) -> list[ValidationGate]:
         """Create default set of validation gates."""
         return [
@@ -688,30 +1130,80 @@ class ValidationEngine:
     def validate(
         self,
         result: PricingResult,
+        *,
+        stop_on_halt: bool = False,
         **context: Any,
     ) -> ValidationReport:
         """
-        Run all validation gates on a pricing result.
+        Run the validation gates that apply to a pricing result.
+
+        Gates whose ``applies_to`` excludes the result's type are skipped
+        (e.g. FIA gates for a RILA result).
 
         Parameters
         ----------
         result : PricingResult
             Pricing result to validate
+        stop_on_halt : bool, default False
+            Stop at the first HALT; the report then ends with that gate
         **context : Any
             Additional context for validation
 
         Returns
         -------
         ValidationReport
-            Complete validation report
+            Validation report
         """
+        ctx = _ValidationContext.from_kwargs(context)
         results = []
-        for gate in self.gates:
-            gate_result = gate.check(result, **context)
+        for gate in self._gates_for(type(result)):
+            gate_result = gate._check(result, ctx)
             results.append(gate_result)
+            if stop_on_halt and gate_result.status == GateStatus.HALT:
+                break
 
         return ValidationReport(results=tuple(results))
 
+    def validate_batch(
+        self,
+        results: Sequence[PricingResult],
+        **context: Any,
+    ) -> BatchValidationReport:
+        """
+        Run all validation gates on a batch of pricing results.
+
+        Numeric fields are extracted once into arrays and each gate checks
+        the whole batch with array comparisons. Full GateResults (with
+        messages) are only built for HALT/WARN entries.
+
+        Parameters
+        ----------
+        results : Sequence[PricingResult]
+            Pricing results to validate
+        **context : Any
+            Additional context, shared by every result in the batch
+
+        Returns
+        -------
+        BatchValidationReport
+            Status codes for every result and gate, plus flagged details
+        """
+        ctx = _ValidationContext.from_kwargs(context)
+        fields = BatchFields.from_results(results)
+        status = np.empty((len(results), len(self.gates)), dtype=np.int8)
+        for j, gate in enumerate(self.gates):
+            status[:, j] = gate.check_batch(results, fields, ctx)
+
+        flagged: dict[int, list[GateResult]] = {}
+        for i, j in zip(*np.nonzero(status), strict=True):
+            flagged.setdefault(int(i), []).append(self.gates[j]._check(results[i], ctx))
+
+        return BatchValidationReport(
+            gate_names=tuple(gate.name for gate in self.gates),
+            status=status,
+            flagged={i: tuple(gate_results) for i, gate_results in flagged.items()},
+        )
+
     def validate_and_raise(
         self,
         result: PricingResult,
@@ -734,17 +1226,14 @@ class ValidationEngine:
 
         Raises
         ------
-        ValueError
-            If any gate HALTs
+        ValidationError
+            If any gate HALTs (reports every HALT in gate order).
+            Subclass of ValueError.
         """
         report = self.validate(result, **context)
 
         if not report.passed:
-            halt_messages = [g.message for g in report.halted_gates]
-            raise ValueError(
-                "CRITICAL: Validation failed. HALTs:\n"
-                + "\n".join(f"  - {m}" for m in halt_messages)
-            )
+            raise ValidationError(report)
 
         return result
 
@@ -804,8 +1293,8 @@ def ensure_valid(
 
     Raises
     ------
-    ValueError
-        If validation fails
+    ValidationError
+        If validation fails (subclass of ValueError)
 
     Examples
     --------
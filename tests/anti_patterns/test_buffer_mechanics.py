@@ -12,6 +12,8 @@ See: docs/knowledge/domain/buffer_floor.md
 
 import pytest
 
+from annuity_pricing.options.payoffs.kernels import buffer_payoff, floor_payoff
+
 
 class TestBufferMechanics:
     """Test RILA buffer payoff mechanics."""
@@ -27,15 +29,6 @@ class TestBufferMechanics:
         - -15% return → -5% loss (client absorbs 15%-10%)
         """
 
-        def buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
-            """RILA buffer payoff."""
-            if index_return >= 0:
-                return min(index_return, cap)
-            elif index_return >= -buffer:
-                return 0.0  # Buffer absorbs
-            else:
-                return index_return + buffer  # Client absorbs excess
-
         buffer = 0.10  # 10% buffer
         cap = 0.15  # 15% cap
 
@@ -50,13 +43,13 @@ class TestBufferMechanics:
         # Client absorbs losses beyond buffer
         result = buffer_payoff(-0.15, buffer, cap)
         expected = -0.05  # -15% + 10% buffer = -5%
-        assert abs(result - expected) < 1e-10, (
+        assert result == pytest.approx(expected, rel=1e-9, abs=1e-12), (
             f"Client should absorb -5% (15% loss - 10% buffer), got {result}"
         )
 
         result = buffer_payoff(-0.25, buffer, cap)
         expected = -0.15  # -25% + 10% buffer = -15%
-        assert abs(result - expected) < 1e-10, (
+        assert result == pytest.approx(expected, rel=1e-9, abs=1e-12), (
             f"Client should absorb -15% (25% loss - 10% buffer), got {result}"
         )
 
@@ -66,14 +59,6 @@ class TestBufferMechanics:
         [T1] Buffer products have capped upside.
         """
 
-        def buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
-            if index_return >= 0:
-                return min(index_return, cap)
-            elif index_return >= -buffer:
-                return 0.0
-            else:
-                return index_return + buffer
-
         buffer = 0.10
         cap = 0.12
 
@@ -88,14 +73,6 @@ class TestBufferMechanics:
         [T1] Zero return should result in zero payoff.
         """
 
-        def buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
-            if index_return >= 0:
-                return min(index_return, cap)
-            elif index_return >= -buffer:
-                return 0.0
-            else:
-                return index_return + buffer
-
         assert buffer_payoff(0.0, 0.10, 0.15) == 0.0
 
     @pytest.mark.anti_pattern
@@ -104,14 +81,6 @@ class TestBufferMechanics:
         [T1] Test exact boundary conditions for buffer.
         """
 
-        def buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
-            if index_return >= 0:
-                return min(index_return, cap)
-            elif index_return >= -buffer:
-                return 0.0
-            else:
-                return index_return + buffer
-
         buffer = 0.10
 
         # Exactly at buffer boundary
@@ -129,27 +98,19 @@ class TestBufferMechanics:
         Common buffers: 10%, 15%, 20%
         """
 
-        def buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
-            if index_return >= 0:
-                return min(index_return, cap)
-            elif index_return >= -buffer:
-                return 0.0
-            else:
-                return index_return + buffer
-
         cap = 0.15
 
         # 10% buffer
         assert buffer_payoff(-0.08, 0.10, cap) == 0.0
-        assert abs(buffer_payoff(-0.12, 0.10, cap) - (-0.02)) < 1e-10
+        assert buffer_payoff(-0.12, 0.10, cap) == pytest.approx(-0.02, rel=1e-9, abs=1e-12)
 
         # 15% buffer
         assert buffer_payoff(-0.12, 0.15, cap) == 0.0
-        assert abs(buffer_payoff(-0.18, 0.15, cap) - (-0.03)) < 1e-10
+        assert buffer_payoff(-0.18, 0.15, cap) == pytest.approx(-0.03, rel=1e-9, abs=1e-12)
 
         # 20% buffer
         assert buffer_payoff(-0.18, 0.20, cap) == 0.0
-        assert abs(buffer_payoff(-0.25, 0.20, cap) - (-0.05)) < 1e-10
+        assert buffer_payoff(-0.25, 0.20, cap) == pytest.approx(-0.05, rel=1e-9, abs=1e-12)
 
 
 class TestFloorMechanics:
@@ -166,13 +127,6 @@ class TestFloorMechanics:
         - -25% return → -10% loss (floor limits)
         """
 
-        def floor_payoff(index_return: float, floor: float, cap: float) -> float:
-            """RILA floor payoff."""
-            if index_return >= 0:
-                return min(index_return, cap)
-            else:
-                return max(index_return, -floor)
-
         floor = 0.10  # -10% floor
         cap = 0.15
 
@@ -192,12 +146,6 @@ class TestFloorMechanics:
         [T1] Floor products also have capped upside.
         """
 
-        def floor_payoff(index_return: float, floor: float, cap: float) -> float:
-            if index_return >= 0:
-                return min(index_return, cap)
-            else:
-                return max(index_return, -floor)
-
         floor = 0.10
         cap = 0.12
 
@@ -217,20 +165,6 @@ class TestBufferVsFloor:
         Floor: Protects against LARGE losses
         """
 
-        def buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
-            if index_return >= 0:
-                return min(index_return, cap)
-            elif index_return >= -buffer:
-                return 0.0
-            else:
-                return index_return + buffer
-
-        def floor_payoff(index_return: float, floor: float, cap: float) -> float:
-            if index_return >= 0:
-                return min(index_return, cap)
-            else:
-                return max(index_return, -floor)
-
         # Same parameters
         protection = 0.10
         cap = 0.15
@@ -16,8 +16,13 @@ See: METHODOLOGY.md Section 1.2 (FIA), Section 1.3 (RILA)
 See: docs/knowledge/domain/buffer_floor.md
 """
 
+import math
+
 import pytest
 
+from annuity_pricing.options.payoffs.fia import FIA_FLOOR
+from annuity_pricing.options.payoffs.kernels import buffer_payoff, cap_payoff
+
 
 class TestBufferVsFloor:
     """Ensure buffer and floor mechanics are NOT confused."""
@@ -31,22 +36,7 @@ class TestBufferVsFloor:
         Floor (FIA): Client credited rate is floored at 0%, never negative
         """
 
-        def buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
-            """RILA buffer: absorbs first X% of losses."""
-            if index_return >= 0:
-                return min(index_return, cap)
-            elif index_return >= -buffer:
-                return 0.0  # Buffer absorbs loss
-            else:
-                return index_return + buffer  # Client absorbs excess
-
-        def floor_payoff(index_return: float, floor: float, cap: float) -> float:
-            """FIA floor: minimum credited rate."""
-            credited = min(index_return, cap) if index_return > 0 else 0.0
-            return max(credited, floor)
-
         buffer = 0.10  # 10% buffer
-        floor = 0.00  # 0% floor (standard FIA)
         cap = 0.12  # 12% cap
 
         # Case 1: -5% return (loss within buffer)
@@ -54,7 +44,7 @@ class TestBufferVsFloor:
         # Floor: floor at 0% → client credited 0%
         # Both give 0%, but for DIFFERENT reasons
         buffer_result = buffer_payoff(-0.05, buffer, cap)
-        floor_result = floor_payoff(-0.05, floor, cap)
+        floor_result = cap_payoff(-0.05, cap, FIA_FLOOR)
         assert buffer_result == 0.0, "Buffer should absorb -5% loss"
         assert floor_result == 0.0, "Floor should set minimum at 0%"
 
@@ -62,7 +52,7 @@ class TestBufferVsFloor:
         # Buffer: absorbs first 10%, client loses 5% → -0.05
         # Floor: floor at 0% → client credited 0% (NOT -5%)
         buffer_result_beyond = buffer_payoff(-0.15, buffer, cap)
-        floor_result_beyond = floor_payoff(-0.15, floor, cap)
+        floor_result_beyond = cap_payoff(-0.15, cap, FIA_FLOOR)
 
         assert buffer_result_beyond == pytest.approx(-0.05, abs=1e-10), (
             "Buffer: client should lose 5% (15% loss - 10% buffer absorbed)"
@@ -83,14 +73,6 @@ class TestBufferVsFloor:
         This is fundamentally different from a floor which protects from ALL loss.
         """
 
-        def buffer_payoff(index_return: float, buffer: float) -> float:
-            if index_return >= 0:
-                return index_return
-            elif index_return >= -buffer:
-                return 0.0
-            else:
-                return index_return + buffer
-
         buffer = 0.10  # 10% buffer
 
         # Test various loss levels
@@ -104,7 +86,7 @@ class TestBufferVsFloor:
         ]
 
         for index_return, expected_loss in test_cases:
-            result = buffer_payoff(index_return, buffer)
+            result = buffer_payoff(index_return, buffer, math.inf)
             assert result == pytest.approx(expected_loss, abs=1e-10), (
                 f"Buffer payoff incorrect: "
                 f"index_return={index_return}, buffer={buffer}, "
@@ -126,16 +108,11 @@ class TestBufferVsFloor:
         Unlike buffer, floor is an absolute minimum regardless of loss magnitude.
         """
 
-        def floor_payoff(index_return: float, floor: float = 0.0) -> float:
-            if index_return > 0:
-                return index_return  # No cap for simplicity
-            return floor
-
         # Test various loss levels - floor ALWAYS protects
         loss_scenarios = [-0.05, -0.10, -0.20, -0.30, -0.50, -0.80, -0.99]
 
         for loss in loss_scenarios:
-            result = floor_payoff(loss, floor=0.0)
+            result = cap_payoff(loss, math.inf, FIA_FLOOR)
             assert result >= 0, (
                 f"FLOOR VIOLATION: Floor must protect from ALL loss! "
                 f"index_return={loss}, result={result}"
@@ -151,19 +128,6 @@ class TestBufferVsFloor:
         Floor:  Unlimited protection → client never loses (but limited upside)
         """
 
-        def buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
-            if index_return >= 0:
-                return min(index_return, cap)
-            elif index_return >= -buffer:
-                return 0.0
-            else:
-                return index_return + buffer
-
-        def floor_payoff(index_return: float, cap: float) -> float:
-            if index_return > 0:
-                return min(index_return, cap)
-            return 0.0  # 0% floor
-
         buffer = 0.10
         cap = 0.12
 
@@ -171,7 +135,7 @@ class TestBufferVsFloor:
         crash_return = -0.40
 
         buffer_in_crash = buffer_payoff(crash_return, buffer, cap)
-        floor_in_crash = floor_payoff(crash_return, cap)
+        floor_in_crash = cap_payoff(crash_return, cap, FIA_FLOOR)
 
         # Buffer client loses 30% (-40% + 10% buffer)
         assert buffer_in_crash == pytest.approx(-0.30, abs=1e-10), (
@@ -228,30 +192,20 @@ class TestBufferVsFloor:
         Once loss exceeds buffer, results diverge significantly.
         """
 
-        def buffer_payoff(ret: float, buf: float) -> float:
-            if ret >= 0:
-                return ret
-            elif ret >= -buf:
-                return 0.0
-            return ret + buf
-
-        def floor_payoff(ret: float) -> float:
-            return max(ret, 0.0)
-
         buffer = 0.15  # 15% buffer
 
         # Within buffer: same result
         within_buffer_returns = [-0.05, -0.10, -0.15]
         for ret in within_buffer_returns:
-            buf_result = buffer_payoff(ret, buffer)
-            floor_result = floor_payoff(ret)
+            buf_result = buffer_payoff(ret, buffer, math.inf)
+            floor_result = cap_payoff(ret, math.inf, FIA_FLOOR)
             assert buf_result == floor_result == 0.0, f"Within buffer ({ret}), both should give 0%"
 
         # Beyond buffer: DIFFERENT results
         beyond_buffer_returns = [-0.20, -0.30, -0.50]
         for ret in beyond_buffer_returns:
-            buf_result = buffer_payoff(ret, buffer)
-            floor_result = floor_payoff(ret)
+            buf_result = buffer_payoff(ret, buffer, math.inf)
+            floor_result = cap_payoff(ret, math.inf, FIA_FLOOR)
             assert buf_result < 0, f"Buffer should show loss for {ret}"
             assert floor_result == 0, f"Floor should still be 0% for {ret}"
             assert buf_result != floor_result, (
@@ -10,172 +10,204 @@ See: METHODOLOGY.md Section 1.2
 See: docs/knowledge/domain/crediting_methods.md
 """
 
+import numpy as np
 import pytest
 
+from annuity_pricing.options.payoffs.fia import (
+    FIA_FLOOR,
+    CappedCallPayoff,
+    MonthlyAveragePayoff,
+    ParticipationPayoff,
+    SpreadPayoff,
+    TriggerPayoff,
+)
+from annuity_pricing.options.payoffs.kernels import (
+    cap_payoff,
+    cap_payoff_vec,
+    participation_payoff,
+    participation_payoff_vec,
+    spread_payoff,
+    spread_payoff_vec,
+    trigger_payoff,
+    trigger_payoff_vec,
+)
+
+# Production default: a flat (0%) return meets the trigger
+TRIGGER_THRESHOLD = TriggerPayoff(trigger_rate=0.05).trigger_threshold
+
+# (index_return, cap, expected)
+CAP_CASES = [
+    (-0.20, 0.08, 0.0),  # -20% return → 0%
+    (-0.10, 0.08, 0.0),  # -10% return → 0%
+    (-0.05, 0.08, 0.0),  # -5% return → 0%
+    (-0.01, 0.08, 0.0),  # -1% return → 0%
+    (0.00, 0.08, 0.0),  # 0% return → 0%
+    (0.05, 0.08, 0.05),  # 5% return → 5%
+    (0.10, 0.08, 0.08),  # 10% return → 8% (capped)
+    (0.20, 0.08, 0.08),  # 20% return → 8% (capped)
+]
+
+# (index_return, participation, expected)
+PARTICIPATION_CASES = [
+    (-0.20, 0.80, 0.0),  # -20% * 80% = -16% → 0%
+    (-0.10, 0.80, 0.0),  # -10% * 80% = -8% → 0%
+    (-0.05, 1.00, 0.0),  # -5% * 100% = -5% → 0%
+    (0.00, 0.80, 0.0),  # 0% * 80% = 0%
+    (0.10, 0.80, 0.08),  # 10% * 80% = 8%
+    (0.10, 1.20, 0.12),  # 10% * 120% = 12% (>100% participation)
+]
+
+# (index_return, spread, expected)
+SPREAD_CASES = [
+    (-0.20, 0.02, 0.0),  # -20% - 2% = -22% → 0%
+    (-0.05, 0.02, 0.0),  # -5% - 2% = -7% → 0%
+    (0.01, 0.02, 0.0),  # 1% - 2% = -1% → 0%
+    (0.02, 0.02, 0.0),  # 2% - 2% = 0%
+    (0.05, 0.02, 0.03),  # 5% - 2% = 3%
+    (0.10, 0.02, 0.08),  # 10% - 2% = 8%
+]
+
+# (index_return, trigger_rate, expected)
+TRIGGER_CASES = [
+    (-0.20, 0.05, 0.0),  # negative → 0%
+    (-0.01, 0.05, 0.0),  # negative → 0%
+    (0.00, 0.05, 0.05),  # zero → trigger rate (threshold is inclusive)
+    (0.001, 0.05, 0.05),  # positive → trigger rate
+    (0.10, 0.05, 0.05),  # positive → trigger rate
+    (0.50, 0.05, 0.05),  # positive → trigger rate (same)
+]
+
+# (index_return, cap, participation, expected)
+CAP_PARTICIPATION_CASES = [
+    (-0.20, 0.10, 0.80, 0.0),  # negative → 0%
+    (0.10, 0.10, 0.80, 0.08),  # 10% * 80% = 8%
+    (0.20, 0.10, 0.80, 0.10),  # 20% * 80% = 16% → 10% (capped)
+]
+
+# Array kernel per case table, taking the table's input columns
+ARRAY_KERNELS = {
+    "cap": (CAP_CASES, lambda r, cap: cap_payoff_vec(r, cap, FIA_FLOOR)),
+    "participation": (
+        PARTICIPATION_CASES,
+        lambda r, participation: participation_payoff_vec(r, participation, np.inf, FIA_FLOOR),
+    ),
+    "spread": (SPREAD_CASES, lambda r, spread: spread_payoff_vec(r, spread, np.inf, FIA_FLOOR)),
+    "trigger": (
+        TRIGGER_CASES,
+        lambda r, rate: trigger_payoff_vec(r, rate, TRIGGER_THRESHOLD, FIA_FLOOR),
+    ),
+    "cap_participation": (
+        CAP_PARTICIPATION_CASES,
+        lambda r, cap, participation: participation_payoff_vec(r, participation, cap, FIA_FLOOR),
+    ),
+}
+
 
 class TestFIAFloorEnforcement:
     """Test that FIA crediting never goes negative."""
 
     @pytest.mark.anti_pattern
-    def test_cap_rate_floor(self) -> None:
+    @pytest.mark.parametrize("index_return,cap,expected", CAP_CASES)
+    def test_cap_rate_floor(self, index_return: float, cap: float, expected: float) -> None:
         """
         [T1] Cap rate crediting must enforce 0% floor.
 
         negative index return → 0% credited (not negative)
         """
-
-        # Define expected behavior (implementation will follow)
-        def cap_crediting(index_return: float, cap: float) -> float:
-            """Cap rate crediting with floor."""
-            return min(max(index_return, 0), cap)
-
-        # Test cases
-        test_cases = [
-            (-0.20, 0.08, 0.0),  # -20% return → 0%
-            (-0.10, 0.08, 0.0),  # -10% return → 0%
-            (-0.05, 0.08, 0.0),  # -5% return → 0%
-            (-0.01, 0.08, 0.0),  # -1% return → 0%
-            (0.00, 0.08, 0.0),  # 0% return → 0%
-            (0.05, 0.08, 0.05),  # 5% return → 5%
-            (0.10, 0.08, 0.08),  # 10% return → 8% (capped)
-            (0.20, 0.08, 0.08),  # 20% return → 8% (capped)
-        ]
-
-        for index_return, cap, expected in test_cases:
-            result = cap_crediting(index_return, cap)
-            assert result >= 0, (
-                f"FLOOR VIOLATION: Cap crediting returned {result} for "
-                f"index_return={index_return}. FIA floor is 0%."
-            )
-            assert abs(result - expected) < 1e-10, (
-                f"Cap crediting error: got {result}, expected {expected}"
-            )
+        result = cap_payoff(index_return, cap, FIA_FLOOR)
+        assert result >= 0, "FLOOR VIOLATION: FIA floor is 0%"
+        assert result == pytest.approx(expected, rel=1e-9, abs=1e-12)
 
     @pytest.mark.anti_pattern
-    def test_participation_rate_floor(self) -> None:
+    @pytest.mark.parametrize("index_return,participation,expected", PARTICIPATION_CASES)
+    def test_participation_rate_floor(
+        self, index_return: float, participation: float, expected: float
+    ) -> None:
         """
         [T1] Participation rate crediting must enforce 0% floor.
 
         negative index return → 0% credited
         """
-
-        def participation_crediting(index_return: float, participation: float) -> float:
-            """Participation rate crediting with floor."""
-            return max(index_return * participation, 0)
-
-        test_cases = [
-            (-0.20, 0.80, 0.0),  # -20% * 80% = -16% → 0%
-            (-0.10, 0.80, 0.0),  # -10% * 80% = -8% → 0%
-            (-0.05, 1.00, 0.0),  # -5% * 100% = -5% → 0%
-            (0.00, 0.80, 0.0),  # 0% * 80% = 0%
-            (0.10, 0.80, 0.08),  # 10% * 80% = 8%
-            (0.10, 1.20, 0.12),  # 10% * 120% = 12% (>100% participation)
-        ]
-
-        for index_return, participation, expected in test_cases:
-            result = participation_crediting(index_return, participation)
-            assert result >= 0, (
-                f"FLOOR VIOLATION: Participation crediting returned {result} for "
-                f"index_return={index_return}. FIA floor is 0%."
-            )
-            assert abs(result - expected) < 1e-10, (
-                f"Participation crediting error: got {result}, expected {expected}"
-            )
+        result = participation_payoff(index_return, participation, np.inf, FIA_FLOOR)
+        assert result >= 0, "FLOOR VIOLATION: FIA floor is 0%"
+        assert result == pytest.approx(expected, rel=1e-9, abs=1e-12)
 
     @pytest.mark.anti_pattern
-    def test_spread_rate_floor(self) -> None:
+    @pytest.mark.parametrize("index_return,spread,expected", SPREAD_CASES)
+    def test_spread_rate_floor(self, index_return: float, spread: float, expected: float) -> None:
         """
         [T1] Spread rate crediting must enforce 0% floor.
 
         (index return - spread) can be negative but credited is floored at 0%
         """
-
-        def spread_crediting(index_return: float, spread: float) -> float:
-            """Spread crediting with floor."""
-            return max(index_return - spread, 0)
-
-        test_cases = [
-            (-0.20, 0.02, 0.0),  # -20% - 2% = -22% → 0%
-            (-0.05, 0.02, 0.0),  # -5% - 2% = -7% → 0%
-            (0.01, 0.02, 0.0),  # 1% - 2% = -1% → 0%
-            (0.02, 0.02, 0.0),  # 2% - 2% = 0%
-            (0.05, 0.02, 0.03),  # 5% - 2% = 3%
-            (0.10, 0.02, 0.08),  # 10% - 2% = 8%
-        ]
-
-        for index_return, spread, expected in test_cases:
-            result = spread_crediting(index_return, spread)
-            assert result >= 0, (
-                f"FLOOR VIOLATION: Spread crediting returned {result} for "
-                f"index_return={index_return}. FIA floor is 0%."
-            )
-            assert abs(result - expected) < 1e-10, (
-                f"Spread crediting error: got {result}, expected {expected}"
-            )
+        result = spread_payoff(index_return, spread, np.inf, FIA_FLOOR)
+        assert result >= 0, "FLOOR VIOLATION: FIA floor is 0%"
+        assert result == pytest.approx(expected, rel=1e-9, abs=1e-12)
 
     @pytest.mark.anti_pattern
-    def test_performance_triggered_floor(self) -> None:
+    @pytest.mark.parametrize("index_return,trigger_rate,expected", TRIGGER_CASES)
+    def test_performance_triggered_floor(
+        self, index_return: float, trigger_rate: float, expected: float
+    ) -> None:
         """
         [T1] Performance triggered crediting must enforce 0% floor.
 
         negative index return → 0% credited (trigger not activated)
         """
-
-        def trigger_crediting(index_return: float, trigger_rate: float) -> float:
-            """Performance triggered crediting."""
-            return trigger_rate if index_return > 0 else 0
-
-        test_cases = [
-            (-0.20, 0.05, 0.0),  # negative → 0%
-            (-0.01, 0.05, 0.0),  # negative → 0%
-            (0.00, 0.05, 0.0),  # zero → 0% (trigger not activated)
-            (0.001, 0.05, 0.05),  # positive → trigger rate
-            (0.10, 0.05, 0.05),  # positive → trigger rate
-            (0.50, 0.05, 0.05),  # positive → trigger rate (same)
-        ]
-
-        for index_return, trigger_rate, expected in test_cases:
-            result = trigger_crediting(index_return, trigger_rate)
-            assert result >= 0, (
-                f"FLOOR VIOLATION: Trigger crediting returned {result} for "
-                f"index_return={index_return}. FIA floor is 0%."
-            )
-            assert abs(result - expected) < 1e-10, (
-                f"Trigger crediting error: got {result}, expected {expected}"
-            )
+        result = trigger_payoff(index_return, trigger_rate, TRIGGER_THRESHOLD, FIA_FLOOR)
+        assert result >= 0, "FLOOR VIOLATION: FIA floor is 0%"
+        assert result == pytest.approx(expected, rel=1e-9, abs=1e-12)
+        assert result == TriggerPayoff(trigger_rate).calculate(index_return).credited_return
 
     @pytest.mark.anti_pattern
-    def test_combined_cap_participation_floor(self) -> None:
+    @pytest.mark.parametrize("index_return,cap,participation,expected", CAP_PARTICIPATION_CASES)
+    def test_combined_cap_participation_floor(
+        self, index_return: float, cap: float, participation: float, expected: float
+    ) -> None:
         """
         [T1] Combined cap + participation must enforce 0% floor.
         """
+        result = participation_payoff(index_return, participation, cap, FIA_FLOOR)
+        assert result >= 0, "FLOOR VIOLATION: FIA floor is 0%"
+        assert result == pytest.approx(expected, rel=1e-9, abs=1e-12)
 
-        def cap_participation_crediting(
-            index_return: float, cap: float, participation: float
-        ) -> float:
-            """Combined cap and participation with floor."""
-            adjusted = index_return * participation
-            return min(max(adjusted, 0), cap)
-
-        test_cases = [
-            (-0.20, 0.10, 0.80, 0.0),  # negative → 0%
-            (0.10, 0.10, 0.80, 0.08),  # 10% * 80% = 8%
-            (0.20, 0.10, 0.80, 0.10),  # 20% * 80% = 16% → 10% (capped)
-        ]
+    @pytest.mark.anti_pattern
+    @pytest.mark.parametrize("method", list(ARRAY_KERNELS))
+    def test_array_kernels_floor(self, method: str) -> None:
+        """
+        [T1] The array kernels used in Monte Carlo pricing must enforce 0% floor.
 
-        for index_return, cap, participation, expected in test_cases:
-            result = cap_participation_crediting(index_return, cap, participation)
-            assert result >= 0, f"FLOOR VIOLATION: Combined crediting returned {result}"
-            assert abs(result - expected) < 1e-10, (
-                f"Combined crediting error: got {result}, expected {expected}"
-            )
+        Each case table is evaluated column-wise in one call.
+        """
+        cases, kernel = ARRAY_KERNELS[method]
+        *inputs, expected = np.array(cases).T
+        result = kernel(*inputs)
+        assert (result >= 0).all(), (
+            f"FLOOR VIOLATION: {method} credited {result[result < 0]} for "
+            f"index_return={inputs[0][result < 0]}. FIA floor is 0%."
+        )
+        np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12)
 
     @pytest.mark.anti_pattern
     def test_floor_is_exactly_zero(self) -> None:
         """
         [T1] The FIA floor must be exactly 0%, not some small negative number.
         """
-        # The floor should be 0.0, not -0.001 or similar
-        FIA_FLOOR = 0.0
+        # repr pins the value and sign: not -0.001, not -0.0
+        assert repr(FIA_FLOOR) == "0.0", f"FIA floor must be exactly 0.0, got {FIA_FLOOR!r}"
+
+    @pytest.mark.anti_pattern
+    def test_payoffs_default_to_fia_floor(self) -> None:
+        """
+        [T1] Every FIA payoff should default to the contractual floor.
+        """
+        payoffs = [
+            CappedCallPayoff(cap_rate=0.10),
+            ParticipationPayoff(participation_rate=0.80),
+            SpreadPayoff(spread_rate=0.02),
+            TriggerPayoff(trigger_rate=0.05),
+            MonthlyAveragePayoff(cap_rate=0.10),
+        ]
 
-        assert FIA_FLOOR == 0.0, f"FIA floor must be exactly 0.0, got {FIA_FLOOR}"
+        for payoff in payoffs:
+            assert payoff.floor_rate is FIA_FLOOR, type(payoff).__name__
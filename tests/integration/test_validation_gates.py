@@ -4,8 +4,10 @@ Integration tests for Validation Gates (HALT/PASS framework).
 Tests validation of pricing results across all product types.
 """
 
+import dataclasses
 from datetime import date
 
+import numpy as np
 import pytest
 
 from annuity_pricing.products.base import PricingResult
@@ -23,7 +25,10 @@ from annuity_pricing.validation.gates import (
     RILAMaxLossGate,
     RILAProtectionValueGate,
     ValidationEngine,
+    ValidationError,
+    ValidationGate,
     ValidationReport,
+    _ValidationContext,
     ensure_valid,
     validate_pricing_result,
 )
@@ -78,6 +83,27 @@ def valid_rila_result():
 # =============================================================================
 
 
+class TestGateStatus:
+    """Tests for GateStatus severity codes."""
+
+    def test_ordered_by_severity(self):
+        """Worst status should be the max."""
+        assert max(GateStatus.PASS, GateStatus.HALT, GateStatus.WARN) is GateStatus.HALT
+
+    @pytest.mark.parametrize("status", list(GateStatus))
+    def test_label_round_trips(self, status):
+        """Lowercase labels should look up the same status."""
+        assert GateStatus(status.label) is status
+        assert GateStatus(status.label.upper()) is status
+
+    def test_unknown_value_rejected(self):
+        """Unknown labels and codes should still raise."""
+        with pytest.raises(ValueError):
+            GateStatus("fail")
+        with pytest.raises(ValueError):
+            GateStatus(3)
+
+
 class TestGateResult:
     """Tests for GateResult dataclass."""
 
@@ -111,6 +137,26 @@ class TestGateResult:
         )
         assert result.passed is True
 
+    def test_message_is_required_string(self):
+        """GateResult should require a plain string message."""
+        with pytest.raises(TypeError):
+            GateResult(status=GateStatus.PASS, gate_name="test")
+        result = GateResult(status=GateStatus.PASS, gate_name="test", message="ok")
+        assert result.message == "ok"
+
+    def test_pass_message_text_unchanged(self, valid_myga_result):
+        """PASS messages should carry the formatted value."""
+        result = PresentValueBoundsGate().check(valid_myga_result, premium=100.0)
+        assert result.message == "PV 122.6200 within bounds"
+
+    def test_slotted_and_frozen(self):
+        """GateResult should carry no per-instance __dict__ and stay immutable."""
+        result = GateResult(status=GateStatus.PASS, gate_name="test", message="ok")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.status = GateStatus.HALT
+        assert repr(result).endswith("message='ok', value=None, threshold=None)")
+
 
 class TestValidationReport:
     """Tests for ValidationReport."""
@@ -155,6 +201,19 @@ class TestValidationReport:
         report = ValidationReport(results=results)
         assert len(report.halted_gates) == 2
 
+    def test_flagged_gates_partitioned_in_order(self):
+        """Halted and warned gates should keep result order and be cached."""
+        results = (
+            GateResult(status=GateStatus.WARN, gate_name="a", message="warning"),
+            GateResult(status=GateStatus.HALT, gate_name="b", message="fail"),
+            GateResult(status=GateStatus.PASS, gate_name="c", message="ok"),
+            GateResult(status=GateStatus.WARN, gate_name="d", message="warning"),
+        )
+        report = ValidationReport(results=results)
+        assert [r.gate_name for r in report.halted_gates] == ["b"]
+        assert [r.gate_name for r in report.warned_gates] == ["a", "d"]
+        assert report.halted_gates is report.halted_gates
+
     def test_to_dict(self):
         """Should convert to dictionary."""
         results = (GateResult(status=GateStatus.PASS, gate_name="test", message="ok"),)
@@ -162,6 +221,21 @@ class TestValidationReport:
         d = report.to_dict()
         assert d["overall_status"] == "pass"
         assert d["passed"] is True
+        assert d["results"][0]["status"] == "pass"
+
+    def test_list_results_stored_as_tuple(self):
+        """A list of results should be frozen into a tuple."""
+        results = [GateResult(status=GateStatus.HALT, gate_name="a", message="fail")]
+        report = ValidationReport(results=results)
+        results.clear()
+        assert isinstance(report.results, tuple)
+        assert report.passed is False
+        assert len(report.halted_gates) == 1
+
+    def test_status_ordered_by_severity(self):
+        """Worst status should be the maximum GateStatus."""
+        assert GateStatus.PASS < GateStatus.WARN < GateStatus.HALT
+        assert ValidationReport(results=()).overall_status == GateStatus.PASS
 
 
 # =============================================================================
@@ -200,6 +274,14 @@ class TestPresentValueBoundsGate:
         result = gate.check(result_obj, premium=100.0)
         assert result.status == GateStatus.HALT
 
+    def test_gate_is_immutable(self):
+        """Gates are frozen: thresholds cannot drift between validations."""
+        gate = PresentValueBoundsGate(max_pv_multiple=2.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            gate.max_pv_multiple = 5.0
+        assert not hasattr(gate, "__dict__")
+        assert gate == PresentValueBoundsGate(max_pv_multiple=2.0)
+
 
 class TestDurationBoundsGate:
     """Tests for DurationBoundsGate."""
@@ -266,6 +348,24 @@ class TestFIAOptionBudgetGate:
         result = gate.check(valid_myga_result)
         assert result.status == GateStatus.PASS
 
+    def test_halt_reports_ratio(self):
+        """HALT should still report the option/budget ratio and threshold."""
+        gate = FIAOptionBudgetGate()
+        result_obj = FIAPricingResult(
+            present_value=100.0,
+            duration=1.0,
+            embedded_option_value=3.6,
+            option_budget=3.0,
+        )
+        result = gate.check(result_obj)
+        assert result.status == GateStatus.HALT
+        assert result.value == pytest.approx(1.2)
+        assert result.threshold == pytest.approx(1.1)
+        assert "by 20.0%" in result.message
+
+        batch = ValidationEngine(gates=[gate]).validate_batch([result_obj])
+        assert batch.status.tolist() == [[GateStatus.HALT]]
+
 
 class TestFIAExpectedCreditGate:
     """Tests for FIAExpectedCreditGate."""
@@ -407,6 +507,21 @@ class TestArbitrageBoundsGate:
         result = gate.check(valid_rila_result, premium=100.0)
         assert result.status == GateStatus.PASS
 
+    def test_result_subclass_still_checked(self):
+        """Subclassed product results should reach the product check."""
+
+        class CustomFIAResult(FIAPricingResult):
+            pass
+
+        gate = ArbitrageBoundsGate()
+        result_obj = CustomFIAResult(present_value=100.0, embedded_option_value=150.0)
+        assert gate.check(result_obj, premium=100.0).status == GateStatus.HALT
+
+    def test_pass_result_shared(self, valid_fia_result, valid_myga_result):
+        """PASS results carry no per-result data and are reused."""
+        gate = ArbitrageBoundsGate()
+        assert gate.check(valid_fia_result) is gate.check(valid_myga_result)
+
 
 class TestProductParameterSanityGate:
     """Tests for ProductParameterSanityGate. [F.4]"""
@@ -550,12 +665,235 @@ class TestValidationEngine:
         with pytest.raises(ValueError, match="Validation failed"):
             engine.validate_and_raise(invalid_result, premium=100.0)
 
+    def test_validation_error_renders_halt_messages(self):
+        """ValidationError should carry the report and render HALT messages."""
+        invalid_result = PricingResult(present_value=400.0, duration=1.0)
+        with pytest.raises(ValidationError) as excinfo:
+            ValidationEngine().validate_and_raise(invalid_result, premium=100.0)
+
+        error = excinfo.value
+        assert isinstance(error, ValueError)
+        assert [g.gate_name for g in error.report.halted_gates] == ["present_value_bounds"]
+        assert str(error) == (
+            "CRITICAL: Validation failed. HALTs:\n  - PV 400.0000 exceeds 3.0x premium"
+        )
+
+    def test_only_applicable_gates_run(self, valid_rila_result):
+        """FIA-only gates should be skipped for RILA results."""
+        engine = ValidationEngine()
+        report = engine.validate(valid_rila_result, premium=100.0)
+
+        names = [r.gate_name for r in report.results]
+        assert "fia_option_budget" not in names
+        assert "fia_expected_credit" not in names
+        assert names[:2] == ["present_value_bounds", "duration_bounds"]
+        assert "rila_max_loss" in names
+
+    def test_generic_result_runs_generic_gates_only(self, valid_myga_result):
+        """A plain PricingResult should skip every product-specific gate."""
+        engine = ValidationEngine()
+        report = engine.validate(valid_myga_result, premium=100.0)
+
+        assert [r.gate_name for r in report.results] == [
+            "present_value_bounds",
+            "duration_bounds",
+            "product_parameter_sanity",
+        ]
+
+    def test_stop_on_halt(self):
+        """stop_on_halt should end the report at the first HALT."""
+        engine = ValidationEngine()
+        invalid_result = PricingResult(present_value=400.0, duration=35.0)
+
+        full = engine.validate(invalid_result, premium=100.0)
+        short = engine.validate(invalid_result, stop_on_halt=True, premium=100.0)
+
+        assert len(full.halted_gates) == 2
+        assert [r.gate_name for r in short.results] == ["present_value_bounds"]
+        assert short.overall_status == GateStatus.HALT
+
+    def test_stop_on_halt_is_keyword_only(self):
+        """stop_on_halt must not be passed positionally."""
+        with pytest.raises(TypeError):
+            ValidationEngine().validate(PricingResult(present_value=100.0), True)
+
+    def test_validate_and_raise_reports_every_halt(self):
+        """ValidationError should list every HALT, not just the first."""
+        invalid_result = PricingResult(present_value=400.0, duration=35.0)
+        with pytest.raises(ValidationError) as excinfo:
+            ValidationEngine().validate_and_raise(invalid_result, premium=100.0)
+
+        assert [g.gate_name for g in excinfo.value.report.halted_gates] == [
+            "present_value_bounds",
+            "duration_bounds",
+        ]
+        message = str(excinfo.value)
+        assert "PV 400.0000 exceeds 3.0x premium" in message
+        assert "Duration 35.0000 exceeds maximum" in message
+
+    def test_reassigning_gates_resets_type_cache(self, valid_fia_result):
+        """Replacing the gate list should take effect on the next validation."""
+        engine = ValidationEngine()
+        engine.validate(valid_fia_result, premium=100.0)
+        engine.gates = [PresentValueBoundsGate()]
+
+        report = engine.validate(valid_fia_result, premium=100.0)
+        assert [r.gate_name for r in report.results] == ["present_value_bounds"]
+
+    def test_appended_gate_runs_in_validate_and_batch(self):
+        """Gates appended in place should run in both validate paths."""
+        engine = ValidationEngine(gates=[PresentValueBoundsGate()])
+        long_result = PricingResult(present_value=100.0, duration=35.0)
+        assert engine.validate(long_result, premium=100.0).passed
+
+        engine.gates.append(DurationBoundsGate())
+
+        report = engine.validate(long_result, premium=100.0)
+        batch = engine.validate_batch([long_result], premium=100.0)
+        assert [g.gate_name for g in report.halted_gates] == ["duration_bounds"]
+        assert batch.gate_names == ("present_value_bounds", "duration_bounds")
+        assert batch.status.tolist() == [[GateStatus.PASS, GateStatus.HALT]]
+
+    def test_context_parsed_once_per_validation(self, valid_fia_result, monkeypatch):
+        """Context keywords should be parsed once, not per gate."""
+        calls = []
+        parse = _ValidationContext.from_kwargs
+        monkeypatch.setattr(
+            _ValidationContext,
+            "from_kwargs",
+            classmethod(lambda cls, context: calls.append(context) or parse(context)),
+        )
+
+        report = ValidationEngine().validate(valid_fia_result, premium=100.0, cap_rate=0.10)
+        assert report.passed is True
+        assert len(report.results) > 1
+        assert calls == [{"premium": 100.0, "cap_rate": 0.10}]
+
+    def test_keyword_gate_receives_full_context(self, valid_myga_result):
+        """Gates implementing check(**context) should still see every keyword."""
+        seen = {}
+
+        class RecordingGate(ValidationGate):
+            name = "recording"
+
+            def check(self, result, **context):
+                seen.update(context)
+                return GateResult(status=GateStatus.PASS, gate_name=self.name, message="ok")
+
+        ValidationEngine(gates=[RecordingGate()]).validate(
+            valid_myga_result, premium=50.0, product_id="X1"
+        )
+        assert seen == {"premium": 50.0, "product_id": "X1"}
+
 
 # =============================================================================
 # Test Convenience Functions
 # =============================================================================
 
 
+def _batch_of_results() -> list[PricingResult]:
+    """Mixed batch covering PASS, WARN and HALT branches of every gate."""
+
+    def fia(**kwargs):
+        fields = {"present_value": 103.0, "duration": 1.0, "option_budget": 3.0}
+        fields.update(kwargs)
+        return FIAPricingResult(**fields)
+
+    def rila(**kwargs):
+        fields = {
+            "present_value": 102.0,
+            "duration": 1.0,
+            "protection_value": 5.0,
+            "protection_type": "buffer",
+            "max_loss": 0.90,
+        }
+        fields.update(kwargs)
+        return RILAPricingResult(**fields)
+
+    return [
+        PricingResult(present_value=122.6, duration=4.5),
+        PricingResult(present_value=400.0),
+        PricingResult(present_value=100.0, duration=35.0),
+        fia(embedded_option_value=2.5, expected_credit=0.035),
+        fia(embedded_option_value=3.5, expected_credit=0.035),
+        fia(embedded_option_value=1.0, option_budget=0.0),
+        fia(embedded_option_value=2.5, expected_credit=-0.01),
+        fia(embedded_option_value=2.5, expected_credit=0.20),
+        fia(embedded_option_value=150.0, option_budget=200.0),
+        rila(),
+        rila(max_loss=0.80),
+        rila(protection_type="floor", max_loss=0.10),
+        rila(max_loss=1.2),
+        rila(protection_value=60.0),
+        rila(protection_value=-1.0),
+        rila(protection_value=20.0, max_loss=0.0),
+    ]
+
+
+class TestValidateBatch:
+    """Tests for vectorized batch validation."""
+
+    @pytest.mark.parametrize(
+        "context",
+        [
+            {"premium": 100.0},
+            {"premium": 100.0, "cap_rate": 0.10, "buffer_rate": 0.10},
+            {"premium": 50.0, "cap_rate": 0.50},
+        ],
+    )
+    def test_batch_status_matches_scalar_gates(self, context):
+        """Every vectorized gate should agree with its scalar check()."""
+        engine = ValidationEngine()
+        results = _batch_of_results()
+        batch = engine.validate_batch(results, **context)
+
+        expected = [[gate.check(r, **context).status for gate in engine.gates] for r in results]
+        assert batch.status.tolist() == expected
+        assert batch.passed.tolist() == [engine.validate(r, **context).passed for r in results]
+
+    def test_flagged_results_carry_messages(self):
+        """HALT/WARN entries should carry the scalar gate messages."""
+        engine = ValidationEngine()
+        results = _batch_of_results()
+        batch = engine.validate_batch(results, premium=100.0)
+
+        assert 0 not in batch.flagged
+        halted = batch.halted_gates(1)
+        assert [g.gate_name for g in halted] == ["present_value_bounds"]
+        assert (
+            halted[0].message == engine.validate(results[1], premium=100.0).halted_gates[0].message
+        )
+
+    def test_default_check_batch_loops_over_check(self):
+        """Gates without an override should fall back to check()."""
+
+        class AlwaysWarn(ValidationGate):
+            name = "always_warn"
+
+            def check(self, result, **context):
+                return GateResult(status=GateStatus.WARN, gate_name=self.name, message="warn")
+
+        batch = ValidationEngine(gates=[AlwaysWarn()]).validate_batch(_batch_of_results()[:3])
+        assert batch.status.tolist() == [[GateStatus.WARN]] * 3
+        assert batch.passed.all()
+
+    def test_empty_batch(self):
+        """An empty batch should produce an empty report."""
+        batch = ValidationEngine().validate_batch([], premium=100.0)
+        assert batch.status.shape == (0, 8)
+        assert batch.flagged == {}
+        assert batch.all_passed is True
+        assert batch.halted_indices.size == 0
+
+    def test_halted_indices_match_passed_mask(self):
+        """Batch-level reductions should agree with the per-result mask."""
+        batch = ValidationEngine().validate_batch(_batch_of_results(), premium=100.0)
+        assert batch.halted_indices.tolist() == np.flatnonzero(~batch.passed).tolist()
+        assert batch.all_passed is False
+        assert 1 in batch.halted_indices
+        assert 0 not in batch.halted_indices
+
+
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
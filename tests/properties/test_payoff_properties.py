@@ -13,6 +13,7 @@ Properties tested:
 6. Participation scaling: credited_return = participation × index_return (for positive)
 7. Spread deduction: credited_return = index_return - spread (for positive)
 8. Trigger binary: credited_return ∈ {floor_rate, trigger_rate}
+9. Kernel equivalence: branch-free payoff kernels = branchy reference
 
 References:
     [T1] SEC RILA Final Rule 2024
@@ -21,6 +22,7 @@ References:
 See: docs/knowledge/domain/buffer_floor.md
 """
 
+import numpy as np
 from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
@@ -36,6 +38,16 @@ from annuity_pricing.options.payoffs.fia import (
     SpreadPayoff,
     TriggerPayoff,
 )
+from annuity_pricing.options.payoffs.kernels import (
+    buffer_payoff,
+    buffer_payoff_vec,
+    cap_payoff_vec,
+    floor_payoff,
+    floor_payoff_vec,
+    participation_payoff_vec,
+    spread_payoff_vec,
+    trigger_payoff_vec,
+)
 from annuity_pricing.options.payoffs.rila import (
     BufferPayoff,
     FloorPayoff,
@@ -463,3 +475,109 @@ class TestBufferVsFloorProperties:
             f"return={index_return}, buffer_credit={buffer_result.credited_return}, "
             f"floor_credit={floor_result.credited_return}"
         )
+
+
+# =============================================================================
+# Compiled Kernel Equivalence Properties
+# =============================================================================
+
+
+def _branchy_buffer_payoff(index_return: float, buffer: float, cap: float) -> float:
+    """Reference buffer payoff written with explicit branches."""
+    if index_return >= 0:
+        return min(index_return, cap)
+    elif index_return >= -buffer:
+        return 0.0
+    else:
+        return index_return + buffer
+
+
+def _branchy_floor_payoff(index_return: float, floor: float, cap: float) -> float:
+    """Reference floor payoff written with explicit branches."""
+    if index_return >= 0:
+        return min(index_return, cap)
+    elif index_return >= -floor:
+        return index_return
+    else:
+        return -floor
+
+
+class TestPayoffKernelProperties:
+    """Branch-free kernels must equal the branchy reference payoffs exactly."""
+
+    @given(
+        index_return=return_strategy,
+        protection_rate=buffer_strategy,
+        cap_rate=cap_strategy,
+    )
+    @settings(max_examples=500)
+    def test_scalar_kernels_match_reference(
+        self, index_return: float, protection_rate: float, cap_rate: float
+    ) -> None:
+        """Scalar kernels should equal the branchy payoffs, boundaries included."""
+        for r in (index_return, -protection_rate):
+            assert buffer_payoff(r, protection_rate, cap_rate) == _branchy_buffer_payoff(
+                r, protection_rate, cap_rate
+            )
+            assert floor_payoff(r, protection_rate, cap_rate) == _branchy_floor_payoff(
+                r, protection_rate, cap_rate
+            )
+
+    @given(
+        index_returns=st.lists(return_strategy, min_size=1, max_size=1000),
+        protection_rate=buffer_strategy,
+        cap_rate=cap_strategy,
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_vectorized_kernels_match_reference(
+        self, index_returns: list[float], protection_rate: float, cap_rate: float
+    ) -> None:
+        """Array kernels should equal the branchy payoffs element-wise."""
+        returns = np.array(index_returns)
+
+        buffer = buffer_payoff_vec(returns, protection_rate, cap_rate)
+        floor = floor_payoff_vec(returns, protection_rate, cap_rate)
+
+        assert buffer.tolist() == [
+            _branchy_buffer_payoff(r, protection_rate, cap_rate) for r in index_returns
+        ]
+        assert floor.tolist() == [
+            _branchy_floor_payoff(r, protection_rate, cap_rate) for r in index_returns
+        ]
+
+    @given(
+        index_returns=st.lists(return_strategy, min_size=1, max_size=1000),
+        cap_rate=cap_strategy,
+        participation=participation_strategy,
+        spread=spread_strategy,
+        trigger_rate=trigger_strategy,
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_fia_kernels_match_scalar_payoffs(
+        self,
+        index_returns: list[float],
+        cap_rate: float,
+        participation: float,
+        spread: float,
+        trigger_rate: float,
+    ) -> None:
+        """FIA array kernels should equal the branchy calculate() element-wise."""
+        returns = np.array(index_returns + [0.0, cap_rate])
+        cases = [
+            (CappedCallPayoff(cap_rate=cap_rate), cap_payoff_vec(returns, cap_rate, 0.0)),
+            (
+                ParticipationPayoff(participation_rate=participation, cap_rate=cap_rate),
+                participation_payoff_vec(returns, participation, cap_rate, 0.0),
+            ),
+            (
+                SpreadPayoff(spread_rate=spread),
+                spread_payoff_vec(returns, spread, np.inf, 0.0),
+            ),
+            (
+                TriggerPayoff(trigger_rate=trigger_rate),
+                trigger_payoff_vec(returns, trigger_rate, 0.0, 0.0),
+            ),
+        ]
+
+        for payoff, credited in cases:
+            assert credited.tolist() == [payoff.calculate(r).credited_return for r in returns]
@@ -10,6 +10,8 @@ Tests cover:
 Uses real WINK sample fixture for realistic testing.
 """
 
+import hashlib
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -69,6 +71,25 @@ class TestComputeSha256:
         assert "CRITICAL" in str(exc_info.value)
         assert "does_not_exist.parquet" in str(exc_info.value)
 
+    def test_matches_hashlib(self, tmp_path: Path) -> None:
+        """Should equal a plain hashlib digest of the file contents."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"annuity" * 100_000)
+
+        assert compute_sha256(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_detects_rewrite_with_same_size_and_mtime(self, tmp_path: Path) -> None:
+        """A same-size rewrite that restores the mtime must not return a stale hash."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"aaaa")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        first = compute_sha256(path)
+
+        path.write_bytes(b"bbbb")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        assert compute_sha256(path) == hashlib.sha256(b"bbbb").hexdigest() != first
+
 
 class TestVerifyChecksum:
     """Tests for verify_checksum function."""
@@ -105,12 +126,8 @@ class TestLoadWinkData:
 
     def test_loads_fixture_without_verification(self, sample_wink_path: Path) -> None:
         """Should load fixture data when verification is skipped."""
-        with patch("annuity_pricing.data.loader.SETTINGS") as mock_settings:
-            mock_settings.data.wink_path = sample_wink_path
-            mock_settings.data.wink_checksum = SAMPLE_CHECKSUM
-
-            # Explicitly disable synthetic to test real file loading
-            df = load_wink_data(path=sample_wink_path, verify=False, use_synthetic=False)
+        # Explicitly disable synthetic to test real file loading
+        df = load_wink_data(path=sample_wink_path, verify=False, use_synthetic=False)
 
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 100  # Our fixture has 100 rows
@@ -119,12 +136,10 @@ class TestLoadWinkData:
 
     def test_loads_with_verification(self, sample_wink_path: Path) -> None:
         """Should load and verify fixture data."""
-        with patch("annuity_pricing.data.loader.SETTINGS") as mock_settings:
-            mock_settings.data.wink_path = sample_wink_path
-            mock_settings.data.wink_checksum = SAMPLE_CHECKSUM
-
-            # Explicitly disable synthetic to test real file loading
-            df = load_wink_data(path=sample_wink_path, verify=True, use_synthetic=False)
+        # Explicitly disable synthetic to test real file loading
+        df = load_wink_data(
+            path=sample_wink_path, verify=True, use_synthetic=False, checksum=SAMPLE_CHECKSUM
+        )
 
         assert len(df) == 100
 
@@ -150,11 +165,20 @@ class TestLoadWinkData:
 
     def test_raises_on_checksum_mismatch(self, sample_wink_path: Path) -> None:
         """Should raise DataIntegrityError on checksum mismatch."""
+        # Explicitly disable synthetic to test checksum verification
+        with pytest.raises(DataIntegrityError):
+            load_wink_data(
+                path=sample_wink_path,
+                verify=True,
+                use_synthetic=False,
+                checksum="wrong_checksum_value",
+            )
+
+    def test_checksum_defaults_to_settings(self, sample_wink_path: Path) -> None:
+        """Without an explicit checksum, verification should use SETTINGS."""
         with patch("annuity_pricing.data.loader.SETTINGS") as mock_settings:
-            mock_settings.data.wink_path = sample_wink_path
             mock_settings.data.wink_checksum = "wrong_checksum_value"
 
-            # Explicitly disable synthetic to test checksum verification
             with pytest.raises(DataIntegrityError):
                 load_wink_data(path=sample_wink_path, verify=True, use_synthetic=False)
 
@@ -167,6 +191,20 @@ class TestLoadWinkData:
 class TestLoadWinkByProduct:
     """Tests for load_wink_by_product function."""
 
+    def test_projects_columns(self, sample_wink_path: Path) -> None:
+        """Should read only requested columns plus the filter columns."""
+        with patch("annuity_pricing.data.loader.SETTINGS") as mock_settings:
+            mock_settings.data.wink_path = sample_wink_path
+            mock_settings.data.wink_checksum = SAMPLE_CHECKSUM
+
+            full = load_wink_by_product("MYGA", verify=True, use_synthetic=False)
+            df = load_wink_by_product(
+                "MYGA", verify=True, use_synthetic=False, columns=["companyName", "fixedRate"]
+            )
+
+        assert list(df.columns) == ["productGroup", "status", "companyName", "fixedRate"]
+        pd.testing.assert_frame_equal(df, full[list(df.columns)])
+
     def test_filters_myga_products(self, sample_wink_path: Path) -> None:
         """Should filter to only MYGA products."""
         with patch("annuity_pricing.data.loader.SETTINGS") as mock_settings:
@@ -10,6 +10,9 @@ Tests crediting methods:
 See: docs/knowledge/domain/crediting_methods.md
 """
 
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 
@@ -22,6 +25,13 @@ from annuity_pricing.options.payoffs.fia import (
     TriggerPayoff,
     create_fia_payoff,
 )
+from annuity_pricing.options.payoffs.kernels import (
+    cap_payoff,
+    cap_payoff_vec,
+    participation_payoff_vec,
+    spread_payoff_vec,
+    trigger_payoff_vec,
+)
 
 
 class TestCappedCallPayoff:
@@ -292,6 +302,30 @@ class TestMonthlyAveragePayoff:
 
         assert result.credited_return == 0.0
 
+    def test_floor_above_cap_raises(self):
+        """Floor above cap should raise, as for CappedCallPayoff."""
+        with pytest.raises(ValueError, match="cannot exceed cap_rate"):
+            MonthlyAveragePayoff(cap_rate=0.05, floor_rate=0.10)
+
+    def test_paths_vectorized_matches_calculate_from_path(self):
+        """Path-matrix calculation should match calculate_from_path row by row."""
+        payoff = MonthlyAveragePayoff(cap_rate=0.05)
+        rng = np.random.default_rng(42)
+        paths = 100.0 * np.cumprod(
+            np.hstack([np.ones((50, 1)), 1 + 0.03 * rng.standard_normal((50, 12))]), axis=1
+        )
+        times = tuple(i / 12 for i in range(13))
+
+        expected = [
+            payoff.calculate_from_path(
+                IndexPath(times=times, values=tuple(row), initial_value=row[0])
+            ).credited_return
+            for row in paths
+        ]
+
+        assert payoff.supports_path_vectorized()
+        np.testing.assert_allclose(payoff.calculate_paths_vectorized(paths), expected, atol=1e-15)
+
 
 class TestCreateFiaPayoff:
     """Tests for factory function."""
@@ -396,3 +430,55 @@ class TestFIAAntiPatterns:
             result = payoff.calculate(r)
             expected = r * 0.80
             assert result.credited_return == pytest.approx(expected)
+
+
+class TestFIAPayoffKernels:
+    """Tests for the compiled FIA crediting kernels."""
+
+    RETURNS = np.array([-0.40, -0.10, -0.01, 0.0, 0.01, 0.05, 0.10, 0.30])
+
+    def test_cap_kernel_matches_scalar_payoff(self):
+        """Cap kernels should match CappedCallPayoff.calculate."""
+        payoff = CappedCallPayoff(cap_rate=0.10)
+        expected = [payoff.calculate(r).credited_return for r in self.RETURNS]
+
+        np.testing.assert_array_equal(cap_payoff_vec(self.RETURNS, 0.10, 0.0), expected)
+        assert [cap_payoff(r, 0.10, 0.0) for r in self.RETURNS] == expected
+
+    def test_vectorized_payoffs_use_kernels(self):
+        """calculate_vectorized should agree with calculate for every method."""
+        payoffs = [
+            CappedCallPayoff(cap_rate=0.10),
+            ParticipationPayoff(participation_rate=0.80, cap_rate=0.06),
+            ParticipationPayoff(participation_rate=1.20),
+            SpreadPayoff(spread_rate=0.02, cap_rate=0.05),
+            TriggerPayoff(trigger_rate=0.05, trigger_threshold=0.01),
+        ]
+        for payoff in payoffs:
+            expected = [payoff.calculate(r).credited_return for r in self.RETURNS]
+            np.testing.assert_array_equal(payoff.calculate_vectorized(self.RETURNS), expected)
+
+    def test_fallback_kernels_without_numba(self):
+        """Without Numba the array kernels should give the same payoffs."""
+        script = (
+            "import sys\n"
+            "sys.modules['numba'] = None\n"
+            "import numpy as np\n"
+            "from annuity_pricing.options.payoffs import kernels\n"
+            "assert not kernels.NUMBA_AVAILABLE\n"
+            f"r = np.array({self.RETURNS.tolist()}).reshape(2, -1)\n"
+            "print(kernels.cap_payoff_vec(r, 0.10, 0.0).ravel().tolist())\n"
+            "print(kernels.participation_payoff_vec(r, 0.80, 0.06, 0.0).ravel().tolist())\n"
+            "print(kernels.spread_payoff_vec(r, 0.02, np.inf, 0.0).ravel().tolist())\n"
+            "print(kernels.trigger_payoff_vec(r, 0.05, 0.0, 0.0).ravel().tolist())\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+
+        assert out == [
+            str(cap_payoff_vec(self.RETURNS, 0.10, 0.0).tolist()),
+            str(participation_payoff_vec(self.RETURNS, 0.80, 0.06, 0.0).tolist()),
+            str(spread_payoff_vec(self.RETURNS, 0.02, np.inf, 0.0).tolist()),
+            str(trigger_payoff_vec(self.RETURNS, 0.05, 0.0, 0.0).tolist()),
+        ]
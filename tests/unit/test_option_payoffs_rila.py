@@ -8,10 +8,19 @@ Tests buffer and floor protection mechanics:
 See: docs/knowledge/domain/buffer_floor.md
 """
 
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 
 from annuity_pricing.options.payoffs.base import CreditingMethod
+from annuity_pricing.options.payoffs.kernels import (
+    buffer_payoff,
+    buffer_payoff_vec,
+    floor_payoff,
+    floor_payoff_vec,
+)
 from annuity_pricing.options.payoffs.rila import (
     BufferPayoff,
     BufferWithFloorPayoff,
@@ -401,3 +410,66 @@ class TestAntiPatterns:
         # Difference should equal 5%
         diff = result1.credited_return - result2.credited_return
         assert diff == pytest.approx(0.05)
+
+
+class TestPayoffKernels:
+    """Tests for the compiled buffer/floor kernels and vectorized payoffs."""
+
+    RETURNS = np.array([-0.40, -0.15, -0.10, -0.05, 0.0, 0.05, 0.12, 0.30])
+
+    def test_buffer_kernel_matches_scalar_payoff(self):
+        """Vectorized buffer kernel should match BufferPayoff.calculate."""
+        payoff = BufferPayoff(buffer_rate=0.10, cap_rate=0.15)
+        expected = [payoff.calculate(r).credited_return for r in self.RETURNS]
+
+        np.testing.assert_allclose(buffer_payoff_vec(self.RETURNS, 0.10, 0.15), expected)
+        np.testing.assert_allclose(payoff.calculate_vectorized(self.RETURNS), expected)
+        assert [buffer_payoff(r, 0.10, 0.15) for r in self.RETURNS] == pytest.approx(expected)
+
+    def test_floor_kernel_matches_scalar_payoff(self):
+        """Vectorized floor kernel should match FloorPayoff.calculate."""
+        payoff = FloorPayoff(floor_rate=-0.10, cap_rate=0.15)
+        expected = [payoff.calculate(r).credited_return for r in self.RETURNS]
+
+        np.testing.assert_allclose(floor_payoff_vec(self.RETURNS, 0.10, 0.15), expected)
+        np.testing.assert_allclose(payoff.calculate_vectorized(self.RETURNS), expected)
+        assert [floor_payoff(r, 0.10, 0.15) for r in self.RETURNS] == pytest.approx(expected)
+
+    def test_uncapped_vectorized_payoffs(self):
+        """Uncapped payoffs should pass gains through unchanged."""
+        buffer = BufferPayoff(buffer_rate=0.10).calculate_vectorized(self.RETURNS)
+        floor = FloorPayoff(floor_rate=-0.10).calculate_vectorized(self.RETURNS)
+
+        assert buffer[-1] == 0.30
+        assert floor[-1] == 0.30
+
+    @pytest.mark.parametrize("kernel", [buffer_payoff_vec, floor_payoff_vec])
+    def test_vectorized_kernels_require_cap(self, kernel):
+        """cap has no default, with or without Numba (pass inf for uncapped)."""
+        with pytest.raises(TypeError):
+            kernel(self.RETURNS, 0.10)
+
+    def test_fallback_kernels_without_numba(self):
+        """Without Numba the array kernels should give the same payoffs."""
+        script = (
+            "import sys\n"
+            "sys.modules['numba'] = None\n"
+            "import numpy as np\n"
+            "from annuity_pricing.options.payoffs import kernels\n"
+            "assert not kernels.NUMBA_AVAILABLE\n"
+            f"r = np.array({self.RETURNS.tolist()}).reshape(2, -1)\n"
+            "print(kernels.buffer_payoff_vec(r, 0.10, 0.15).ravel().tolist())\n"
+            "print(kernels.floor_payoff_vec(r, 0.10, 0.15).ravel().tolist())\n"
+            "for kernel in (kernels.buffer_payoff_vec, kernels.floor_payoff_vec):\n"
+            "    try:\n"
+            "        kernel(r, 0.10)\n"
+            "    except TypeError:\n"
+            "        continue\n"
+            "    raise AssertionError(f'{kernel.__name__} accepted a missing cap')\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+
+        assert out[0] == str(buffer_payoff_vec(self.RETURNS, 0.10, 0.15).tolist())
+        assert out[1] == str(floor_payoff_vec(self.RETURNS, 0.10, 0.15).tolist())
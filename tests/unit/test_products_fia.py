@@ -21,7 +21,7 @@ from annuity_pricing.products.fia import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def market_params():
     """Standard market parameters for testing."""
     return MarketParams(
@@ -32,7 +32,7 @@ def market_params():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pricer(market_params):
     """FIA pricer with standard parameters."""
     return FIAPricer(
@@ -43,7 +43,7 @@ def pricer(market_params):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cap_product():
     """FIA product with cap crediting."""
     return FIAProduct(
@@ -56,7 +56,7 @@ def cap_product():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def participation_product():
     """FIA product with participation crediting."""
     return FIAProduct(
@@ -69,6 +69,18 @@ def participation_product():
     )
 
 
+@pytest.fixture(scope="module")
+def cap_result(pricer, cap_product):
+    """1-year cap pricing result, shared by tests that only inspect it."""
+    return pricer.price(cap_product, term_years=1.0)
+
+
+@pytest.fixture(scope="module")
+def participation_result(pricer, participation_product):
+    """1-year participation pricing result, shared by tests that only inspect it."""
+    return pricer.price(participation_product, term_years=1.0)
+
+
 class TestMarketParams:
     """Tests for MarketParams validation."""
 
@@ -111,29 +123,29 @@ class TestFIAPricerCreation:
 class TestCapPricing:
     """Tests for cap crediting method pricing."""
 
-    def test_cap_pricing_returns_result(self, pricer, cap_product):
+    def test_cap_pricing_returns_result(self, cap_result):
         """Cap pricing should return FIAPricingResult."""
-        result = pricer.price(cap_product, term_years=1.0)
+        result = cap_result
 
         assert isinstance(result, FIAPricingResult)
         assert result.present_value > 0
 
-    def test_cap_pricing_embedded_option(self, pricer, cap_product):
+    def test_cap_pricing_embedded_option(self, cap_result):
         """Cap pricing should calculate embedded option value."""
-        result = pricer.price(cap_product, term_years=1.0)
+        result = cap_result
 
         assert result.embedded_option_value >= 0
         assert result.option_budget > 0
 
-    def test_cap_expected_credit_positive(self, pricer, cap_product):
+    def test_cap_expected_credit_positive(self, cap_result):
         """Expected credit should be positive for cap product."""
-        result = pricer.price(cap_product, term_years=1.0)
+        result = cap_result
 
         assert result.expected_credit >= 0  # FIA floor is 0%
 
-    def test_cap_expected_credit_capped(self, pricer, cap_product):
+    def test_cap_expected_credit_capped(self, cap_result, cap_product):
         """Expected credit should be <= cap rate."""
-        result = pricer.price(cap_product, term_years=1.0)
+        result = cap_result
 
         assert result.expected_credit <= cap_product.cap_rate + 0.01  # Small tolerance
 
@@ -163,9 +175,9 @@ class TestCapPricing:
 class TestParticipationPricing:
     """Tests for participation crediting method pricing."""
 
-    def test_participation_pricing_returns_result(self, pricer, participation_product):
+    def test_participation_pricing_returns_result(self, participation_result):
         """Participation pricing should return FIAPricingResult."""
-        result = pricer.price(participation_product, term_years=1.0)
+        result = participation_result
 
         assert isinstance(result, FIAPricingResult)
         assert result.present_value > 0
@@ -196,16 +208,16 @@ class TestParticipationPricing:
 class TestFairTermCalculation:
     """Tests for fair cap/participation calculation."""
 
-    def test_fair_cap_calculated(self, pricer, cap_product):
+    def test_fair_cap_calculated(self, cap_result):
         """Fair cap should be calculated."""
-        result = pricer.price(cap_product, term_years=1.0)
+        result = cap_result
 
         assert result.fair_cap is not None
         assert result.fair_cap > 0
 
-    def test_fair_participation_calculated(self, pricer, cap_product):
+    def test_fair_participation_calculated(self, cap_result):
         """Fair participation should be calculated."""
-        result = pricer.price(cap_product, term_years=1.0)
+        result = cap_result
 
         assert result.fair_participation is not None
         assert result.fair_participation > 0
@@ -231,12 +243,14 @@ class TestFairTermCalculation:
         high_result = high_budget_pricer.price(product, term_years=1.0)
 
         assert high_result.fair_cap > low_result.fair_cap
+        # Same seed, same paths: only the budget differs between the pricers
+        assert high_result.expected_credit == low_result.expected_credit
 
 
 class TestCompetitivePosition:
     """Tests for competitive positioning."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def market_data(self):
         """Sample FIA market data."""
         return pd.DataFrame(
@@ -276,6 +290,40 @@ class TestCompetitivePosition:
         high_position = pricer.competitive_position(high_cap, market_data)
 
         assert high_position.percentile > low_position.percentile
+        assert (low_position.percentile, low_position.rank) == (10.0, 10)
+        assert (high_position.percentile, high_position.rank) == (100.0, 1)
+
+    def test_competitive_position_ties(self, pricer, market_data):
+        """Tied rates should count toward percentile but not outrank the product."""
+        product = FIAProduct(
+            company_name="Test",
+            product_name="Mid",
+            product_group="FIA",
+            status="current",
+            cap_rate=0.10,
+        )
+        tied = pd.concat([market_data, market_data.iloc[[4]]], ignore_index=True)
+
+        position = pricer.competitive_position(product, tied)
+
+        assert position.percentile == pytest.approx(6 / 11 * 100)
+        assert position.rank == 6
+
+    def test_percentile_and_rank_accepts_arrays(self, pricer, market_data):
+        """Ranking helper should give the same result for a Series or ndarray."""
+        caps = market_data["capRate"]
+
+        assert pricer._percentile_and_rank(0.10, caps.to_numpy()) == (50.0, 6)
+        assert pricer._percentile_and_rank(0.10, caps) == (50.0, 6)
+        assert pricer._percentile_and_rank(0.10, caps.to_numpy()[::-1]) == (50.0, 6)
+
+    def test_market_data_not_mutated(self, pricer, cap_product, market_data):
+        """Competitive position should only read the market data."""
+        before = market_data.copy()
+
+        pricer.competitive_position(cap_product, market_data)
+
+        pd.testing.assert_frame_equal(market_data, before)
 
 
 class TestEdgeCases:
@@ -342,6 +390,38 @@ class TestPriceMultiple:
         assert "present_value" in results.columns
         assert "expected_credit" in results.columns
 
+    def test_price_multiple_matches_individual_pricing(self, pricer):
+        """Shared simulations should reproduce per-product pricing exactly."""
+        products = [
+            FIAProduct(
+                company_name="A",
+                product_name="Cap 8%",
+                product_group="FIA",
+                status="current",
+                cap_rate=0.08,
+            ),
+            FIAProduct(
+                company_name="B",
+                product_name="Par 80%",
+                product_group="FIA",
+                status="current",
+                participation_rate=0.80,
+            ),
+            FIAProduct(
+                company_name="C",
+                product_name="Monthly Cap 6%",
+                product_group="FIA",
+                status="current",
+                cap_rate=0.06,
+                indexing_method="Monthly Average",
+            ),
+        ]
+
+        results = pricer.price_multiple(products, term_years=1.0)
+
+        expected = [pricer.price(p, term_years=1.0).expected_credit for p in products]
+        assert results["expected_credit"].tolist() == expected
+
 
 class TestTermYearsRequirement:
     """
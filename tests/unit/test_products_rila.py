@@ -8,10 +8,16 @@ Tests pricing of RILA products with:
 See: docs/knowledge/domain/buffer_floor.md
 """
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from annuity_pricing.data.schemas import RILAProduct
+from annuity_pricing.options.payoffs.rila import BufferPayoff
+from annuity_pricing.options.pricing.black_scholes import black_scholes_call, black_scholes_put
+from annuity_pricing.options.pricing.heston import HestonParams
+from annuity_pricing.options.simulation.gbm import GBMParams
+from annuity_pricing.options.volatility_models import HestonVolatility
 from annuity_pricing.products.rila import (
     MarketParams,
     RILAPricer,
@@ -72,6 +78,32 @@ def floor_product():
     )
 
 
+@pytest.fixture
+def bs_call(market_params):
+    """Undiscounted 1-year E[max(S_T - K, 0)] / S for strike K = moneyness * S."""
+    m = market_params
+    return lambda k: (
+        np.exp(m.risk_free_rate)
+        * black_scholes_call(
+            m.spot, m.spot * k, m.risk_free_rate, m.dividend_yield, m.volatility, 1.0
+        )
+        / m.spot
+    )
+
+
+@pytest.fixture
+def bs_put(market_params):
+    """Undiscounted 1-year E[max(K - S_T, 0)] / S for strike K = moneyness * S."""
+    m = market_params
+    return lambda k: (
+        np.exp(m.risk_free_rate)
+        * black_scholes_put(
+            m.spot, m.spot * k, m.risk_free_rate, m.dividend_yield, m.volatility, 1.0
+        )
+        / m.spot
+    )
+
+
 class TestMarketParams:
     """Tests for MarketParams validation."""
 
@@ -171,13 +203,168 @@ class TestBufferVsFloorComparison:
             floor_rate=0.10,
             cap_rate=0.15,
             term_years=1.0,
-        )
+        ).set_index("metric")
 
         # Floor max loss should be less than buffer max loss
-        floor_max_loss = comparison[comparison["metric"] == "max_loss"]["floor"].iloc[0]
-        buffer_max_loss = comparison[comparison["metric"] == "max_loss"]["buffer"].iloc[0]
+        assert comparison.loc["max_loss", "floor"] < comparison.loc["max_loss", "buffer"]
 
-        assert floor_max_loss < buffer_max_loss
+    def test_comparison_matches_full_pricing(self, pricer, buffer_product, floor_product):
+        """Direct comparison should agree with pricing the equivalent products."""
+        comparison = pricer.compare_buffer_vs_floor(
+            buffer_rate=0.10,
+            floor_rate=0.10,
+            cap_rate=0.15,
+            term_years=1.0,
+        ).set_index("metric")
+
+        buffer_result = pricer.price(buffer_product, term_years=1.0)
+        floor_result = pricer.price(floor_product, term_years=1.0)
+
+        for metric in ["protection_value", "upside_value", "expected_return", "present_value"]:
+            assert comparison.loc[metric, "buffer"] == pytest.approx(getattr(buffer_result, metric))
+            assert comparison.loc[metric, "floor"] == pytest.approx(getattr(floor_result, metric))
+
+
+@pytest.fixture
+def heston_market_params(market_params):
+    """Standard market parameters with a Heston vol model (MC expected return)."""
+    heston = HestonVolatility(HestonParams(v0=0.04, kappa=2.0, theta=0.04, sigma=0.3, rho=-0.7))
+    return MarketParams(
+        spot=market_params.spot,
+        risk_free_rate=market_params.risk_free_rate,
+        dividend_yield=market_params.dividend_yield,
+        volatility=market_params.volatility,
+        vol_model=heston,
+    )
+
+
+class TestValuationCache:
+    """Tests for memoized valuation of identical terms."""
+
+    def test_seeded_pricer_reuses_valuation(self, pricer, buffer_product):
+        """Repeated pricing of identical terms should hit the cache."""
+        first = pricer.price(buffer_product, term_years=1.0)
+        second = pricer.price(buffer_product, term_years=1.0)
+
+        assert second.present_value == first.present_value
+        assert pricer._components.cache_info().hits == 1
+
+    def test_unseeded_gbm_pricer_memoized(self, market_params):
+        """GBM valuations are closed form, so unseeded pricers memoize too."""
+        unseeded = RILAPricer(market_params=market_params, n_mc_paths=1000)
+
+        assert hasattr(unseeded._components, "cache_info")
+
+    def test_unseeded_heston_pricer_not_memoized(self, heston_market_params):
+        """Unseeded Heston pricers must redraw paths, so no cache is installed."""
+        unseeded = RILAPricer(market_params=heston_market_params, n_mc_paths=1000)
+
+        assert not hasattr(unseeded._components, "cache_info")
+
+    def test_unseeded_heston_batch_values_identical_terms_once(
+        self, heston_market_params, monkeypatch
+    ):
+        """Duplicate products in an unseeded batch should share one valuation."""
+        unseeded = RILAPricer(market_params=heston_market_params, n_mc_paths=200)
+        valued = []
+        original = unseeded._value_components
+
+        def counting(*args):
+            valued.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(unseeded, "_value_components", counting)
+        products = [
+            RILAProduct(
+                company_name="Test",
+                product_name=f"Buffer {buffer:.0%} ({i})",
+                product_group="RILA",
+                status="current",
+                buffer_rate=buffer,
+                buffer_modifier="Losses Covered Up To",
+                cap_rate=0.15,
+            )
+            for i, buffer in enumerate((0.10, 0.20, 0.10, 0.20))
+        ]
+
+        df = unseeded.price_multiple(products, term_years=1.0)
+
+        assert len(valued) == 2
+        assert df["present_value"].iloc[0] == df["present_value"].iloc[2]
+        assert not hasattr(unseeded._components, "cache_info")
+
+
+class TestClosedFormExpectedReturn:
+    """[T1] GBM expected return is a static option portfolio, priced in closed form."""
+
+    def test_buffer_matches_closed_form(self, pricer, bs_call, bs_put):
+        """Buffer payoff is call spread minus OTM put."""
+        closed_form = bs_call(1.0) - bs_call(1.15) - bs_put(0.90)
+
+        expected_return = pricer._calculate_expected_return(True, 0.10, 0.15, 1.0)
+
+        assert expected_return == pytest.approx(closed_form, rel=1e-12)
+
+    def test_floor_matches_closed_form(self, pricer, bs_call, bs_put):
+        """Floor payoff is call spread minus ATM/OTM put spread."""
+        closed_form = bs_call(1.0) - bs_call(1.15) - (bs_put(1.0) - bs_put(0.90))
+
+        expected_return = pricer._calculate_expected_return(False, 0.10, 0.15, 1.0)
+
+        assert expected_return == pytest.approx(closed_form, rel=1e-12)
+
+    def test_gbm_does_not_simulate(self, pricer, monkeypatch):
+        """The GBM path should never touch the Monte Carlo engine."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("GBM expected return should not simulate")
+
+        monkeypatch.setattr(pricer.mc_engine, "price_with_payoff", fail)
+        monkeypatch.setattr(pricer.mc_engine, "price_with_payoff_heston", fail)
+
+        pricer._calculate_expected_return(True, 0.10, 0.15, 1.0)
+        pricer._calculate_expected_return(False, 0.10, None, 1.0)
+
+    def test_seed_independent(self, market_params):
+        """Different seeds should give identical GBM expected returns."""
+        returns = [
+            RILAPricer(market_params, n_mc_paths=2000, seed=seed)._calculate_expected_return(
+                True, 0.10, None, 1.0
+            )
+            for seed in (1, 2)
+        ]
+
+        assert returns[0] == returns[1]
+
+    def test_within_mc_error_of_engine(self, pricer, market_params):
+        """Closed-form expected return should agree with the plain engine estimate."""
+        payoff = BufferPayoff(buffer_rate=0.10, cap_rate=0.15)
+        gbm_params = GBMParams(
+            spot=market_params.spot,
+            rate=market_params.risk_free_rate,
+            dividend=market_params.dividend_yield,
+            volatility=market_params.volatility,
+            time_to_expiry=1.0,
+        )
+        mc_result = pricer.mc_engine.price_with_payoff(gbm_params, payoff)
+        plain = mc_result.payoffs.mean() / market_params.spot
+        standard_error = mc_result.payoffs.std(ddof=1) / market_params.spot / 100
+
+        expected_return = pricer._calculate_expected_return(True, 0.10, 0.15, 1.0)
+
+        assert abs(expected_return - plain) < 4 * standard_error
+
+    def test_full_buffer_has_no_loss_leg(self, pricer, bs_call):
+        """A 100% buffer has no loss leg; its put strike would be zero."""
+        expected_return = pricer._calculate_expected_return(True, 1.0, 0.15, 1.0)
+
+        assert expected_return == pytest.approx(bs_call(1.0) - bs_call(1.15), rel=1e-12)
+
+    def test_zero_cap_has_no_upside(self, pricer, bs_put):
+        """A 0% cap credits no gains, leaving only the loss leg."""
+        expected_return = pricer._calculate_expected_return(True, 0.10, 0.0, 1.0)
+
+        assert expected_return == pytest.approx(-bs_put(0.90), rel=1e-12)
 
 
 class TestProtectionLevels:
@@ -239,7 +426,7 @@ class TestProtectionLevels:
 class TestCompetitivePosition:
     """Tests for competitive positioning."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def market_data(self):
         """Sample RILA market data."""
         return pd.DataFrame(
@@ -284,6 +471,59 @@ class TestCompetitivePosition:
         high_position = pricer.competitive_position(high_cap, market_data)
 
         assert high_position.percentile > low_position.percentile
+        assert (low_position.percentile, low_position.rank) == (10.0, 10)
+        assert (high_position.percentile, high_position.rank) == (100.0, 1)
+
+    def test_comparables_filters(self, pricer, buffer_product):
+        """Only RILA buffers within 2% of the product's buffer should be comparable."""
+        market_data = pd.DataFrame(
+            {
+                "productGroup": ["RILA", "RILA", "RILA", "RILA", "FIA", "RILA"],
+                "bufferRate": [0.10, 0.11, 0.20, 0.10, 0.10, 0.10],
+                "bufferModifier": [
+                    "Losses Covered Up To",
+                    "LOSSES COVERED UP TO",
+                    "Losses Covered Up To",
+                    "Losses Covered After",
+                    "Losses Covered Up To",
+                    None,
+                ],
+                "capRate": [0.10, 0.20, 0.30, 0.40, 0.50, 0.60],
+                "indexUsed": ["S&P 500"] * 6,
+            }
+        )
+
+        position = pricer.competitive_position(buffer_product, market_data)
+
+        # Comparable caps: 0.10, 0.20 -> 0.15 sits above one of two
+        assert position.total_products == 2
+        assert (position.percentile, position.rank) == (50.0, 2)
+
+    def test_nullable_columns_with_missing_values(self, pricer, buffer_product):
+        """pd.NA in nullable string columns should just not match."""
+        market_data = pd.DataFrame(
+            {
+                "productGroup": pd.array(["RILA", None, "RILA", "RILA"], dtype="string"),
+                "bufferRate": pd.array([0.10, 0.10, None, 0.10], dtype="Float64"),
+                "bufferModifier": pd.array(["Losses Covered Up To"] * 4, dtype="string"),
+                "capRate": [0.10, 0.20, 0.30, 0.40],
+                "indexUsed": pd.array(["S&P 500", "S&P 500", "S&P 500", None], dtype="string"),
+            }
+        )
+
+        position = pricer.competitive_position(buffer_product, market_data)
+        filtered = pricer.competitive_position(buffer_product, market_data, index_used="S&P 500")
+
+        assert position.total_products == 2
+        assert filtered.total_products == 1
+
+    def test_market_data_not_mutated(self, pricer, buffer_product, market_data):
+        """Competitive position should only read the market data."""
+        before = market_data.copy()
+
+        pricer.competitive_position(buffer_product, market_data)
+
+        pd.testing.assert_frame_equal(market_data, before)
 
 
 class TestEdgeCases:
@@ -598,20 +838,26 @@ class TestGreeksCalculation:
 class TestAntiPatterns:
     """Anti-pattern tests for RILA pricing."""
 
-    def test_buffer_expected_return_bounded(self, pricer, buffer_product):
+    def test_buffer_expected_return_bounded(self, pricer, buffer_product, bs_call, bs_put):
         """[T1] Expected return should be bounded by cap."""
         result = pricer.price(buffer_product, term_years=1.0)
 
-        # Expected return shouldn't exceed cap
-        assert result.expected_return <= buffer_product.cap_rate + 0.01
+        # expected_return is a control-variate estimate, not a sample mean, so
+        # pin it to the closed form (call spread minus OTM put), which is capped
+        closed_form = bs_call(1.0) - bs_call(1.15) - bs_put(0.90)
+        assert result.expected_return == pytest.approx(closed_form, rel=1e-9)
+        assert result.expected_return <= buffer_product.cap_rate
 
-    def test_floor_expected_return_above_floor(self, pricer, floor_product):
+    def test_floor_expected_return_above_floor(self, pricer, floor_product, bs_call, bs_put):
         """[T1] Expected return should be above floor (in expectation)."""
         result = pricer.price(floor_product, term_years=1.0)
 
-        # For normal market conditions, expected return should be above floor
-        # (This is statistical, not guaranteed)
-        assert result.expected_return >= -floor_product.buffer_rate - 0.05  # Some tolerance
+        # expected_return is a control-variate estimate, not a sample mean, so
+        # pin it to the closed form (call spread minus ATM/OTM put spread),
+        # which is floored
+        closed_form = bs_call(1.0) - bs_call(1.15) - (bs_put(1.0) - bs_put(0.90))
+        assert result.expected_return == pytest.approx(closed_form, rel=1e-9)
+        assert result.expected_return >= -floor_product.buffer_rate
 
 
 class TestTermYearsRequirement:
@@ -16,6 +16,25 @@ from annuity_pricing.rate_setting.recommender import (
 )
 
 
+@pytest.fixture(scope="module")
+def recommender() -> RateRecommender:
+    """Default recommender (stateless, shared across the module)."""
+    return RateRecommender()
+
+
+@pytest.fixture(scope="module")
+def market_data() -> pd.DataFrame:
+    """Sample 5-year MYGA market with a known rate distribution (tests must not mutate it)."""
+    return pd.DataFrame(
+        {
+            "fixedRate": [0.040, 0.042, 0.044, 0.046, 0.048, 0.050],
+            "guaranteeDuration": [5, 5, 5, 5, 5, 5],
+            "productGroup": ["MYGA"] * 6,
+            "status": ["current"] * 6,
+        }
+    )
+
+
 class TestRateRecommendation:
     """Test RateRecommendation dataclass."""
 
@@ -104,22 +123,6 @@ class TestRateRecommenderInit:
 class TestRecommendRate:
     """Test RateRecommender.recommend_rate() method."""
 
-    @pytest.fixture
-    def recommender(self) -> RateRecommender:
-        return RateRecommender()
-
-    @pytest.fixture
-    def market_data(self) -> pd.DataFrame:
-        """Create sample market data with known distribution."""
-        return pd.DataFrame(
-            {
-                "fixedRate": [0.040, 0.042, 0.044, 0.046, 0.048, 0.050],
-                "guaranteeDuration": [5, 5, 5, 5, 5, 5],
-                "productGroup": ["MYGA"] * 6,
-                "status": ["current"] * 6,
-            }
-        )
-
     def test_returns_recommendation(
         self, recommender: RateRecommender, market_data: pd.DataFrame
     ) -> None:
@@ -280,25 +283,87 @@ class TestRecommendRate:
         # Small sample reduces confidence
         assert result.confidence in ["low", "medium"]
 
+    def test_comparables_filter(self, recommender: RateRecommender) -> None:
+        """Only current MYGA products within the duration tolerance are comparable."""
+        market = pd.DataFrame(
+            {
+                "fixedRate": [0.040, 0.041, 0.042, 0.043, 0.044, 0.045],
+                "guaranteeDuration": [4, 5, 6, 7, 5, np.nan],
+                "productGroup": ["MYGA", "MYGA", "MYGA", "MYGA", "FIA", "MYGA"],
+                "status": ["current", "historic", "current", "current", "current", "current"],
+            }
+        )
+        before = market.copy()
+
+        comparable = recommender._comparable_mask(market, guarantee_duration=5)
 
-class TestRecommendForSpread:
-    """Test RateRecommender.recommend_for_spread() method."""
+        assert market.loc[comparable, "fixedRate"].tolist() == [0.040, 0.042]
+        pd.testing.assert_frame_equal(market, before)
 
-    @pytest.fixture
-    def recommender(self) -> RateRecommender:
-        return RateRecommender()
+    def test_market_data_not_mutated(
+        self, recommender: RateRecommender, market_data: pd.DataFrame
+    ) -> None:
+        """Recommendations should only read the shared market data."""
+        before = market_data.copy()
+
+        recommender.recommend_rate(
+            guarantee_duration=5, target_percentile=75.0, market_data=market_data
+        )
+        recommender.recommend_for_spread(5, 0.04, 50.0, market_data)
+        recommender.sensitivity_analysis(5, market_data, treasury_rate=0.04)
 
-    @pytest.fixture
-    def market_data(self) -> pd.DataFrame:
-        return pd.DataFrame(
+        pd.testing.assert_frame_equal(market_data, before)
+
+    def test_null_rates_ignored(self, recommender: RateRecommender) -> None:
+        """Null fixedRate values should not count as comparables."""
+        market = pd.DataFrame(
+            {
+                "fixedRate": pd.Series([0.040, None, 0.050], dtype=object),
+                "guaranteeDuration": [5, 5, 5],
+                "productGroup": ["MYGA"] * 3,
+                "status": ["current"] * 3,
+            }
+        )
+
+        result = recommender.recommend_rate(
+            guarantee_duration=5, target_percentile=100.0, market_data=market
+        )
+
+        assert result.recommended_rate == 0.050
+        assert result.comparable_count == 2
+
+    def test_nullable_columns_with_missing_values(self, recommender: RateRecommender) -> None:
+        """pd.NA in nullable string/integer columns should just not match."""
+        market = pd.DataFrame(
             {
                 "fixedRate": [0.040, 0.042, 0.044, 0.046, 0.048, 0.050],
-                "guaranteeDuration": [5, 5, 5, 5, 5, 5],
-                "productGroup": ["MYGA"] * 6,
-                "status": ["current"] * 6,
+                "guaranteeDuration": pd.array([5, 5, 5, None, 5, 5], dtype="Int64"),
+                "productGroup": pd.array(
+                    ["MYGA", None, "MYGA", "MYGA", "MYGA", "MYGA"], dtype="string"
+                ),
+                "status": pd.array(
+                    ["current", "current", None, "current", "current", "current"], dtype="string"
+                ),
             }
         )
 
+        comparable = recommender._comparable_mask(market, guarantee_duration=5)
+        result = recommender.recommend_rate(
+            guarantee_duration=5, target_percentile=100.0, market_data=market
+        )
+        spread = recommender.recommend_for_spread(5, 0.04, 50.0, market)
+        sensitivity = recommender.sensitivity_analysis(5, market, treasury_rate=0.04)
+
+        assert comparable.tolist() == [True, False, False, False, True, True]
+        assert result.recommended_rate == 0.050
+        assert result.comparable_count == 3
+        assert spread.comparable_count == 3
+        assert "error" not in sensitivity.columns
+
+
+class TestRecommendForSpread:
+    """Test RateRecommender.recommend_for_spread() method."""
+
     def test_calculates_rate_from_spread(
         self, recommender: RateRecommender, market_data: pd.DataFrame
     ) -> None:
@@ -326,9 +391,8 @@ class TestRecommendForSpread:
             market_data=market_data,
         )
 
-        # 4.5% is at ~50th percentile in our sample
-        assert result.target_percentile > 0
-        assert result.target_percentile < 100
+        # 4.5% is above 3 of the 6 comparable rates
+        assert result.target_percentile == 50.0
 
     def test_validates_treasury_rate(
         self, recommender: RateRecommender, market_data: pd.DataFrame
@@ -346,10 +410,6 @@ class TestRecommendForSpread:
 class TestAnalyzeMargin:
     """Test RateRecommender.analyze_margin() method."""
 
-    @pytest.fixture
-    def recommender(self) -> RateRecommender:
-        return RateRecommender()
-
     def test_calculates_margin_breakdown(self, recommender: RateRecommender) -> None:
         """Should calculate complete margin breakdown."""
         result = recommender.analyze_margin(
@@ -388,21 +448,6 @@ class TestAnalyzeMargin:
 class TestSensitivityAnalysis:
     """Test RateRecommender.sensitivity_analysis() method."""
 
-    @pytest.fixture
-    def recommender(self) -> RateRecommender:
-        return RateRecommender()
-
-    @pytest.fixture
-    def market_data(self) -> pd.DataFrame:
-        return pd.DataFrame(
-            {
-                "fixedRate": [0.040, 0.042, 0.044, 0.046, 0.048, 0.050],
-                "guaranteeDuration": [5, 5, 5, 5, 5, 5],
-                "productGroup": ["MYGA"] * 6,
-                "status": ["current"] * 6,
-            }
-        )
-
     def test_returns_dataframe(
         self, recommender: RateRecommender, market_data: pd.DataFrame
     ) -> None:
@@ -462,3 +507,88 @@ class TestSensitivityAnalysis:
 
         for i in range(1, len(rates)):
             assert rates[i] >= rates[i - 1], f"Rate should increase with percentile: {rates}"
+
+    def test_matches_recommend_rate(
+        self, recommender: RateRecommender, market_data: pd.DataFrame
+    ) -> None:
+        """Single-pass sweep should match recommend_rate at each percentile."""
+        result = recommender.sensitivity_analysis(
+            guarantee_duration=5,
+            market_data=market_data,
+            treasury_rate=0.04,
+            percentile_range=[0.0, 33.0, 50.0, 100.0],
+        )
+
+        for row in result.itertuples(index=False):
+            rec = recommender.recommend_rate(
+                guarantee_duration=5,
+                target_percentile=row.percentile,
+                market_data=market_data,
+                treasury_rate=0.04,
+            )
+            assert row.rate == rec.recommended_rate
+            assert row.spread_bps == pytest.approx(rec.spread_over_treasury)
+            assert row.margin_bps == pytest.approx(rec.margin_estimate)
+            assert row.comparable_count == rec.comparable_count
+
+    def test_out_of_range_percentile_recorded(
+        self, recommender: RateRecommender, market_data: pd.DataFrame
+    ) -> None:
+        """Invalid percentiles should be reported without dropping valid ones."""
+        result = recommender.sensitivity_analysis(
+            guarantee_duration=5,
+            market_data=market_data,
+            treasury_rate=0.04,
+            percentile_range=[50.0, 150.0],
+        )
+
+        assert result["rate"].notna().tolist() == [True, False]
+        assert "target_percentile must be 0-100" in result["error"].iloc[1]
+
+    def test_no_comparables_recorded_per_percentile(
+        self, recommender: RateRecommender, market_data: pd.DataFrame
+    ) -> None:
+        """Missing comparables should produce an error row for every percentile."""
+        result = recommender.sensitivity_analysis(
+            guarantee_duration=20,
+            market_data=market_data,
+            treasury_rate=0.04,
+        )
+
+        assert len(result) == 4
+        assert result["rate"].isna().all()
+        assert result["error"].str.contains("No comparable MYGA products").all()
+
+    @pytest.mark.parametrize(
+        "guarantee_duration,percentile,rates",
+        [
+            (5, 150.0, [0.040, 0.045]),  # percentile out of range
+            (20, 50.0, [0.040, 0.045]),  # no comparables
+            (0, 50.0, [0.040, 0.045]),  # invalid duration
+            (5, 10.0, [-0.010, 0.045]),  # negative rate at target
+        ],
+    )
+    def test_errors_match_recommend_rate(
+        self,
+        recommender: RateRecommender,
+        guarantee_duration: int,
+        percentile: float,
+        rates: list[float],
+    ) -> None:
+        """A failed sweep row should carry the message recommend_rate raises."""
+        data = pd.DataFrame({"fixedRate": rates, "guaranteeDuration": [5] * len(rates)})
+
+        with pytest.raises(ValueError) as excinfo:
+            recommender.recommend_rate(
+                guarantee_duration=guarantee_duration,
+                target_percentile=percentile,
+                market_data=data,
+            )
+        result = recommender.sensitivity_analysis(
+            guarantee_duration=guarantee_duration,
+            market_data=data,
+            treasury_rate=0.04,
+            percentile_range=[percentile],
+        )
+
+        assert result["error"].iloc[0] == str(excinfo.value)
@@ -12,11 +12,15 @@ import numpy as np
 import pytest
 
 from annuity_pricing.loaders.yield_curve import YieldCurveLoader
+from annuity_pricing.regulatory import scenarios as scenarios_module
 from annuity_pricing.regulatory.scenarios import (
+    NUMBA_AVAILABLE,
+    AG43Scenarios,
     EconomicScenario,
     EquityParams,
     RiskNeutralEquityParams,
     ScenarioGenerator,
+    ScenarioStatistics,
     VasicekParams,
     calculate_scenario_statistics,
     generate_deterministic_scenarios,
@@ -45,6 +49,18 @@ class TestEconomicScenario:
         with pytest.raises(ValueError, match="must match"):
             EconomicScenario(rates=rates, equity_returns=equity, scenario_id=0)
 
+    def test_unchecked_matches_validated(self) -> None:
+        """Unchecked construction should equal the validated constructor."""
+        rates = np.array([0.04, 0.05, 0.06])
+        equity = np.array([0.10, -0.05, 0.15])
+
+        checked = EconomicScenario(rates=rates, equity_returns=equity, scenario_id=3)
+        unchecked = EconomicScenario._unchecked(rates, equity, 3)
+
+        assert unchecked.rates is checked.rates
+        assert unchecked.equity_returns is checked.equity_returns
+        assert unchecked.scenario_id == checked.scenario_id
+
 
 class TestVasicekParams:
     """Tests for VasicekParams dataclass."""
@@ -140,6 +156,46 @@ class TestRateScenarios:
         terminal_mean = np.mean(rates[:, -1])
         assert abs(terminal_mean - params.theta) < 0.02
 
+    @pytest.mark.parametrize(
+        "use_numba",
+        [
+            False,
+            pytest.param(
+                True,
+                marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed"),
+            ),
+        ],
+    )
+    def test_vectorized_paths_match_stepwise_recursion(
+        self, use_numba: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Filtered and compiled paths should match the floored Euler recursion."""
+        monkeypatch.setattr(scenarios_module, "NUMBA_AVAILABLE", use_numba)
+        gen = ScenarioGenerator(n_scenarios=500, projection_years=30, seed=42)
+        params = VasicekParams(kappa=0.10, theta=0.02, sigma=0.02)  # Floor binds often
+        shocks = np.random.default_rng(7).standard_normal((500, 30))
+
+        rates = gen._generate_vasicek_paths(0.01, params, shocks)
+        expected = gen._step_vasicek_paths(0.01, params, shocks)
+
+        assert np.any(expected == 0.0)
+        np.testing.assert_allclose(rates, expected, rtol=0, atol=1e-14)
+
+    def test_stepwise_paths_match_reference_loop(self) -> None:
+        """Buffered step loop should reproduce the textbook floored recursion."""
+        gen = ScenarioGenerator(n_scenarios=200, projection_years=20, seed=42)
+        params = VasicekParams(kappa=0.10, theta=0.02, sigma=0.02)
+        shocks = np.random.default_rng(11).standard_normal((200, 20))
+
+        expected = np.empty_like(shocks)
+        r = np.full(200, 0.01)
+        for t in range(20):
+            r = np.maximum(r + params.kappa * (params.theta - r) + params.sigma * shocks[:, t], 0.0)
+            expected[:, t] = r
+
+        rates = gen._step_vasicek_paths(0.01, params, shocks)
+        np.testing.assert_allclose(rates, expected, rtol=0, atol=1e-15)
+
     def test_negative_initial_rate_raises(self, generator: ScenarioGenerator) -> None:
         """Negative initial rate should raise error."""
         with pytest.raises(ValueError, match="negative"):
@@ -176,6 +232,138 @@ class TestEquityScenarios:
             generator.generate_equity_scenarios(sigma=-0.10)
 
 
+class TestShockBuffer:
+    """Tests for the reusable shock buffer."""
+
+    def test_outputs_survive_later_draws(self) -> None:
+        """Returned paths must not alias the buffer that later draws overwrite."""
+        gen = ScenarioGenerator(n_scenarios=50, projection_years=10, seed=42)
+
+        rates = gen.generate_rate_scenarios()
+        snapshot = rates.copy()
+        gen.generate_equity_scenarios()
+        gen.generate_ag43_scenarios()
+
+        np.testing.assert_array_equal(rates, snapshot)
+
+
+class TestAntitheticShocks:
+    """Tests for antithetic variate shock generation."""
+
+    @pytest.mark.parametrize("n_scenarios", [100, 101])
+    def test_shocks_are_mirrored(self, n_scenarios: int) -> None:
+        """Second half of the shocks should negate the first half."""
+        gen = ScenarioGenerator(
+            n_scenarios=n_scenarios, projection_years=10, seed=42, antithetic=True
+        )
+        half = (n_scenarios + 1) // 2
+
+        rate_shocks, equity_shocks = gen._generate_correlated_shocks(-0.20)
+
+        np.testing.assert_array_equal(rate_shocks[half:], -rate_shocks[: n_scenarios - half])
+        np.testing.assert_allclose(
+            equity_shocks[half:], -equity_shocks[: n_scenarios - half], atol=1e-15
+        )
+
+    def test_antithetic_equity_mean_exact_drift(self) -> None:
+        """Antithetic log returns should average to the drift exactly."""
+        gen = ScenarioGenerator(n_scenarios=200, projection_years=10, seed=42, antithetic=True)
+        returns = gen.generate_equity_scenarios(mu=0.07, sigma=0.18)
+
+        log_mean = np.mean(np.log1p(returns))
+        assert log_mean == pytest.approx(0.07 - 0.5 * 0.18**2, abs=1e-12)
+
+    def test_default_is_not_antithetic(self) -> None:
+        """Antithetic sampling is opt-in so seeded streams are unchanged."""
+        assert ScenarioGenerator(seed=42).antithetic is False
+
+
+class TestPathDtype:
+    """Tests for the optional float32 path dtype."""
+
+    def test_default_is_float64(self) -> None:
+        """Default generator should keep float64 paths."""
+        scenarios = ScenarioGenerator(
+            n_scenarios=50, projection_years=5, seed=42
+        ).generate_ag43_scenarios()
+
+        assert scenarios.get_rate_matrix().dtype == np.float64
+        assert scenarios.get_equity_matrix().dtype == np.float64
+
+    @pytest.mark.parametrize(
+        "use_numba",
+        [
+            False,
+            pytest.param(
+                True,
+                marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed"),
+            ),
+        ],
+    )
+    def test_float32_paths(self, monkeypatch: pytest.MonkeyPatch, use_numba: bool) -> None:
+        """float32 generators should produce float32 paths with matching statistics."""
+        monkeypatch.setattr(scenarios_module, "NUMBA_AVAILABLE", use_numba)
+        gen = ScenarioGenerator(n_scenarios=2000, projection_years=10, seed=42, dtype=np.float32)
+        scenarios = gen.generate_ag43_scenarios()
+
+        assert scenarios.get_rate_matrix().dtype == np.float32
+        assert scenarios.get_equity_matrix().dtype == np.float32
+        assert np.all(scenarios.get_rate_matrix() >= 0)
+
+        stats = calculate_scenario_statistics(scenarios)
+        assert stats.rate_mean == pytest.approx(0.04, abs=0.005)
+        assert stats.equity_return_mean == pytest.approx(0.07, abs=0.02)
+
+    def test_rejects_non_float_dtype(self) -> None:
+        """Integer and extended-precision dtypes should be rejected."""
+        with pytest.raises(ValueError, match="dtype"):
+            ScenarioGenerator(dtype=np.int64)
+
+
+class TestChunkedGeneration:
+    """Tests for block-by-block scenario generation."""
+
+    def test_first_chunk_matches_unchunked_generator(self) -> None:
+        """Each block draws its own shocks, so block 0 equals a chunk-sized run."""
+        chunked = ScenarioGenerator(
+            n_scenarios=250, projection_years=10, seed=42, chunk_size=100
+        ).generate_ag43_scenarios()
+        small = ScenarioGenerator(
+            n_scenarios=100, projection_years=10, seed=42
+        ).generate_ag43_scenarios()
+
+        assert chunked.get_rate_matrix().shape == (250, 10)
+        np.testing.assert_array_equal(chunked.get_rate_matrix()[:100], small.get_rate_matrix())
+        np.testing.assert_array_equal(chunked.get_equity_matrix()[:100], small.get_equity_matrix())
+
+    def test_chunk_covering_all_scenarios_is_unchanged(self) -> None:
+        """A chunk at least n_scenarios long should reproduce the default stream."""
+        default = ScenarioGenerator(n_scenarios=100, projection_years=10, seed=42)
+        chunked = ScenarioGenerator(n_scenarios=100, projection_years=10, seed=42, chunk_size=500)
+
+        np.testing.assert_array_equal(
+            default.generate_risk_neutral_scenarios().get_rate_matrix(),
+            chunked.generate_risk_neutral_scenarios().get_rate_matrix(),
+        )
+
+    def test_chunked_antithetic_pairs_within_block(self) -> None:
+        """Antithetic pairs should be formed inside each block, including the tail."""
+        gen = ScenarioGenerator(
+            n_scenarios=7, projection_years=4, seed=1, antithetic=True, chunk_size=4
+        )
+        params = EquityParams(mu=0.0, sigma=0.2)
+        equity = gen.generate_ag43_scenarios(equity_params=params, correlation=0.0)
+        log_returns = np.log1p(equity.get_equity_matrix()) + 0.5 * 0.2**2
+
+        np.testing.assert_allclose(log_returns[2:4], -log_returns[0:2], atol=1e-12)
+        np.testing.assert_allclose(log_returns[6:7], -log_returns[4:5], atol=1e-12)
+
+    def test_invalid_chunk_size_raises(self) -> None:
+        """Non-positive chunk sizes should be rejected."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            ScenarioGenerator(chunk_size=0)
+
+
 class TestAG43Scenarios:
     """Tests for AG43 scenario generation."""
 
@@ -213,6 +401,29 @@ class TestAG43Scenarios:
 
         assert equity_matrix.shape == (100, 10)
 
+    def test_ag43_scenarios_are_row_views(self, generator: ScenarioGenerator) -> None:
+        """Indexed scenarios should view the stored matrices without copying."""
+        scenarios = generator.generate_ag43_scenarios()
+        last = scenarios[-1]
+
+        assert last.scenario_id == 99
+        assert np.shares_memory(last.rates, scenarios.get_rate_matrix())
+        assert np.shares_memory(last.equity_returns, scenarios.get_equity_matrix())
+        np.testing.assert_array_equal(last.rates, scenarios.get_rate_matrix()[99])
+
+    def test_ag43_views_and_matrices_cached(self, generator: ScenarioGenerator) -> None:
+        """Repeated access should not rebuild matrices or scenario views."""
+        scenarios = generator.generate_ag43_scenarios()
+
+        assert scenarios.get_rate_matrix() is scenarios.get_rate_matrix()
+        assert scenarios.get_equity_matrix() is scenarios.get_equity_matrix()
+        assert scenarios.scenarios is scenarios.scenarios
+
+    def test_ag43_mismatched_matrices_raise(self) -> None:
+        """Rate and equity matrices must have the same 2D shape."""
+        with pytest.raises(ValueError, match="must match"):
+            AG43Scenarios(rates_matrix=np.zeros((3, 5)), equity_matrix=np.zeros((3, 4)))
+
     def test_invalid_correlation_raises(self, generator: ScenarioGenerator) -> None:
         """Correlation outside [-1, 1] should raise error."""
         with pytest.raises(ValueError, match="Correlation"):
@@ -259,6 +470,27 @@ class TestCorrelation:
         avg_corr = np.mean(correlations)
         assert abs(avg_corr) < 0.1
 
+    @pytest.mark.parametrize("correlation", [-1.0, -0.5, 0.0, 0.3, 1.0])
+    def test_shocks_follow_cholesky_factor(self, correlation: float) -> None:
+        """Shocks should equal L @ [z1, z2] for the closed-form factor."""
+        gen = ScenarioGenerator(n_scenarios=200, projection_years=5, seed=42)
+        rate_shocks, equity_shocks = gen._generate_correlated_shocks(correlation)
+
+        z = np.random.default_rng(42).standard_normal((2, 200, 5))
+        np.testing.assert_array_equal(rate_shocks, z[0])
+        np.testing.assert_allclose(
+            equity_shocks,
+            correlation * z[0] + np.sqrt(1 - correlation**2) * z[1],
+            atol=1e-14,
+        )
+
+    @pytest.mark.parametrize("correlation", [-1.5, 1.0000001, float("nan")])
+    def test_shocks_reject_out_of_range_correlation(self, correlation: float) -> None:
+        """The shared Cholesky factor should reject |rho| > 1 with a clear message."""
+        gen = ScenarioGenerator(n_scenarios=10, projection_years=5, seed=42)
+        with pytest.raises(ValueError, match=r"Correlation must be in \[-1, 1\]"):
+            gen._generate_correlated_shocks(correlation)
+
 
 class TestDeterministicScenarios:
     """Tests for deterministic scenario generation."""
@@ -299,6 +531,24 @@ class TestDeterministicScenarios:
         down = scenarios[2]
         assert np.all(down.rates == 0.02)  # -2%
 
+    def test_returns_structure_of_arrays(self) -> None:
+        """Scenarios should be stored as [3, n_years] rate and equity matrices."""
+        scenarios = generate_deterministic_scenarios(n_years=10, base_rate=0.04, base_equity=0.07)
+
+        assert isinstance(scenarios, AG43Scenarios)
+        assert scenarios.get_rate_matrix().shape == (3, 10)
+        np.testing.assert_allclose(scenarios.get_equity_matrix()[:, 0], [0.07, 0.05, 0.09])
+        assert [s.scenario_id for s in scenarios] == [0, 1, 2]
+
+    def test_paths_are_read_only_views(self) -> None:
+        """Constant paths should be zero-stride, write-protected views."""
+        base = generate_deterministic_scenarios(n_years=10)[0]
+
+        assert base.rates.strides == (0,)
+        assert not base.rates.flags.writeable
+        with pytest.raises(ValueError):
+            base.rates[0] = 0.10
+
 
 class TestScenarioStatistics:
     """Tests for scenario statistics calculation."""
@@ -318,7 +568,18 @@ class TestScenarioStatistics:
             "projection_years",
         ]
         for key in expected_keys:
-            assert key in stats
+            assert key in stats.to_dict()
+
+    def test_statistics_are_frozen(self) -> None:
+        """Statistics should be an immutable attribute container."""
+        gen = ScenarioGenerator(n_scenarios=50, projection_years=5, seed=42)
+        stats = calculate_scenario_statistics(gen.generate_ag43_scenarios())
+
+        assert isinstance(stats, ScenarioStatistics)
+        assert stats.to_dict()["rate_mean"] == stats.rate_mean
+        assert isinstance(stats.rate_max, float)
+        with pytest.raises(AttributeError):
+            stats.rate_mean = 0.0  # type: ignore[misc]
 
     def test_statistics_values_reasonable(self) -> None:
         """Statistics should have reasonable values."""
@@ -327,14 +588,71 @@ class TestScenarioStatistics:
         stats = calculate_scenario_statistics(scenarios)
 
         # Rate mean should be near theta (0.04)
-        assert 0.02 < stats["rate_mean"] < 0.08
+        assert 0.02 < stats.rate_mean < 0.08
 
         # Equity return mean should be positive
-        assert stats["equity_return_mean"] > 0
+        assert stats.equity_return_mean > 0
 
         # Counts should match
-        assert stats["n_scenarios"] == 1000
-        assert stats["projection_years"] == 30
+        assert stats.n_scenarios == 1000
+        assert stats.projection_years == 30
+
+    def test_statistics_match_direct_numpy(self) -> None:
+        """Scenario statistics should match direct NumPy reductions."""
+        gen = ScenarioGenerator(n_scenarios=500, projection_years=20, seed=42)
+        scenarios = gen.generate_ag43_scenarios()
+        stats = calculate_scenario_statistics(scenarios)
+
+        rate_matrix = scenarios.get_rate_matrix()
+        equity_matrix = scenarios.get_equity_matrix()
+        cumulative = np.prod(1 + equity_matrix, axis=1) - 1
+
+        assert stats.rate_mean == pytest.approx(np.mean(rate_matrix), rel=1e-12)
+        assert stats.rate_std == pytest.approx(np.std(rate_matrix), rel=1e-9)
+        assert stats.equity_return_std == pytest.approx(np.std(equity_matrix), rel=1e-9)
+        assert stats.cumulative_return_mean == pytest.approx(np.mean(cumulative), rel=1e-9)
+        assert stats.terminal_rate_5pct == np.percentile(rate_matrix[:, -1], 5)
+        assert stats.terminal_rate_95pct == np.percentile(rate_matrix[:, -1], 95)
+        assert stats.cumulative_return_95pct == pytest.approx(
+            np.percentile(cumulative, 95), rel=1e-9
+        )
+
+    def test_std_stable_for_clustered_values(self) -> None:
+        """Std should not cancel when values cluster tightly around a large mean."""
+        rng = np.random.default_rng(0)
+        rates = 1e4 + 1e-4 * rng.standard_normal((200, 10))
+        equity = rng.standard_normal((200, 10)).astype(np.float32)
+        stats = calculate_scenario_statistics(
+            AG43Scenarios(rates_matrix=rates, equity_matrix=equity)
+        )
+
+        assert stats.rate_std == pytest.approx(np.std(rates), rel=1e-6)
+        assert stats.equity_return_std == pytest.approx(np.std(equity, dtype=np.float64), rel=1e-12)
+
+    @pytest.mark.parametrize(
+        "use_numba",
+        [
+            False,
+            pytest.param(
+                True,
+                marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed"),
+            ),
+        ],
+    )
+    def test_cumulative_returns_match_product(
+        self, monkeypatch: pytest.MonkeyPatch, use_numba: bool
+    ) -> None:
+        """Log-space compounding should match prod(1 + r) - 1 on both paths."""
+        monkeypatch.setattr(scenarios_module, "NUMBA_AVAILABLE", use_numba)
+        gen = ScenarioGenerator(n_scenarios=200, projection_years=15, seed=7)
+        equity_matrix = gen.generate_ag43_scenarios().get_equity_matrix()
+
+        np.testing.assert_allclose(
+            scenarios_module._cumulative_returns(equity_matrix),
+            np.prod(1 + equity_matrix, axis=1) - 1,
+            rtol=1e-10,
+            atol=1e-12,
+        )
 
 
 class TestReproducibility:
@@ -73,6 +73,17 @@ class TestEuropeanPricing:
 
         assert result.confidence_interval[0] < result.price < result.confidence_interval[1]
 
+    def test_standard_error_matches_sample_std(self, standard_params):
+        """Standard error should be the discounted sample std / sqrt(n)."""
+        engine = MonteCarloEngine(n_paths=10000, seed=42)
+        result = engine.price_european_call(standard_params, strike=100)
+
+        expected = (
+            result.discount_factor * result.payoffs.std(ddof=1) / np.sqrt(len(result.payoffs))
+        )
+        assert result.standard_error == pytest.approx(expected, rel=1e-12)
+        assert result.price == pytest.approx(result.discount_factor * result.payoffs.mean())
+
     def test_invalid_strike(self, standard_params):
         """Strike must be positive."""
         engine = MonteCarloEngine(n_paths=1000)